@@ -0,0 +1,174 @@
+"""
+Outils de mesure communs aux benchmarks.
+
+Un benchmark est décrit par un Case : prepare() construit un état neuf
+(non chronométré), run(state) exécute ops opérations sur cet état. Si run
+retourne un couple (secondes, opérations), il remplace la durée mesurée et
+le nombre d'opérations : cela permet d'exclure du chronométrage le travail
+annexe (appliquer le tir d'une IA dont seul get_move est mesuré) et de
+compter des opérations en nombre variable.
+"""
+import gc
+import json
+import math
+import statistics
+import time
+
+
+class Case:
+    """
+    Description d'un benchmark.
+
+    Attributes:
+        name (str): Identifiant stable, utilisé pour la comparaison à la référence
+        prepare (callable): Construit l'état d'une exécution, hors chronométrage
+        run (callable): Exécute les opérations mesurées sur l'état
+        ops (int): Nombre d'opérations effectuées par run (si run ne le retourne pas)
+        repeat (int): Nombre d'exécutions chronométrées
+    """
+
+    def __init__(self, name, prepare, run, ops=1, repeat=50):
+        """
+        Décrit un benchmark.
+
+        Args:
+            name (str): Identifiant du benchmark
+            prepare (callable): Construit l'état d'une exécution
+            run (callable): Exécute les opérations mesurées
+            ops (int): Nombre d'opérations par exécution
+            repeat (int): Nombre d'exécutions chronométrées
+        """
+        self.name = name
+        self.prepare = prepare
+        self.run = run
+        self.ops = ops
+        self.repeat = repeat
+
+
+def percentile(values, fraction):
+    """
+    Percentile par rang le plus proche d'une liste triée.
+
+    Args:
+        values (list): Valeurs triées par ordre croissant
+        fraction (float): Rang recherché, entre 0 et 1
+
+    Returns:
+        float: La valeur du percentile
+    """
+    if not values:
+        return None
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[rank - 1]
+
+
+def measure(case, rounds=1):
+    """
+    Exécute un benchmark et calcule débit et latences.
+
+    La latence d'une opération est la durée d'une exécution divisée par
+    son nombre d'opérations ; les percentiles portent sur les exécutions.
+    Le ramasse-miettes est désactivé pendant les mesures.
+
+    Avec plusieurs séries de case.repeat exécutions, min_us est la médiane
+    des meilleures latences de chaque série : une seule série chanceuse
+    (ou perturbée) ne fixe plus la référence ni le verdict.
+
+    Args:
+        case (Case): Le benchmark à exécuter
+        rounds (int): Nombre de séries d'exécutions
+
+    Returns:
+        dict: ops_per_sec, min_us, p50_us, p90_us, p99_us, runs et ops
+    """
+    durations = []
+    counts = []
+    round_minimums = []
+    gc_enabled = gc.isenabled()
+    try:
+        for run in range(case.repeat * rounds):
+            state = case.prepare()
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            measured = case.run(state)
+            elapsed = time.perf_counter() - start
+            if gc_enabled:
+                gc.enable()
+            if isinstance(measured, tuple):
+                elapsed, ops = measured
+            else:
+                ops = case.ops
+            durations.append(elapsed)
+            counts.append(ops)
+            if ops:
+                latency = elapsed / ops * 1e6
+                if len(round_minimums) <= run // case.repeat:
+                    round_minimums.append(latency)
+                else:
+                    round_minimums[-1] = min(round_minimums[-1], latency)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    total_ops = sum(counts)
+    total_time = sum(durations)
+    latencies = sorted(duration / ops * 1e6 for duration, ops in zip(durations, counts) if ops)
+    return {
+        'ops_per_sec': round(total_ops / total_time, 1) if total_time > 0 else None,
+        'min_us': round(statistics.median(round_minimums), 3),
+        'p50_us': round(percentile(latencies, 0.5), 3),
+        'p90_us': round(percentile(latencies, 0.9), 3),
+        'p99_us': round(percentile(latencies, 0.99), 3),
+        'runs': len(durations),
+        'ops': total_ops
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare des résultats à une référence.
+
+    La comparaison porte sur la meilleure latence par opération (min_us,
+    médiane des meilleures latences de plusieurs séries si measure en a
+    fait plusieurs) : comme pour timeit, c'est la mesure la moins perturbée
+    par le reste du système, bien plus stable d'une exécution à l'autre que
+    le débit moyen.
+
+    Args:
+        results (dict): Résultats par benchmark (voir measure)
+        baseline (dict): Résultats de référence, au même format
+        tolerance (float): Ralentissement toléré (0.25 = 25 %)
+
+    Returns:
+        dict: Pour chaque benchmark commun, rapport de vitesse (supérieur à
+            1 si plus rapide que la référence) et statut ('ok', 'faster' ou
+            'regression')
+    """
+    report = {}
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference.get('min_us') or not result.get('min_us'):
+            continue
+        ratio = reference['min_us'] / result['min_us']
+        if ratio < 1 / (1 + tolerance):
+            status = 'regression'
+        elif ratio > 1 + tolerance:
+            status = 'faster'
+        else:
+            status = 'ok'
+        report[name] = {'ratio': round(ratio, 3), 'status': status}
+    return report
+
+
+def load_results(path):
+    """Charge un fichier de résultats produit par save_results."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['results']
+
+
+def save_results(path, results, metadata):
+    """Enregistre des résultats (et leur contexte) au format JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'metadata': metadata, 'results': results}, f, indent=2, sort_keys=True)
+        f.write("\n")
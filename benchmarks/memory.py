@@ -0,0 +1,110 @@
+"""
+Budget mémoire des objets du moteur de jeu.
+
+Exemple (depuis la racine du dépôt) :
+    python -m benchmarks.memory
+
+Chaque mesure alloue COUNT objets identiques et divise la mémoire allouée
+(tracemalloc) par COUNT. Le code de retour vaut 1 si un objet dépasse son
+plafond d'octets : un serveur ou un tournoi garde des centaines de
+milliers de plateaux en mémoire, et une régression de quelques centaines
+d'octets par plateau s'y chiffre en centaines de mégaoctets.
+"""
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+
+from src.game.board import Board
+from src.game.placement import FleetPlacer
+from src.game.rules import DEFAULT_RULES
+from src.game.ship import Ship
+
+COUNT = 2000
+
+# Plafonds en octets par objet (Python 3.11, 64 bits), avec une marge sur la mesure
+BUDGETS = {
+    'ship': 80,
+    'board.empty': 500,
+    'board.placed': 1350,
+    'board.midgame': 1500,
+    'board.clone': 720,
+}
+
+
+def bytes_per_object(build, count=COUNT):
+    """
+    Mémoire allouée par objet, en octets.
+
+    Args:
+        build (callable): Construit un objet ; le résultat est conservé
+            jusqu'à la fin de la mesure
+        count (int): Nombre d'objets construits
+
+    Returns:
+        float: Octets alloués par objet
+    """
+    keep = []
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(count):
+            keep.append(build())
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count
+
+
+def measurements():
+    """Mesure chaque objet de BUDGETS."""
+    positions = FleetPlacer(DEFAULT_RULES).generate(random.Random(1))
+    cells = [(x, y) for y in range(DEFAULT_RULES.board_size) for x in range(DEFAULT_RULES.board_size)]
+    random.Random(2).shuffle(cells)
+
+    def placed():
+        board = Board(DEFAULT_RULES)
+        for ship, (x, y, horizontal) in zip(DEFAULT_RULES.create_fleet(), positions):
+            board.place_ship(ship, x, y, horizontal)
+        return board
+
+    def midgame():
+        board = placed()
+        for x, y in cells[:50]:
+            board.receive_shot(x, y)
+        return board
+
+    reference = midgame()
+    # Placer une première fois : index de segments en cache hors mesure
+    placed()
+    return {
+        'ship': bytes_per_object(lambda: Ship("Porte-avions", 5)),
+        'board.empty': bytes_per_object(lambda: Board(DEFAULT_RULES)),
+        'board.placed': bytes_per_object(placed),
+        'board.midgame': bytes_per_object(midgame),
+        'board.clone': bytes_per_object(reference.clone),
+    }
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Budget mémoire des plateaux et navires")
+    parser.parse_args(argv)
+
+    results = measurements()
+    report = {}
+    for name, value in results.items():
+        budget = BUDGETS[name]
+        report[name] = {'bytes': round(value, 1), 'budget': budget, 'ok': value <= budget}
+    json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    print()
+    over = [name for name, entry in report.items() if not entry['ok']]
+    if over:
+        print("Budget dépassé : " + ", ".join(over), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
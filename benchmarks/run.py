@@ -0,0 +1,345 @@
+"""
+Benchmarks du moteur de jeu, des IA et des statistiques.
+
+Exemples (depuis la racine du dépôt) :
+    python -m benchmarks.run                         # tout, comparé à benchmarks/baseline.json
+    python -m benchmarks.run --filter board. --quick
+    python -m benchmarks.run --save-baseline         # remplace la référence
+
+La référence dépend de la machine : elle doit être régénérée sur la
+machine qui sert aux comparaisons.
+
+Les entrées sont tirées de générateurs à graine fixe : deux exécutions
+mesurent exactement le même travail. Le code de retour vaut 1 si la
+meilleure latence d'un benchmark dépasse celle de la référence au-delà
+de la tolérance. Un benchmark en régression est d'abord remesuré après
+la passe complète (--retries fois, en plusieurs séries dont on garde la
+médiane des minimums) : seule une régression confirmée par chaque mesure
+est signalée. La référence est elle aussi la médiane de plusieurs séries.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from src.game.ai_player import AIPlayer
+from src.game.board import Board
+from src.game.game_stats import GameStats
+from src.game.match import play_ai_match
+from src.game.placement import FleetPlacer
+from src.game.rules import DEFAULT_RULES
+from src.game.stats_db import SQLiteGameStats
+
+from .harness import Case, compare, load_results, measure, save_results
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+STATS_SIZES = (10_000, 100_000, 1_000_000)
+
+# Séries de mesures de la référence et des benchmarks remesurés (médiane des minimums)
+BASELINE_ROUNDS = 3
+
+
+def fleet_positions(seed):
+    """Placement de la flotte réglementaire tiré avec une graine fixe."""
+    return FleetPlacer(DEFAULT_RULES).generate(random.Random(seed))
+
+
+def placed_board(positions):
+    """Plateau réglementaire dont la flotte est placée aux positions données."""
+    board = Board(DEFAULT_RULES)
+    for ship, (x, y, horizontal) in zip(DEFAULT_RULES.create_fleet(), positions):
+        board.place_ship(ship, x, y, horizontal)
+    return board
+
+
+def board_cases():
+    """Benchmarks des opérations élémentaires de Board."""
+    size = DEFAULT_RULES.board_size
+    positions = fleet_positions(1)
+    cells = [(x, y) for y in range(size) for x in range(size)]
+    random.Random(2).shuffle(cells)
+
+    def place_all(state):
+        board, ships = state
+        for ship, (x, y, horizontal) in zip(ships, positions):
+            board.place_ship(ship, x, y, horizontal)
+
+    def shoot_all(board):
+        for x, y in cells:
+            board.receive_shot(x, y)
+
+    def check_all(board):
+        for x, y in cells:
+            board.check_sunk_ship(x, y)
+
+    def all_sunk(board):
+        for _ in range(1000):
+            board.all_ships_sunk()
+
+    def shot_board():
+        board = placed_board(positions)
+        shoot_all(board)
+        return board
+
+    def half_shot_board():
+        board = placed_board(positions)
+        for x, y in cells[:len(cells) // 2]:
+            board.receive_shot(x, y)
+        return board
+
+    def clone_all(board):
+        for _ in range(1000):
+            board.clone()
+
+    def try_shots(board):
+        # Tir hypothétique puis annulation, comme dans une recherche
+        for x, y in cells[len(cells) // 2:]:
+            board.receive_shot(x, y)
+            board.undo_shot()
+
+    def snapshot_restore(board):
+        snapshot = board.snapshot()
+        for x, y in cells[len(cells) // 2:]:
+            board.receive_shot(x, y)
+        board.restore(snapshot)
+
+    return [
+        Case("board.place_ship", lambda: (Board(DEFAULT_RULES), DEFAULT_RULES.create_fleet()),
+             place_all, ops=len(positions), repeat=2000),
+        Case("board.receive_shot", lambda: placed_board(positions), shoot_all, ops=len(cells), repeat=500),
+        Case("board.check_sunk_ship", shot_board, check_all, ops=len(cells), repeat=500),
+        Case("board.all_ships_sunk", lambda: placed_board(positions), all_sunk, ops=1000, repeat=500),
+        Case("board.clone", half_shot_board, clone_all, ops=1000, repeat=200),
+        Case("board.shot_undo", half_shot_board, try_shots, ops=len(cells) - len(cells) // 2, repeat=500),
+        Case("board.snapshot_restore", half_shot_board, snapshot_restore, ops=1, repeat=500),
+    ]
+
+
+def ai_cases():
+    """
+    Benchmarks de AIPlayer.get_move : une exécution est une partie complète
+    contre une flotte fixe, seul get_move étant chronométré.
+    """
+    positions = fleet_positions(3)
+    cases = []
+    for difficulty in AIPlayer.DIFFICULTIES:
+        def prepare(difficulty=difficulty):
+            # Budget réduit pour 'expert' : on mesure le débit, pas la force de jeu
+            ai = AIPlayer(difficulty, DEFAULT_RULES, time_budget_ms=5, rng=random.Random(4))
+            return ai, placed_board(positions)
+
+        def play(state):
+            ai, board = state
+            thinking = 0.0
+            moves = 0
+            while not board.all_ships_sunk():
+                start = time.perf_counter()
+                x, y = ai.get_move(board)
+                thinking += time.perf_counter() - start
+                moves += 1
+                result = board.receive_shot(x, y)
+                if result is not None:
+                    ai.notify_hit(x, y, result)
+                    sunk = board.check_sunk_ship(x, y) if result else None
+                    if sunk:
+                        ai.notify_sunk(sunk)
+            return thinking, moves
+
+        cases.append(Case(f"ai.get_move.{difficulty}", prepare, play,
+                          repeat=5 if difficulty == "expert" else 50))
+    return cases
+
+
+def game_cases():
+    """Benchmarks de parties complètes IA contre IA, sans interface."""
+    cases = []
+    for first, second in (("facile", "facile"), ("moyen", "moyen"), ("difficile", "difficile")):
+        counter = iter(range(10 ** 9))
+        cases.append(Case(
+            f"game.headless.{first}_vs_{second}",
+            lambda counter=counter: f"bench:{next(counter)}",
+            lambda seed, first=first, second=second: play_ai_match(first, second, DEFAULT_RULES, seed),
+            ops=1,
+            repeat=100
+        ))
+    return cases
+
+
+def write_stats_file(path, count):
+    """Écrit un historique synthétique de count parties."""
+    rng = random.Random(count)
+    difficulties = AIPlayer.DIFFICULTIES
+    start = datetime(2025, 1, 15, 12)
+    with open(path, 'w') as f:
+        for index in range(count):
+            hits = rng.randint(17, 40)
+            shots = hits + rng.randint(0, 60)
+            f.write(json.dumps({
+                'difficulty': difficulties[index % len(difficulties)],
+                'duration': rng.randint(30, 900),
+                'result': 'victory' if rng.random() < 0.5 else 'defeat',
+                'player_shots': shots,
+                'ai_shots': shots,
+                'player_hits': hits,
+                'ai_hits': hits,
+                'player_accuracy': round(hits / shots * 100, 2),
+                'ai_accuracy': round(hits / shots * 100, 2),
+                'date': (start + timedelta(minutes=index)).strftime("%Y-%m-%d %H:%M:%S")
+            }) + "\n")
+
+
+STATS_KINDS = ("load", "summary_rebuild", "summary", "recent_games", "save", "compact",
+               "sqlite_summary", "sqlite_recent_games", "sqlite_query", "sqlite_save")
+
+
+def stats_cases(directory, sizes):
+    """Benchmarks de GameStats et SQLiteGameStats sur des historiques de différentes tailles."""
+    sample = {'difficulty': 'moyen', 'duration': 120, 'result': 'victory',
+              'player_shots': 60, 'ai_shots': 58, 'player_hits': 17, 'ai_hits': 15,
+              'player_accuracy': 28.33, 'ai_accuracy': 25.86}
+    cases = []
+    for count in sizes:
+        source = os.path.join(directory, f"stats-{count}.jsonl")
+        write_stats_file(source, count)
+        work = os.path.join(directory, f"work-{count}.jsonl")
+        summary = os.path.splitext(work)[0] + ".summary.json"
+        rollups = os.path.splitext(work)[0] + ".rollups.json"
+        repeat = 3 if count >= 1_000_000 else 10
+        # Fin de l'historique synthétique (une partie par minute)
+        end = datetime(2025, 1, 15, 12) + timedelta(minutes=count)
+
+        def fresh_copy(source=source, work=work, summary=summary, rollups=rollups):
+            shutil.copyfile(source, work)
+            for path in (summary, rollups):
+                if os.path.exists(path):
+                    os.remove(path)
+            return GameStats(work, fsync="never")
+
+        def warm_stats(work=work):
+            # Agrégats déjà persistés : cas d'un lancement normal
+            return GameStats(work, fsync="never")
+
+        def load(stats):
+            for _ in stats.iter_stats():
+                pass
+
+        fresh_copy()
+        GameStats(work, fsync="never").get_stats_summary()  # Persister les agrégats
+        cases += [
+            Case(f"stats.load.{count}", warm_stats, load, ops=count, repeat=repeat),
+            Case(f"stats.summary_rebuild.{count}", fresh_copy,
+                 lambda stats: stats.get_stats_summary(), ops=1, repeat=repeat),
+            Case(f"stats.summary.{count}", warm_stats,
+                 lambda stats: stats.get_stats_summary(), ops=1, repeat=50),
+            Case(f"stats.recent_games.{count}", warm_stats,
+                 lambda stats: stats.recent_games(10), ops=1, repeat=50),
+            Case(f"stats.save.{count}", warm_stats,
+                 lambda stats: stats.save_game_stats(dict(sample)), ops=1, repeat=50),
+            # Tout sauf le dernier jour regroupé en cumuls quotidiens
+            Case(f"stats.compact.{count}", fresh_copy,
+                 lambda stats, end=end: stats.compact(1, now=end), ops=count, repeat=repeat),
+        ]
+
+        # Même historique importé dans une base SQLite
+        database = os.path.join(directory, f"stats-{count}.sqlite3")
+        SQLiteGameStats(database, fsync="never", legacy_files=[source]).close()
+
+        def open_database(database=database):
+            return SQLiteGameStats(database, fsync="never", legacy_files=[])
+
+        def query_page(stats):
+            # Troisième page de 20 victoires en difficulté moyenne sur un mois
+            stats.query(difficulty='moyen', result='victory', since='2025-02-01', until='2025-03-01',
+                        limit=20, offset=40)
+
+        cases += [
+            Case(f"stats.sqlite_summary.{count}", open_database,
+                 lambda stats: stats.get_stats_summary(), ops=1, repeat=50),
+            Case(f"stats.sqlite_recent_games.{count}", open_database,
+                 lambda stats: stats.recent_games(10), ops=1, repeat=50),
+            Case(f"stats.sqlite_query.{count}", open_database, query_page, ops=1, repeat=50),
+            Case(f"stats.sqlite_save.{count}", open_database,
+                 lambda stats: stats.save_game_stats(dict(sample)), ops=1, repeat=50),
+        ]
+    return cases
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Benchmarks de la bataille navale")
+    parser.add_argument('--filter', default="", help="Ne lancer que les benchmarks dont le nom contient ce texte")
+    parser.add_argument('--quick', action='store_true', help="Statistiques sur 10 000 parties seulement")
+    parser.add_argument('--stats-sizes', type=int, nargs='+', default=None,
+                        help="Tailles d'historique pour les benchmarks de GameStats")
+    parser.add_argument('--output', help="Fichier JSON recevant les résultats")
+    parser.add_argument('--baseline', default=BASELINE, help="Résultats de référence")
+    parser.add_argument('--save-baseline', action='store_true', help="Enregistrer les résultats comme référence")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="Ralentissement toléré (0.5 = 50 %%)")
+    parser.add_argument('--rounds', type=int, default=1, help="Séries de mesures par benchmark")
+    parser.add_argument('--retries', type=int, default=2,
+                        help="Nouvelles mesures d'un benchmark en régression avant de la signaler")
+    args = parser.parse_args(argv)
+    rounds = max(args.rounds, BASELINE_ROUNDS) if args.save_baseline else args.rounds
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        baseline = load_results(args.baseline)
+
+    sizes = args.stats_sizes or (STATS_SIZES[:1] if args.quick else STATS_SIZES)
+    directory = tempfile.mkdtemp(prefix="bataille-bench-")
+    try:
+        cases = board_cases() + ai_cases() + game_cases()
+        # Les historiques ne sont générés que si un de leurs benchmarks est demandé
+        if any(args.filter in f"stats.{kind}.{count}" for kind in STATS_KINDS for count in sizes):
+            cases += stats_cases(directory, sizes)
+        results = {}
+        report = {}
+        for case in cases:
+            if args.filter not in case.name:
+                continue
+            results[case.name] = measure(case, rounds)
+            print(f"{case.name:40} {results[case.name]['ops_per_sec']:>14,.1f} ops/s  "
+                  f"p50 {results[case.name]['p50_us']:.2f} µs", file=sys.stderr)
+        if baseline is not None:
+            report = compare(results, baseline, args.tolerance)
+            # Régressions possibles : remesurées après la passe complète, pour
+            # ne pas retomber dans le même ralentissement passager de la machine ;
+            # le bruit ne fait que ralentir, la meilleure mesure est gardée
+            by_name = {case.name: case for case in cases}
+            for _ in range(args.retries):
+                suspects = [name for name, entry in report.items() if entry['status'] == 'regression']
+                for name in suspects:
+                    retry = measure(by_name[name], BASELINE_ROUNDS)
+                    print(f"{name:40} remesuré : min {retry['min_us']:.2f} µs", file=sys.stderr)
+                    if retry['min_us'] < results[name]['min_us']:
+                        results[name] = retry
+                report.update(compare({name: results[name] for name in suspects}, baseline, args.tolerance))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    metadata = {'python': platform.python_version(), 'platform': platform.platform()}
+    output = {'metadata': metadata, 'results': results, 'comparison': report}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, sort_keys=True)
+    json.dump(output, sys.stdout, indent=2, sort_keys=True)
+    print()
+
+    if args.save_baseline:
+        saved = load_results(args.baseline) if os.path.exists(args.baseline) else {}
+        saved.update(results)
+        save_results(args.baseline, saved, metadata)
+    regressions = [name for name, entry in report.items() if entry['status'] == 'regression']
+    if regressions:
+        print("Régressions : " + ", ".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Force de jeu de l'IA 'expert' comparée à l'IA 'difficile'.
+
+Exemple (depuis la racine du dépôt) :
+    python -m benchmarks.strength --games 300
+
+Chaque IA joue les mêmes parties sans interface contre l'IA 'facile'
+(graines f"strength:{i}", mêmes flottes pour les deux IA) ; la mesure est
+le nombre moyen de tirs des parties gagnées. L'écart type d'une partie
+est d'environ 9 tirs : quelques dizaines de parties ne départagent pas
+deux IA proches, d'où les centaines de parties par défaut.
+
+Le code de retour vaut 1 si 'expert' ne fait pas significativement mieux
+que 'difficile' (écart inférieur à deux erreurs types) : tant que c'est le
+cas, 'expert' n'est pas proposée dans le menu.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from src.game.match import play_ai_match
+
+CANDIDATE = 'expert'
+REFERENCE = 'difficile'
+OPPONENT = 'facile'
+
+
+def shots_per_win(difficulty, games):
+    """
+    Joue une série de parties contre l'IA OPPONENT.
+
+    Args:
+        difficulty (str): Difficulté de l'IA mesurée (qui commence)
+        games (int): Nombre de parties
+
+    Returns:
+        dict: Moyenne et erreur type des tirs par partie gagnée, victoires
+        et durée de la série
+    """
+    start = time.perf_counter()
+    shots = []
+    for i in range(games):
+        result = play_ai_match(difficulty, OPPONENT, seed=f"strength:{i}")
+        if result['winner'] == 0:
+            shots.append(result['shots'][0])
+    elapsed = time.perf_counter() - start
+    return {
+        'wins': len(shots),
+        'mean_shots': round(statistics.mean(shots), 2) if shots else None,
+        'stderr': round(statistics.stdev(shots) / len(shots) ** 0.5, 2) if len(shots) > 1 else None,
+        'seconds': round(elapsed, 1)
+    }
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Force de jeu de l'IA 'expert' face à 'difficile'")
+    parser.add_argument('--games', type=int, default=300, help="Parties par IA")
+    args = parser.parse_args(argv)
+
+    report = {name: shots_per_win(name, args.games) for name in (REFERENCE, CANDIDATE)}
+    reference, candidate = report[REFERENCE], report[CANDIDATE]
+    ok = False
+    if reference['stderr'] is not None and candidate['stderr'] is not None:
+        margin = 2 * (reference['stderr'] ** 2 + candidate['stderr'] ** 2) ** 0.5
+        ok = candidate['mean_shots'] < reference['mean_shots'] - margin
+    report['ok'] = ok
+    json.dump(report, sys.stdout, indent=2, sort_keys=True)
+    print()
+    if not ok:
+        print(f"'{CANDIDATE}' ne bat pas significativement '{REFERENCE}'", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,47 @@
+import argparse
+import os
 import tkinter as tk
+from src.game.game_stats import RETENTION_DAYS
+from src.game.stats_db import open_game_stats
 from src.interface.mainmenu import MainMenu
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bataille navale")
+    parser.add_argument('--profile', nargs='?', const="trace.json", default=os.environ.get('BATAILLE_PROFILE'),
+                        metavar='TRACE',
+                        help="Mesurer les étapes du jeu (tableau en surimpression, trace Chrome écrite "
+                             "dans TRACE à la fermeture) ; aussi activé par la variable BATAILLE_PROFILE")
+    parser.add_argument('--stats', choices=['jsonl', 'sqlite'], default=os.environ.get('BATAILLE_STATS', 'jsonl'),
+                        help="Stockage des statistiques : fichier JSON Lines ou base SQLite indexée "
+                             "(l'historique existant est importé au premier lancement) ; "
+                             "aussi choisi par la variable BATAILLE_STATS")
+    parser.add_argument('--stats-retention', type=int, metavar='JOURS',
+                        default=int(os.environ.get('BATAILLE_STATS_RETENTION', RETENTION_DAYS)),
+                        help="Durée de conservation des parties détaillées du fichier JSON Lines ; les "
+                             "plus anciennes sont regroupées en cumuls quotidiens (0 : tout conserver) ; "
+                             "aussi choisie par la variable BATAILLE_STATS_RETENTION")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    
+
     root.attributes('-fullscreen', True)
     root.configure(bg='white')
 
-    main_menu = MainMenu(root)
-    root.mainloop()
-    
\ No newline at end of file
+    profiler = None
+    if args.profile:
+        from src.game.profiling import Profiler
+        from src.interface.profiler_overlay import ProfilerOverlay, instrument_interface
+        profiler = Profiler()
+        instrument_interface(profiler)
+        ProfilerOverlay(root, profiler, args.profile)
+
+    # Un seul stockage des statistiques, partagé par tous les écrans
+    game_stats = open_game_stats(args.stats, args.stats_retention)
+    main_menu = MainMenu(root, game_stats)
+    try:
+        root.mainloop()
+    finally:
+        game_stats.close()
+
+    if profiler is not None:
+        profiler.write_chrome_trace(args.profile)
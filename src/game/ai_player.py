@@ -1,5 +1,9 @@
 import random
 
+from .monte_carlo import MonteCarloTargeter
+from .rules import DEFAULT_RULES
+from .targeting import DensityMap, RemainingCells, TargetTracker
+
 class AIPlayer:
     """
     Représente un joueur IA dans le jeu de bataille navale.
@@ -11,24 +15,64 @@ class AIPlayer:
     Attributes:
         difficulty (str): Niveau de difficulté de l'IA ('easy', 'medium', ou 'hard')
         board_size (int): Taille du plateau de jeu
-        shots (list): Liste des tirs déjà effectués
-        last_hit (tuple): Coordonnées du dernier tir réussi (x, y)
-        hunt_mode (bool): True si l'IA est en mode "chasse" (a touché un navire)
-        potential_targets (list): Liste des cibles potentielles en mode chasse
+        tried_positions (set): Cases déjà ciblées (x, y), déduites de remaining_cells
+        targets (TargetTracker): Machine chasse/cible (difficultés 'moyen' et 'difficile')
+        remaining_cells (RemainingCells): Cases non ciblées, pour les tirs aléatoires
+        ship_sizes (list): Tailles des navires de la flotte adverse
+        density (DensityMap): Carte de densité des placements (difficulté 'difficile')
+        sampler (MonteCarloTargeter): Échantillonneur de flottes (difficulté 'expert')
+        time_budget_ms (float): Temps de réflexion par coup en difficulté 'expert'
+            (None : pas de limite de temps, seul max_samples borne la recherche)
+        max_samples (int): Échantillons par coup au plus en difficulté 'expert'
+        rng (random.Random): Générateur aléatoire de l'IA
+        stop_event (threading.Event): Levé pour demander à une recherche en
+            cours de rendre au plus vite son meilleur coup (None hors thread)
     """
     
-    def __init__(self, difficulty="moyen"):
+    DIFFICULTIES = ("facile", "moyen", "difficile", "expert")
+    
+    # Échantillons par coup de l'IA 'expert' dans les parties sans interface
+    # (tournois, lots, rejeux) : sans limite de temps, ses coups ne dépendent
+    # que de la graine, quelle que soit la machine
+    HEADLESS_SAMPLES = 500
+    
+    def __init__(self, difficulty="moyen", rules=None, time_budget_ms=50, rng=None, max_samples=5000):
         """
         Initialise un joueur IA avec un niveau de difficulté spécifié.
         
         Args:
             difficulty (str): Niveau de difficulté ('easy', 'medium', ou 'hard')
-        """
+            rules (GameRules): Règles de la partie (10x10 réglementaire par défaut)
+            time_budget_ms (float): Temps de réflexion par coup en difficulté 'expert'
+                (None : pas de limite de temps, coups reproductibles)
+            rng (random.Random): Générateur aléatoire à utiliser, pour rendre
+                une partie reproductible (module random global par défaut)
+            max_samples (int): Échantillons par coup au plus en difficulté 'expert'
+        """
+        rules = rules or DEFAULT_RULES
         self.difficulty = difficulty
-        self.last_hit = None
-        self.potential_targets = []
-        self.tried_positions = set()
-        self.board_size = 10
+        self.remaining_cells = RemainingCells(rules.board_size)
+        self.board_size = rules.board_size
+        self.ship_sizes = rules.ship_sizes
+        self.targets = None
+        self.density = None
+        self.sampler = None
+        self.time_budget_ms = time_budget_ms
+        self.max_samples = max_samples
+        self.rng = rng or random
+        self.stop_event = None
+        if difficulty in ("moyen", "difficile"):
+            self.targets = TargetTracker(self.board_size)
+        if difficulty == "difficile":
+            self.density = DensityMap(self.board_size, self.ship_sizes)
+        elif difficulty == "expert":
+            self.sampler = MonteCarloTargeter(rules, self.rng)
+    
+    @property
+    def tried_positions(self):
+        """set: Cases déjà ciblées (x, y), complément de remaining_cells."""
+        size = self.board_size
+        return {(x, y) for y in range(size) for x in range(size) if (x, y) not in self.remaining_cells}
     
     def get_move(self, player_board):
         """
@@ -47,135 +91,102 @@ class AIPlayer:
             return self._get_random_move()
         elif self.difficulty == "moyen":
             return self._get_medium_move()
+        elif self.difficulty == "expert":
+            return self._get_expert_move()
         else:  # difficile
-            return self._get_hard_move(player_board)
+            return self._get_hard_move()
+    
+    def get_random_move(self):
+        """
+        Tire une case non ciblée au hasard, coup de secours si une stratégie échoue.
+        
+        Returns:
+            tuple: Coordonnées du tir (x, y)
+        
+        Raises:
+            IndexError: Si toutes les cases ont déjà été ciblées
+        """
+        return self._get_random_move()
     
     def _get_random_move(self):
         """
         Stratégie facile : tir complètement aléatoire.
         
+        La case est tirée parmi les cases restantes en temps constant,
+        même en fin de partie ou sur un grand plateau.
+        
         Returns:
             tuple: Coordonnées du tir (x, y)
+        
+        Raises:
+            IndexError: Si toutes les cases ont déjà été ciblées
         """
-        while True:
-            x = random.randint(0, self.board_size - 1)
-            y = random.randint(0, self.board_size - 1)
-            if (x, y) not in self.tried_positions:
-                self.tried_positions.add((x, y))
-                return x, y
+        return self.remaining_cells.pop_random(self.rng)
+    
+    def _mark_tried(self, position):
+        """Retire une case choisie par une stratégie des cases restantes"""
+        self.remaining_cells.discard(*position)
     
     def _get_medium_move(self):
         """
-        Stratégie moyenne : tir aléatoire mais continue autour d'un hit.
+        Stratégie moyenne : tir aléatoire, puis finit chaque navire touché.
+        
+        En mode cible, la case est tirée parmi les candidates de la machine
+        chasse/cible (prolongements de la ligne de touches si l'orientation
+        est connue, voisines sinon).
         
         Returns:
             tuple: Coordonnées du tir (x, y)
         """
-        if self.last_hit and self.potential_targets:
-            # Continuer à tirer autour du dernier hit
-            x, y = self.potential_targets.pop()
-            self.tried_positions.add((x, y))
-            return x, y
+        candidates = self.targets.candidates()
+        if candidates:
+            position = self.rng.choice(candidates)
+            self._mark_tried(position)
+            return position
         
         return self._get_random_move()
     
-    def _get_hard_move(self, player_board):
+    def _get_hard_move(self):
         """
-        Stratégie difficile : tir intelligent avec mémoire et probabilités.
+        Stratégie difficile : tir sur la case la plus probable.
+        
+        La probabilité est estimée par la carte de densité des placements
+        encore possibles pour les navires non coulés. En mode cible, le
+        choix est restreint aux candidates de la machine chasse/cible.
         
-        Args:
-            player_board (Board): Le plateau du joueur
-
         Returns:
             tuple: Coordonnées du tir (x, y)
         """
-        if self.last_hit and self.potential_targets:
-            # Utiliser la connaissance des hits précédents
-            best_target = max(self.potential_targets, 
-                            key=lambda pos: self._calculate_probability(pos, player_board))
-            self.potential_targets.remove(best_target)
-            self.tried_positions.add(best_target)
-            return best_target
-        
-        # Calculer les probabilités pour chaque case non essayée
-        all_positions = [(x, y) for x in range(self.board_size) 
-                        for y in range(self.board_size)
-                        if (x, y) not in self.tried_positions]
-        
-        if not all_positions:
+        candidates = self.targets.candidates()
+        if candidates:
+            score, size = self.density.score, self.board_size
+            best_position = max(candidates, key=lambda position: score[position[1] * size + position[0]])
+        else:
+            best_position = self.density.best_cell()
+        if best_position is None or best_position not in self.remaining_cells:
             return self._get_random_move()
         
-        best_position = max(all_positions, 
-                          key=lambda pos: self._calculate_probability(pos, player_board))
-        self.tried_positions.add(best_position)
+        self._mark_tried(best_position)
         return best_position
     
-    def _calculate_probability(self, pos, player_board):
+    def _get_expert_move(self):
         """
-        Calcule la probabilité qu'un bateau soit à une position donnée.
+        Stratégie experte : échantillonnage Monte Carlo des flottes possibles.
+        
+        La recherche dure au plus time_budget_ms (sans limite si None), tire
+        au plus max_samples échantillons et s'interrompt dès que stop_event
+        est levé ; les mesures de la recherche sont disponibles dans
+        sampler.last_search.
         
-        Args:
-            pos (tuple): Coordonnées de la position (x, y)
-            player_board (Board): Le plateau du joueur
-
         Returns:
-            int: La probabilité qu'un bateau soit à cette position
-        """
-        x, y = pos
-        probability = 0
-        
-        # Vérifier les cases adjacentes
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_x, new_y = x + dx, y + dy
-            if 0 <= new_x < self.board_size and 0 <= new_y < self.board_size:
-                cell_state = player_board.get_cell_state(new_x, new_y)
-                if cell_state == 'hit':
-                    probability += 2  # Plus probable près d'un hit
-                elif cell_state == 'miss':
-                    probability -= 1  # Moins probable près d'un miss
-        
-        # Favoriser les positions qui permettent de placer des bateaux
-        for ship_size in [5, 4, 3, 3, 2, 2]:  # Tailles des bateaux selon les règles officielles
-            if self._can_place_ship_at(pos, ship_size, player_board):
-                probability += 1
-        
-        return probability
-    
-    def _can_place_ship_at(self, pos, ship_size, player_board):
+            tuple: Coordonnées du tir (x, y)
         """
-        Vérifie si un bateau de taille donnée peut être placé à la position.
+        best_position = self.sampler.best_cell(self.time_budget_ms, self.max_samples, self.stop_event)
+        if best_position is None or best_position not in self.remaining_cells:
+            return self._get_random_move()
         
-        Args:
-            pos (tuple): Coordonnées de la position (x, y)
-            ship_size (int): Taille du bateau
-            player_board (Board): Le plateau du joueur
-
-        Returns:
-            bool: True si le bateau peut être placé, False sinon
-        """
-        x, y = pos
-        
-        # Vérifier horizontalement
-        if x + ship_size <= self.board_size:
-            can_place = True
-            for i in range(ship_size):
-                if (x + i, y) in self.tried_positions:
-                    can_place = False
-                    break
-            if can_place:
-                return True
-        
-        # Vérifier verticalement
-        if y + ship_size <= self.board_size:
-            can_place = True
-            for i in range(ship_size):
-                if (x, y + i) in self.tried_positions:
-                    can_place = False
-                    break
-            if can_place:
-                return True
-        
-        return False
+        self._mark_tried(best_position)
+        return best_position
     
     def notify_hit(self, x, y, is_hit):
         """
@@ -188,17 +199,24 @@ class AIPlayer:
             y (int): Coordonnée y du tir
             is_hit (bool): True si le tir a touché un navire, False sinon
         """
-        if is_hit:
-            self.last_hit = (x, y)
-            # Ajouter les cases adjacentes comme cibles potentielles
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.board_size and 
-                    0 <= new_y < self.board_size and 
-                    (new_x, new_y) not in self.tried_positions):
-                    self.potential_targets.append((new_x, new_y))
-        else:
-            # Si c'était un miss et qu'il n'y a plus de cibles potentielles,
-            # réinitialiser le dernier hit
-            if not self.potential_targets:
-                self.last_hit = None
+        if self.density is not None:
+            self.density.record_shot(x, y, is_hit)
+        if self.sampler is not None:
+            self.sampler.record_shot(x, y, is_hit)
+        if self.targets is not None:
+            self.targets.record_shot(x, y, is_hit)
+        self.remaining_cells.discard(x, y)
+    
+    def notify_sunk(self, ship):
+        """
+        Notifie l'IA qu'un de ses tirs a coulé un navire.
+        
+        Args:
+            ship (Ship): Le navire coulé, avec sa position
+        """
+        if self.density is not None:
+            self.density.record_sunk(ship)
+        if self.sampler is not None:
+            self.sampler.record_sunk(ship)
+        if self.targets is not None:
+            self.targets.record_sunk(ship)
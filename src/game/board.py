@@ -1,167 +1,468 @@
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+
+from .placement import segment_index
+from .rules import DEFAULT_RULES
+
+
+# État des tirs d'un plateau, sans ses navires (voir Board.snapshot) ; shots
+# contient l'historique compact des tirs (octets de l'array des indices)
+BoardSnapshot = namedtuple('BoardSnapshot', ['hits_mask', 'misses_mask', 'ship_hits', 'remaining', 'shots'])
+
+
+@lru_cache(maxsize=None)
+def _shared_empty_owner(cell_count, typecode):
+    """Tableau des propriétaires d'un plateau vide, partagé en lecture seule."""
+    return array(typecode, [0]) * cell_count
+
+
+def _typecode(max_value):
+    """Plus petit type d'array non signé pouvant contenir max_value."""
+    for typecode in ('B', 'H', 'L'):
+        if max_value < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    return 'Q'
+
+
+class ShotHistory:
+    """
+    Vue en liste de l'historique compact des tirs d'un plateau.
+
+    Elle se comporte comme la liste des coordonnées (x, y) des tirs (len,
+    index et tranches, itération, append, pop, del, comparaison à une
+    liste) alors que le plateau ne stocke que l'indice de chaque case dans
+    un array, soit un ou deux octets par tir au lieu d'un tuple.
+    """
+
+    __slots__ = ('_size', '_cells')
+
+    def __init__(self, size, cells):
+        """
+        Crée une vue sur un historique.
+
+        Args:
+            size (int): Taille du plateau
+            cells (array): Indices des cases ciblées, modifiés par la vue
+        """
+        self._size = size
+        self._cells = cells
+
+    def _position(self, cell):
+        """Coordonnées (x, y) d'un indice de case."""
+        return cell % self._size, cell // self._size
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __iter__(self):
+        size = self._size
+        return ((cell % size, cell // size) for cell in self._cells)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._position(cell) for cell in self._cells[index]]
+        return self._position(self._cells[index])
+
+    def __delitem__(self, index):
+        del self._cells[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ShotHistory):
+            return self._size == other._size and self._cells == other._cells
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ShotHistory({list(self)!r})"
+
+    def append(self, position):
+        """Ajoute un tir (x, y) en fin d'historique."""
+        x, y = position
+        self._cells.append(y * self._size + x)
+
+    def pop(self):
+        """Retire et retourne le dernier tir (x, y)."""
+        return self._position(self._cells.pop())
+
+
 class Board:
     """
     Représente un plateau de jeu de bataille navale.
-    
+
     Cette classe gère l'état du plateau, le placement des navires,
     et le traitement des tirs. Elle maintient également une liste
     des navires présents sur le plateau.
-    
+
+    L'état est stocké sous forme de bitboards : chaque case correspond au
+    bit d'indice y * size + x d'un entier Python. Un masque par navire et un
+    tableau de propriétaires par case permettent de répondre en temps
+    constant à receive_shot, check_sunk_ship et all_ships_sunk.
+
+    Pour les IA qui explorent des tirs hypothétiques, undo_shot annule le
+    dernier tir (shot_history sert de pile), snapshot/restore sauvegardent
+    et rétablissent l'état des tirs, et clone copie le plateau sans
+    recopier ses tableaux (copie à l'écriture).
+
+    Les plateaux sont compacts (__slots__, tableaux d'entiers) : un serveur
+    ou un tournoi peut en garder des centaines de milliers en mémoire
+    (voir python -m benchmarks.memory).
+
     Attributes:
+        rules (GameRules): Règles de la partie
         size (int): Taille du plateau (nombre de cases par côté)
-        grid (list): Grille 2D représentant l'état de chaque case
+        grid (tuple): Grille 2D en lecture seule (tuple de tuples, reconstruite
+            à chaque accès) représentant l'état de chaque case
             - 0: case vide
             - 1: case occupée par un navire
             - 2: case touchée (navire touché)
             - 3: case manquée (tir dans l'eau)
         ships (list): Liste des navires placés sur le plateau
+        shot_history (ShotHistory): Cases ciblées (x, y), dans l'ordre des tirs
     """
-    
-    def __init__(self):
+
+    __slots__ = ('rules', 'size', 'ships', 'ships_mask', 'hits_mask', 'misses_mask', 'ship_masks',
+                 '_owner', '_owner_shared', '_ship_hits', '_remaining', '_shots')
+
+    def __init__(self, rules=None):
         """
-        Initialise un nouveau plateau de jeu vide de taille 10x10.
+        Initialise un nouveau plateau de jeu vide.
+
+        Args:
+            rules (GameRules): Règles de la partie (10x10 réglementaire par défaut)
         """
-        self.size = 10
-        self.grid = [[0 for _ in range(self.size)] for _ in range(self.size)]
+        self.rules = rules or DEFAULT_RULES
+        self.size = self.rules.board_size
         self.ships = []
-        # 0: empty, 1: ship, 2: hit, 3: miss
-    
+        self.ships_mask = 0   # Cases occupées par un navire
+        self.hits_mask = 0    # Cases touchées
+        self.misses_mask = 0  # Cases manquées
+        self.ship_masks = []  # Un masque par navire, dans l'ordre de self.ships
+        # Indice + 1 du navire occupant chaque case (0 si la case est vide) ;
+        # le tableau vide est commun à tous les plateaux jusqu'au premier placement
+        self._owner = _shared_empty_owner(self.size * self.size, _typecode(len(self.rules.fleet)))
+        self._owner_shared = True  # True si _owner est partagé (plateau vide ou clone)
+        self._ship_hits = []  # Nombre de cases touchées par navire
+        self._remaining = 0   # Nombre de cases de navire non touchées
+        self._shots = array(_typecode(self.size * self.size - 1))  # Indices des cases ciblées
+
+    def _empty_owner(self):
+        """Tableau des propriétaires sans aucun navire (un octet par case si possible)."""
+        return array(_typecode(len(self.rules.fleet)), [0]) * (self.size * self.size)
+
+    @property
+    def shot_history(self):
+        """ShotHistory: Cases ciblées (x, y), dans l'ordre des tirs."""
+        return ShotHistory(self.size, self._shots)
+
+    @property
+    def grid(self):
+        """
+        Grille 2D reconstruite à partir des bitboards.
+
+        Ce n'est plus l'état du plateau mais une copie immuable : une
+        écriture (board.grid[y][x] = 1) lève TypeError au lieu d'être
+        perdue. Chaque accès reconstruit la grille en O(size²) ; pour lire
+        une case, get_cell_state répond en temps constant.
+
+        Returns:
+            tuple: Tuple de lignes (tuples), grid[y][x] valant 0, 1, 2 ou 3
+        """
+        size = self.size
+        ships, hits, misses = self.ships_mask, self.hits_mask, self.misses_mask
+        grid = []
+        for y in range(size):
+            row = []
+            for x in range(size):
+                bit = 1 << (y * size + x)
+                if hits & bit:
+                    row.append(2)
+                elif misses & bit:
+                    row.append(3)
+                elif ships & bit:
+                    row.append(1)
+                else:
+                    row.append(0)
+            grid.append(tuple(row))
+        return tuple(grid)
+
+    def _segment(self, length, x, y, horizontal):
+        """
+        Retrouve un segment dans l'index précalculé des segments.
+
+        Returns:
+            tuple: (SegmentIndex, identifiant), l'identifiant valant None
+                si le segment sort du plateau
+        """
+        index = segment_index(self.size, length)
+        return index, index.find(x, y, horizontal)
+
+    def _is_free(self, index, segment):
+        """
+        Vérifie qu'un segment ne chevauche aucune case occupée ou ciblée et,
+        avec la règle de non-contact, qu'il ne touche aucun autre navire.
+        """
+        if index.masks[segment] & (self.ships_mask | self.hits_mask | self.misses_mask):
+            return False
+        if self.rules.no_touch:
+            return not index.halos[segment] & self.ships_mask
+        return True
+
+    def can_place_ship(self, size, x, y, horizontal):
+        """
+        Vérifie si un navire de taille donnée peut être placé.
+
+        Args:
+            size (int): Taille du navire
+            x (int): Coordonnée x de la première case
+            y (int): Coordonnée y de la première case
+            horizontal (bool): True pour placement horizontal, False pour vertical
+
+        Returns:
+            bool: True si le segment est dans le plateau et ne touche
+                aucune case occupée ou déjà ciblée
+        """
+        index, segment = self._segment(size, x, y, horizontal)
+        return segment is not None and self._is_free(index, segment)
+
     def place_ship(self, ship, x, y, horizontal):
         """
         Tente de placer un navire sur le plateau.
-        
+
         Args:
             ship (Ship): Le navire à placer
             x (int): Coordonnée x de la première case
             y (int): Coordonnée y de la première case
             horizontal (bool): True pour placement horizontal, False pour vertical
-        
+
         Returns:
             bool: True si le placement est réussi, False sinon
         """
-        # Vérifier si le placement est possible
-        if horizontal:
-            if x + ship.size > self.size:
-                return False
-            # Vérifier si l'espace est libre
-            for i in range(ship.size):
-                if self.grid[y][x + i] != 0:
-                    return False
-            # Placer le bateau
-            for i in range(ship.size):
-                self.grid[y][x + i] = 1
-        else:
-            if y + ship.size > self.size:
-                return False
-            # Vérifier si l'espace est libre
-            for i in range(ship.size):
-                if self.grid[y + i][x] != 0:
-                    return False
-            # Placer le bateau
-            for i in range(ship.size):
-                self.grid[y + i][x] = 1
-        
-        # Ajouter le bateau à la liste avec sa position
-        ship.position = (x, y, horizontal)
+        index, segment = self._segment(ship.size, x, y, horizontal)
+        # Vérifier si le placement est possible et l'espace libre
+        if segment is None or not self._is_free(index, segment):
+            return False
+
+        # Placer le bateau
+        mask = index.masks[segment]
+        self.ships_mask |= mask
+        self.ship_masks.append(mask)
+        self._ship_hits.append(0)
+        self._remaining += ship.size
+        if self._owner_shared:
+            self._owner = array(self._owner.typecode, self._owner)
+            self._owner_shared = False
+        for cell in index.cells[segment]:
+            self._owner[cell] = len(self.ships) + 1
+
+        # Ajouter le bateau à la liste avec sa position (tuple partagé de
+        # l'index quand il est identique, pour ne pas en allouer un par navire)
+        position = index.positions[segment]
+        ship.position = position if position == (x, y, horizontal) else (x, y, horizontal)
         self.ships.append(ship)
         return True
-    
+
+    def remove_ship(self, ship):
+        """
+        Retire un navire du plateau (utilisé pendant la phase de placement).
+
+        Args:
+            ship (Ship): Le navire à retirer
+
+        Returns:
+            bool: True si le navire était sur le plateau, False sinon
+        """
+        index = next((i for i, s in enumerate(self.ships) if s is ship), None)
+        if index is None:
+            return False
+
+        self.ships_mask &= ~self.ship_masks[index]
+        self._remaining -= ship.size - self._ship_hits[index]
+        del self.ships[index]
+        del self.ship_masks[index]
+        del self._ship_hits[index]
+
+        # Renuméroter les propriétaires des cases
+        self._owner = self._empty_owner()
+        self._owner_shared = False
+        for i, placed in enumerate(self.ships):
+            index, segment = self._segment(placed.size, *placed.position)
+            for cell in index.cells[segment]:
+                self._owner[cell] = i + 1
+        return True
+
     def receive_shot(self, x, y):
         """
         Reçoit un tir aux coordonnées spécifiées et met à jour l'état du plateau.
-        
+
         Args:
             x (int): Coordonnée x du tir
             y (int): Coordonnée y du tir
-        
+
         Returns:
             bool ou None: True si touché, False si manqué, None si case déjà ciblée
+
+        Raises:
+            IndexError: Si la case est hors du plateau
         """
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
+            raise IndexError(f"Case hors du plateau : {(x, y)}")
+        index = y * size + x
+        bit = 1 << index
         # Si la cellule a déjà été touchée ou manquée
-        if self.grid[y][x] in [2, 3]:
+        if (self.hits_mask | self.misses_mask) & bit:
             return None
-        
-        if self.grid[y][x] == 1:  # Touché
-            self.grid[y][x] = 2  # Marquer comme touché
+
+        self._shots.append(index)
+        if self.ships_mask & bit:  # Touché
+            self.hits_mask |= bit
+            self._ship_hits[self._owner[index] - 1] += 1
+            self._remaining -= 1
             return True
         else:  # Manqué
-            self.grid[y][x] = 3  # Marquer comme manqué
+            self.misses_mask |= bit
             return False
-    
+
+    def undo_shot(self):
+        """
+        Annule le dernier tir reçu.
+
+        Returns:
+            tuple ou None: Coordonnées (x, y) du tir annulé, None si aucun tir
+        """
+        if not self._shots:
+            return None
+        index = self._shots.pop()
+        bit = 1 << index
+        if self.hits_mask & bit:
+            self.hits_mask &= ~bit
+            self._ship_hits[self._owner[index] - 1] -= 1
+            self._remaining += 1
+        else:
+            self.misses_mask &= ~bit
+        return index % self.size, index // self.size
+
+    def snapshot(self):
+        """
+        Capture l'état des tirs du plateau.
+
+        Les bitboards étant des entiers immuables, la capture ne copie que
+        le compteur de touches de chaque navire et l'historique compact des
+        tirs (un ou deux octets par tir), qui permet à restore de vérifier
+        que l'état actuel en descend.
+
+        Returns:
+            BoardSnapshot: État à passer à restore
+        """
+        return BoardSnapshot(self.hits_mask, self.misses_mask, tuple(self._ship_hits),
+                             self._remaining, self._shots.tobytes())
+
+    def restore(self, snapshot):
+        """
+        Rétablit l'état des tirs capturé par snapshot.
+
+        Seul un état antérieur du même plateau (mêmes navires) peut être
+        rétabli : les tirs reçus depuis sont retirés de shot_history.
+
+        Args:
+            snapshot (BoardSnapshot): État capturé par snapshot
+
+        Raises:
+            ValueError: Si l'historique des tirs ne commence plus par celui de
+                la capture (tirs antérieurs annulés, puis autres tirs reçus)
+        """
+        count = len(snapshot.shots) // self._shots.itemsize
+        if self._shots[:count].tobytes() != snapshot.shots:
+            raise ValueError("L'historique des tirs ne descend pas de la capture")
+        self.hits_mask = snapshot.hits_mask
+        self.misses_mask = snapshot.misses_mask
+        self._ship_hits = list(snapshot.ship_hits)
+        self._remaining = snapshot.remaining
+        del self._shots[count:]
+
+    def clone(self):
+        """
+        Copie le plateau sans recopier ses tableaux.
+
+        Les bitboards (entiers immuables) et les navires sont partagés ; le
+        tableau des propriétaires n'est recopié qu'au premier placement ou
+        retrait de navire sur l'une des deux copies. Les tirs reçus par une
+        copie n'affectent pas l'autre.
+
+        Returns:
+            Board: Un plateau indépendant dans le même état
+        """
+        board = Board.__new__(Board)
+        board.rules = self.rules
+        board.size = self.size
+        board.ships = list(self.ships)
+        board.ships_mask = self.ships_mask
+        board.hits_mask = self.hits_mask
+        board.misses_mask = self.misses_mask
+        board.ship_masks = list(self.ship_masks)
+        board._owner = self._owner
+        board._owner_shared = self._owner_shared = True
+        board._ship_hits = list(self._ship_hits)
+        board._remaining = self._remaining
+        board._shots = self._shots[:]
+        return board
+
     def get_cell_state(self, x, y):
         """
         Retourne l'état d'une cellule du plateau.
-        
+
         Args:
             x (int): Coordonnée x de la cellule
             y (int): Coordonnée y de la cellule
-        
+
         Returns:
             str: État de la cellule ('empty', 'ship', 'hit', ou 'miss')
+
+        Raises:
+            IndexError: Si la case est hors du plateau
         """
-        state = self.grid[y][x]
-        if state == 0:
-            return 'empty'
-        elif state == 1:
-            return 'ship'
-        elif state == 2:
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
+            raise IndexError(f"Case hors du plateau : {(x, y)}")
+        bit = 1 << (y * size + x)
+        if self.hits_mask & bit:
             return 'hit'
-        else:
+        elif self.misses_mask & bit:
             return 'miss'
-    
+        elif self.ships_mask & bit:
+            return 'ship'
+        else:
+            return 'empty'
+
     def all_ships_sunk(self):
         """
         Vérifie si tous les navires sur le plateau sont coulés.
-        
+
         Returns:
             bool: True si tous les navires sont coulés, False sinon
         """
-        for ship in self.ships:
-            x, y, horizontal = ship.position
-            # Vérifier chaque case du bateau
-            if horizontal:
-                for i in range(ship.size):
-                    if self.grid[y][x + i] == 1:  # Si une case n'est pas touchée
-                        return False
-            else:
-                for i in range(ship.size):
-                    if self.grid[y + i][x] == 1:  # Si une case n'est pas touchée
-                        return False
-        return True
+        return self._remaining == 0
 
     def check_sunk_ship(self, x, y):
         """
         Vérifie si un navire a été coulé suite à un tir.
-        
+
         Args:
             x (int): Coordonnée x du dernier tir
             y (int): Coordonnée y du dernier tir
-        
+
         Returns:
             Ship ou None: Le navire coulé si trouvé, None sinon
+
+        Raises:
+            IndexError: Si la case est hors du plateau
         """
-        # Trouver le navire touché
-        hit_ship = None
-        for ship in self.ships:
-            ship_x, ship_y, horizontal = ship.position
-            if horizontal:
-                if ship_y == y and ship_x <= x < ship_x + ship.size:
-                    hit_ship = ship
-                    break
-            else:
-                if ship_x == x and ship_y <= y < ship_y + ship.size:
-                    hit_ship = ship
-                    break
-        
-        if hit_ship:
-            # Vérifier si toutes les cases du navire sont touchées
-            ship_x, ship_y, horizontal = hit_ship.position
-            if horizontal:
-                for i in range(hit_ship.size):
-                    if self.grid[ship_y][ship_x + i] != 2:  # 2 = touché
-                        return None
-            else:
-                for i in range(hit_ship.size):
-                    if self.grid[ship_y + i][ship_x] != 2:  # 2 = touché
-                        return None
-            return hit_ship
+        size = self.size
+        if not (0 <= x < size and 0 <= y < size):
+            raise IndexError(f"Case hors du plateau : {(x, y)}")
+        owner = self._owner[y * size + x]
+        if owner and self._ship_hits[owner - 1] == self.ships[owner - 1].size:
+            return self.ships[owner - 1]
         return None
@@ -1,43 +1,174 @@
+import argparse
+import copy
 import json
 import os
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
+
+# Durée de conservation par défaut des parties détaillées (en jours) : au-delà,
+# les parties ne subsistent que dans les cumuls quotidiens
+RETENTION_DAYS = 365
 
 class GameStats:
     """
     Gère les statistiques et la sauvegarde des résultats des parties.
     
     Cette classe s'occupe de sauvegarder et charger les résultats des parties
-    dans un fichier JSON, permettant de conserver un historique des performances.
+    dans un fichier JSON Lines (un objet JSON par ligne), permettant de
+    conserver un historique des performances. Chaque partie est ajoutée en
+    fin de fichier sans réécrire l'historique, et l'historique n'est lu
+    qu'au moment où il est demandé.
+    
+    Si une durée de conservation est donnée, les parties plus anciennes sont
+    regroupées une fois par jour en cumuls quotidiens par difficulté
+    (fichier .rollups.json) puis retirées de l'historique : la taille du
+    fichier et le coût des relectures restent bornés, et le résumé combine
+    les cumuls avec les parties récentes.
     
     Attributes:
         save_file (str): Chemin vers le fichier de sauvegarde
+        legacy_file (str): Ancien fichier JSON, converti au premier lancement
+        summary_file (str): Fichier des agrégats (compteurs par difficulté)
+        rollups_file (str): Fichier des cumuls des parties compactées
+        fsync (str): Politique de synchronisation disque après chaque partie
+            - 'always': fsync après chaque enregistrement (résiste aux coupures)
+            - 'never': simple flush, le système écrit quand il le souhaite
+        retention_days (int): Durée de conservation des parties détaillées
+            en jours (None : historique conservé en entier)
+        keep_games (int): Nombre minimal de parties détaillées conservées
         stats_history (list): Liste des statistiques des parties précédentes
     """
     
-    def __init__(self):
-        """Initialise le gestionnaire de statistiques."""
-        self.save_file = "game_stats.json"
-        self.stats_history = self._load_stats()
+    def __init__(self, save_file="game_stats.jsonl", fsync="always", retention_days=None, keep_games=10):
+        """
+        Initialise le gestionnaire de statistiques.
+        
+        Args:
+            save_file (str): Chemin vers le fichier JSON Lines
+            fsync (str): Politique de synchronisation ('always' ou 'never')
+            retention_days (int): Durée de conservation des parties détaillées
+                (None : pas de compactage automatique)
+            keep_games (int): Nombre minimal de parties détaillées conservées
+                (celles affichées dans le menu)
+        """
+        self.save_file = save_file
+        self.legacy_file = os.path.splitext(save_file)[0] + ".json"
+        self.summary_file = os.path.splitext(save_file)[0] + ".summary.json"
+        self.rollups_file = os.path.splitext(save_file)[0] + ".rollups.json"
+        self.fsync = fsync
+        self.retention_days = retention_days
+        self.keep_games = keep_games
+        self._history = None
+        self._aggregates = None
+        self._rollups = None
+        self._rollups_stamp = None
+        self._migrate_legacy_file()
+    
+    def close(self):
+        """Ne fait rien : le fichier n'est ouvert que le temps d'une lecture ou d'une écriture."""
+    
+    @property
+    def stats_history(self):
+        """list: Historique complet, chargé à la première utilisation."""
+        if self._history is None:
+            self._history = list(self._load_stats())
+        return self._history
+    
+    def _migrate_legacy_file(self):
+        """Convertit l'ancien fichier JSON en JSON Lines s'il est seul présent."""
+        if os.path.exists(self.save_file) or not os.path.exists(self.legacy_file):
+            return
+        try:
+            with open(self.legacy_file, 'r') as f:
+                history = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        temp_file = self.save_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            for game in history:
+                f.write(json.dumps(game) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.save_file)
     
     def _load_stats(self):
         """
-        Charge les statistiques depuis le fichier JSON.
+        Lit les statistiques depuis le fichier JSON Lines, une partie à la fois.
+        
+        Une ligne illisible (par exemple tronquée par une coupure pendant
+        l'écriture) est ignorée.
+        
+        Yields:
+            dict: Statistiques d'une partie précédente
+        """
+        if not os.path.exists(self.save_file):
+            return
+        with open(self.save_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+    
+    def iter_stats(self):
+        """
+        Parcourt l'historique sans le charger entièrement en mémoire.
+        
+        Returns:
+            iterator: Statistiques de chaque partie, de la plus ancienne à la plus récente
+        """
+        if self._history is not None:
+            return iter(self._history)
+        return self._load_stats()
+    
+    def recent_games(self, count=10):
+        """
+        Retourne les dernières parties en ne lisant que la fin du fichier.
+        
+        Args:
+            count (int): Nombre de parties souhaitées
         
         Returns:
-            list: Liste des statistiques des parties précédentes
+            list: Les parties les plus récentes, de la plus ancienne à la plus récente
         """
-        if os.path.exists(self.save_file):
+        if self._history is not None:
+            return self._history[-count:] if count > 0 else []
+        if count <= 0 or not os.path.exists(self.save_file):
+            return []
+        
+        # Remonter le fichier par blocs jusqu'à avoir assez de lignes
+        block_size = 8192
+        with open(self.save_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= count:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                data = f.read(read_size) + data
+        
+        games = []
+        for line in reversed(data.splitlines()):
             try:
-                with open(self.save_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
+                games.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # Ligne tronquée ou coupée par le découpage en blocs
+            if len(games) == count:
+                break
+        games.reverse()
+        return games
     
     def save_game_stats(self, stats):
         """
         Sauvegarde les statistiques d'une partie.
         
+        La partie est ajoutée en fin de fichier : le coût ne dépend pas de
+        la taille de l'historique.
+        
         Args:
             stats (dict): Dictionnaire contenant les statistiques de la partie
                 - difficulty (str): Niveau de difficulté
@@ -52,20 +183,48 @@ class GameStats:
         # Ajouter la date actuelle
         stats['date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Ajouter les nouvelles stats à l'historique
-        self.stats_history.append(stats)
+        # Mettre les agrégats à jour avant l'ajout pour ne pas compter la partie deux fois
+        aggregates = self._get_aggregates()
         
-        # Sauvegarder dans le fichier
+        # Ajouter une ligne au fichier
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.stats_history, f, indent=2)
+            with open(self.save_file, 'ab') as f:
+                # Terminer une éventuelle ligne tronquée par une coupure précédente
+                if f.tell() > 0:
+                    with open(self.save_file, 'rb') as check:
+                        check.seek(-1, os.SEEK_END)
+                        if check.read(1) != b"\n":
+                            f.write(b"\n")
+                f.write((json.dumps(stats) + "\n").encode('utf-8'))
+                f.flush()
+                if self.fsync == 'always':
+                    os.fsync(f.fileno())
+                offset = f.tell()
         except Exception as e:
             print(f"Erreur lors de la sauvegarde des statistiques : {e}")
+            return
+        
+        # Ajouter la partie à l'historique en mémoire, s'il est chargé, une fois écrite
+        if self._history is not None:
+            self._history.append(stats)
+        
+        # Mettre à jour les agrégats en temps constant
+        self._add_to_aggregates(aggregates, stats)
+        aggregates['offset'] = offset
+        self._save_aggregates()
+        
+        # Compacter au plus une fois par jour
+        if self.retention_days is not None and self._get_rollups()['last_compaction'] != stats['date'][:10]:
+            self.compact()
     
     def get_stats_summary(self):
         """
         Génère un résumé des statistiques de toutes les parties.
         
+        Le résumé est calculé à partir des agrégats tenus à jour à chaque
+        sauvegarde et des cumuls des parties compactées : son coût ne dépend
+        pas de la taille de l'historique.
+        
         Returns:
             dict: Résumé des statistiques
                 - total_games (int): Nombre total de parties
@@ -74,30 +233,286 @@ class GameStats:
                 - best_time (int): Meilleur temps pour une victoire
                 - stats_by_difficulty (dict): Statistiques par niveau de difficulté
         """
-        if not self.stats_history:
+        aggregates = self._empty_counts()
+        self._merge_counts(aggregates, self._get_rollups())
+        self._merge_counts(aggregates, self._get_aggregates())
+        if not aggregates['total_games']:
             return None
         
         summary = {
-            'total_games': len(self.stats_history),
-            'victories': sum(1 for game in self.stats_history if game['result'] == 'victory'),
+            'total_games': aggregates['total_games'],
+            'victories': aggregates['victories'],
+            'avg_duration': aggregates['duration_sum'] / aggregates['total_games'],
             'stats_by_difficulty': {}
         }
         
-        # Calculer les statistiques par difficulté
-        for difficulty in ['facile', 'moyen', 'difficile']:
-            diff_games = [game for game in self.stats_history if game['difficulty'] == difficulty]
-            if diff_games:
-                wins = sum(1 for game in diff_games if game['result'] == 'victory')
+        # Statistiques par difficulté, dans l'ordre des niveaux connus
+        by_difficulty = aggregates['by_difficulty']
+        known = ['facile', 'moyen', 'difficile', 'expert']
+        for difficulty in known + sorted(set(by_difficulty) - set(known)):
+            diff_stats = by_difficulty.get(difficulty)
+            if diff_stats and diff_stats['total_games']:
+                games = diff_stats['total_games']
                 summary['stats_by_difficulty'][difficulty] = {
-                    'total_games': len(diff_games),
-                    'victories': wins,
-                    'win_rate': round(wins / len(diff_games) * 100, 2),
-                    'avg_duration': sum(game['duration'] for game in diff_games) / len(diff_games)
+                    'total_games': games,
+                    'victories': diff_stats['victories'],
+                    'win_rate': round(diff_stats['victories'] / games * 100, 2),
+                    'avg_duration': diff_stats['duration_sum'] / games
                 }
         
-        # Calculer le meilleur temps (victoires uniquement)
-        victory_games = [game for game in self.stats_history if game['result'] == 'victory']
-        if victory_games:
-            summary['best_time'] = min(game['duration'] for game in victory_games)
+        # Meilleur temps (victoires uniquement)
+        if aggregates['best_time'] is not None:
+            summary['best_time'] = aggregates['best_time']
         
         return summary
+    
+    def daily_stats(self):
+        """
+        Cumuls par jour et par difficulté, parties compactées comprises.
+        
+        Returns:
+            dict: Pour chaque jour ('AAAA-MM-JJ', dans l'ordre), les compteurs
+                total_games, victories, duration_sum, best_time et by_difficulty
+        """
+        rollups = self._get_rollups()
+        days = copy.deepcopy(rollups['days'])
+        cutoff = rollups['compacted_until']
+        for game in self.iter_stats():
+            date = game.get('date', "")
+            if cutoff is None or date >= cutoff:
+                self._add_to_aggregates(days.setdefault(date[:10], self._empty_counts()), game)
+        return dict(sorted(days.items()))
+    
+    def compact(self, retention_days=None, now=None):
+        """
+        Regroupe les parties anciennes en cumuls quotidiens et les retire de l'historique.
+        
+        Les parties antérieures à la durée de conservation sont ajoutées aux
+        cumuls ; les keep_games dernières parties sont toujours conservées.
+        Les cumuls, qui notent la date limite atteinte, sont écrits avant le
+        remplacement de l'historique : après une coupure entre les deux
+        écritures, les parties déjà cumulées sont ignorées par le résumé et
+        retirées au compactage suivant, sans être comptées deux fois.
+        
+        Args:
+            retention_days (int): Durée de conservation en jours (par défaut retention_days)
+            now (datetime): Date de référence (par défaut maintenant)
+        
+        Returns:
+            int: Nombre de parties ajoutées aux cumuls
+        """
+        retention_days = self.retention_days if retention_days is None else retention_days
+        if retention_days is None:
+            return 0
+        now = now or datetime.now()
+        cutoff = (now - timedelta(days=retention_days)).strftime("%Y-%m-%d %H:%M:%S")
+        if self.keep_games > 0:
+            kept = self.recent_games(self.keep_games)
+            if len(kept) == self.keep_games:
+                cutoff = min(cutoff, kept[0].get('date', ""))
+            else:
+                cutoff = ""  # Pas assez de parties : tout conserver
+        
+        rollups = self._get_rollups()
+        previous = rollups['compacted_until']
+        if previous is not None:
+            cutoff = max(cutoff, previous)
+        rollups['last_compaction'] = now.strftime("%Y-%m-%d")
+        
+        # Rien à faire si la première partie (la plus ancienne) est conservée
+        first = next(self._load_stats(), None)
+        if first is None or first.get('date', "") >= cutoff:
+            self._save_rollups()
+            return 0
+        
+        # Cumuler les parties anciennes et recopier les autres
+        rolled = 0
+        temp_file = self.save_file + ".tmp"
+        with open(self.save_file, 'rb') as source, open(temp_file, 'wb') as target:
+            for line in source:
+                try:
+                    game = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                date = game.get('date', "")
+                if date >= cutoff:
+                    target.write(line if line.endswith(b"\n") else line + b"\n")
+                elif previous is None or date >= previous:
+                    day = rollups['days'].setdefault(date[:10], self._empty_counts())
+                    self._add_to_aggregates(day, game)
+                    self._add_to_aggregates(rollups, game)
+                    rolled += 1
+            target.flush()
+            os.fsync(target.fileno())
+        
+        rollups['compacted_until'] = cutoff
+        self._save_rollups()
+        os.replace(temp_file, self.save_file)
+        
+        # Les agrégats et l'historique en mémoire seront relus depuis le fichier réduit
+        self._history = None
+        self._aggregates = None
+        return rolled
+    
+    @staticmethod
+    def _empty_counts():
+        """Retourne des compteurs vides (globaux et par difficulté)."""
+        return {
+            'total_games': 0,
+            'victories': 0,
+            'duration_sum': 0,
+            'best_time': None,
+            'by_difficulty': {}
+        }
+    
+    @classmethod
+    def _empty_aggregates(cls, compacted_until=None):
+        """Retourne des agrégats vides."""
+        return {
+            'offset': 0,  # Octets de l'historique déjà pris en compte
+            'compacted_until': compacted_until,  # Parties antérieures ignorées (déjà cumulées)
+            **cls._empty_counts()
+        }
+    
+    @staticmethod
+    def _merge_counts(target, source):
+        """Ajoute des compteurs à d'autres, globalement et par difficulté."""
+        pairs = [(target, source)]
+        for difficulty, diff_stats in source['by_difficulty'].items():
+            pairs.append((target['by_difficulty'].setdefault(difficulty, {
+                'total_games': 0,
+                'victories': 0,
+                'duration_sum': 0,
+                'best_time': None
+            }), diff_stats))
+        for into, counts in pairs:
+            into['total_games'] += counts['total_games']
+            into['victories'] += counts['victories']
+            into['duration_sum'] += counts['duration_sum']
+            if counts['best_time'] is not None and (into['best_time'] is None or counts['best_time'] < into['best_time']):
+                into['best_time'] = counts['best_time']
+    
+    @staticmethod
+    def _add_to_aggregates(aggregates, game):
+        """Ajoute une partie aux agrégats globaux et à ceux de sa difficulté."""
+        duration = game.get('duration') or 0
+        victory = game.get('result') == 'victory'
+        diff_stats = aggregates['by_difficulty'].setdefault(game.get('difficulty'), {
+            'total_games': 0,
+            'victories': 0,
+            'duration_sum': 0,
+            'best_time': None
+        })
+        for target in (aggregates, diff_stats):
+            target['total_games'] += 1
+            target['duration_sum'] += duration
+            if victory:
+                target['victories'] += 1
+                if target['best_time'] is None or duration < target['best_time']:
+                    target['best_time'] = duration
+    
+    def _get_aggregates(self):
+        """
+        Charge les agrégats et les complète avec les parties ajoutées depuis.
+        
+        Les agrégats mémorisent la position atteinte dans l'historique : seules
+        les lignes écrites après cette position sont relues. Si l'historique
+        est plus court que prévu (fichier remplacé) ou a été compacté depuis,
+        ils sont recalculés ; les parties déjà cumulées n'y sont pas comptées.
+        
+        Returns:
+            dict: Les agrégats à jour
+        """
+        if self._aggregates is None:
+            try:
+                with open(self.summary_file, 'r') as f:
+                    self._aggregates = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._aggregates = self._empty_aggregates()
+        
+        aggregates = self._aggregates
+        cutoff = self._get_rollups()['compacted_until']
+        size = os.path.getsize(self.save_file) if os.path.exists(self.save_file) else 0
+        if size < aggregates['offset'] or aggregates.get('compacted_until') != cutoff:
+            aggregates = self._aggregates = self._empty_aggregates(cutoff)
+        if size > aggregates['offset']:
+            with open(self.save_file, 'rb') as f:
+                f.seek(aggregates['offset'])
+                data = f.read()
+            # Ne prendre en compte que les lignes complètes
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                try:
+                    game = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                if cutoff is None or game.get('date', "") >= cutoff:
+                    self._add_to_aggregates(aggregates, game)
+            if end:
+                aggregates['offset'] += end
+                self._save_aggregates()
+        return aggregates
+    
+    def _save_aggregates(self):
+        """Écrit les agrégats de manière atomique à côté de l'historique."""
+        temp_file = self.summary_file + ".tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(self._aggregates, f)
+            os.replace(temp_file, self.summary_file)
+        except OSError as e:
+            print(f"Erreur lors de la sauvegarde du résumé des statistiques : {e}")
+    
+    def _get_rollups(self):
+        """
+        Charge les cumuls des parties compactées.
+        
+        Returns:
+            dict: Compteurs globaux et par difficulté, cumuls par jour (days),
+                date limite du dernier compactage (compacted_until) et jour
+                de ce compactage (last_compaction)
+        """
+        # Relire le fichier s'il a été modifié (compactage par une autre instance)
+        try:
+            stamp = os.stat(self.rollups_file).st_mtime_ns
+        except OSError:
+            stamp = None
+        if self._rollups is None or stamp != self._rollups_stamp:
+            self._rollups_stamp = stamp
+            try:
+                with open(self.rollups_file, 'r') as f:
+                    self._rollups = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._rollups = {'compacted_until': None, 'last_compaction': None, 'days': {},
+                                 **self._empty_counts()}
+        return self._rollups
+    
+    def _save_rollups(self):
+        """Écrit les cumuls de manière atomique et durable (ils remplacent des parties)."""
+        temp_file = self.rollups_file + ".tmp"
+        with open(temp_file, 'w') as f:
+            json.dump(self._rollups, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.rollups_file)
+        self._rollups_stamp = os.stat(self.rollups_file).st_mtime_ns
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande : compacte un historique."""
+    parser = argparse.ArgumentParser(description="Compactage de l'historique des statistiques")
+    parser.add_argument('history', nargs='?', default="game_stats.jsonl", help="Historique JSON Lines")
+    parser.add_argument('--keep-days', type=int, default=RETENTION_DAYS,
+                        help="Durée de conservation des parties détaillées, en jours")
+    parser.add_argument('--keep-games', type=int, default=10,
+                        help="Nombre minimal de parties détaillées conservées")
+    args = parser.parse_args(argv)
+    
+    stats = GameStats(args.history, keep_games=args.keep_games)
+    rolled = stats.compact(args.keep_days)
+    print(f"{rolled} parties regroupées dans {stats.rollups_file}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
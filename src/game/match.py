@@ -0,0 +1,304 @@
+import random
+import time
+
+from .board import Board
+from .ai_player import AIPlayer
+from .placement import FleetPlacer
+from .rules import DEFAULT_RULES
+
+
+def derive_rng(seed, stream):
+    """
+    Crée un générateur aléatoire propre à un usage, dérivé d'une graine de partie.
+
+    Chaque flotte et chaque IA tire ses nombres de son propre flux : une IA
+    peut ainsi être recréée seule lors d'un rejeu, sans refaire les placements.
+
+    Args:
+        seed (int ou str): Graine de la partie
+        stream (str): Nom du flux ('fleet0', 'ai1', ...)
+
+    Returns:
+        random.Random: Générateur déterministe
+    """
+    return random.Random(f"{seed}:{stream}")
+
+
+def player_label(player):
+    """Nom d'un tireur dans un journal de partie (difficulté pour une IA)."""
+    if player is None:
+        return "humain"
+    return getattr(player, 'difficulty', type(player).__name__)
+
+
+def place_fleet_randomly(board, ships, rng=random):
+    """
+    Place une flotte de manière aléatoire sur un plateau.
+
+    Args:
+        board (Board): Le plateau sur lequel placer les navires
+        ships (list): Les navires à placer, dans l'ordre de board.rules.fleet
+        rng (random.Random): Générateur aléatoire à utiliser
+
+    Raises:
+        ValueError: Si la flotte ne peut pas être placée sur le plateau
+    """
+    if not FleetPlacer(board.rules).place(board, ships, rng):
+        raise ValueError("Impossible de placer la flotte sur le plateau")
+
+
+class ScriptedPlayer:
+    """
+    Joueur qui rejoue une liste de tirs prédéfinie.
+
+    Il expose la même interface que AIPlayer (get_move, notify_hit et
+    notify_sunk), ce qui permet de l'opposer à une IA dans un Match.
+
+    Attributes:
+        moves (list): Liste des tirs (x, y) à jouer dans l'ordre
+        results (list): Résultats reçus pour chaque tir (x, y, is_hit)
+    """
+
+    def __init__(self, moves):
+        """
+        Initialise un joueur scripté.
+
+        Args:
+            moves (iterable): Tirs (x, y) à jouer dans l'ordre
+        """
+        self.moves = list(moves)
+        self.results = []
+        self._next = 0
+
+    def get_move(self, target_board):
+        """
+        Retourne le prochain tir du script.
+
+        Args:
+            target_board (Board): Le plateau visé (non utilisé)
+
+        Returns:
+            tuple: Coordonnées du tir (x, y)
+        """
+        if self._next >= len(self.moves):
+            raise IndexError("Le script de tirs est épuisé")
+        move = self.moves[self._next]
+        self._next += 1
+        return move
+
+    def notify_hit(self, x, y, is_hit):
+        """Enregistre le résultat d'un tir."""
+        self.results.append((x, y, is_hit))
+
+    def notify_sunk(self, ship):
+        """Ignore les navires coulés : le script ne s'adapte pas."""
+
+
+class Match:
+    """
+    Moteur de partie indépendant de l'interface graphique.
+
+    Le joueur 0 tire sur le plateau du joueur 1 et inversement. Le joueur 0
+    commence, comme dans GameWindow. Un joueur vaut None lorsque ses tirs
+    sont fournis de l'extérieur (joueur humain), sinon il doit exposer
+    get_move(board), notify_hit(x, y, is_hit) et notify_sunk(ship).
+
+    Attributes:
+        boards (list): Plateaux des deux joueurs [plateau 0, plateau 1]
+        players (list): Tireurs des deux joueurs (AIPlayer, ScriptedPlayer ou None)
+        turn (int): Joueur dont c'est le tour (0 ou 1)
+        shots (list): Nombre de tirs valides de chaque joueur
+        hits (list): Nombre de tirs réussis de chaque joueur
+        sunk_ships (list): Navires coulés par chaque joueur
+        winner (int): Joueur gagnant, None tant que la partie n'est pas finie
+        log (MoveLog): Journal recevant chaque tir, None pour ne rien enregistrer
+    """
+
+    def __init__(self, boards, players, log=None):
+        """
+        Initialise une partie à partir de plateaux déjà remplis.
+
+        Args:
+            boards (list): Les deux plateaux, navires placés
+            players (list): Les deux tireurs (ou None pour un joueur externe)
+            log (MoveLog): Journal de partie optionnel
+        """
+        self.boards = boards
+        self.players = players
+        self.log = log
+        self.turn = 0
+        self.shots = [0, 0]
+        self.hits = [0, 0]
+        self.sunk_ships = [[], []]
+        self.winner = None
+
+    def fire(self, side, x, y, elapsed_ms=None):
+        """
+        Effectue le tir d'un joueur sur le plateau adverse.
+
+        Le tour passe à l'adversaire si le tir est valide. Le tireur est
+        notifié du résultat, et du navire éventuellement coulé, s'il
+        s'agit d'une IA. Le tir est ajouté au journal, même s'il est invalide.
+
+        Args:
+            side (int): Joueur qui tire (0 ou 1)
+            x (int): Coordonnée x du tir
+            y (int): Coordonnée y du tir
+            elapsed_ms (float): Temps de réflexion du tireur, pour le journal
+
+        Returns:
+            dict: Issue du tir
+                - result (bool ou None): Résultat de Board.receive_shot
+                - sunk (Ship ou None): Navire coulé par ce tir
+                - game_over (bool): True si ce tir termine la partie
+        """
+        outcome = self._resolve(side, x, y)
+        if self.log is not None:
+            self.log.shot(side, x, y, outcome, elapsed_ms)
+        return outcome
+
+    def _resolve(self, side, x, y):
+        """Applique un tir au plateau adverse et retourne son issue."""
+        target = self.boards[1 - side]
+        result = target.receive_shot(x, y)
+        outcome = {'result': result, 'sunk': None, 'game_over': False}
+        if result is None:
+            return outcome
+
+        self.shots[side] += 1
+        player = self.players[side]
+        if player is not None:
+            player.notify_hit(x, y, result)
+
+        if result:
+            self.hits[side] += 1
+            sunk_ship = target.check_sunk_ship(x, y)
+            if sunk_ship:
+                self.sunk_ships[side].append(sunk_ship)
+                outcome['sunk'] = sunk_ship
+                if player is not None:
+                    player.notify_sunk(sunk_ship)
+            if target.all_ships_sunk():
+                self.winner = side
+                outcome['game_over'] = True
+
+        self.turn = 1 - side
+        return outcome
+
+    def play_turn(self):
+        """
+        Fait jouer le tireur dont c'est le tour.
+
+        Un tir invalide (case déjà ciblée) fait tout de même passer le tour,
+        comme dans GameWindow.play_ai_turn.
+
+        Returns:
+            tuple: ((x, y), issue du tir)
+        """
+        side = self.turn
+        start = time.perf_counter()
+        x, y = self.players[side].get_move(self.boards[1 - side])
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        outcome = self.fire(side, x, y, elapsed_ms)
+        if outcome['result'] is None:
+            self.turn = 1 - side
+        return (x, y), outcome
+
+    def play(self, max_turns=None):
+        """
+        Joue la partie jusqu'à la victoire d'un joueur.
+
+        Args:
+            max_turns (int): Nombre maximal de tours avant abandon
+                (par défaut deux fois le nombre de cases d'un plateau)
+
+        Returns:
+            dict: Résultat de la partie
+                - winner (int ou None): Joueur gagnant
+                - turns (int): Nombre de tours joués
+                - shots (list): Nombre de tirs valides de chaque joueur
+                - hits (list): Nombre de tirs réussis de chaque joueur
+        """
+        if max_turns is None:
+            max_turns = 2 * self.boards[0].size * self.boards[0].size
+        turns = 0
+        while self.winner is None and turns < max_turns:
+            self.play_turn()
+            turns += 1
+        return {
+            'winner': self.winner,
+            'turns': turns,
+            'shots': list(self.shots),
+            'hits': list(self.hits)
+        }
+
+
+def new_match(players, rules=None, seed=None, log=None):
+    """
+    Prépare une partie avec deux flottes placées aléatoirement.
+
+    Args:
+        players (list): Les deux tireurs
+        rules (GameRules): Règles de la partie (10x10 réglementaire par défaut)
+        seed (int ou str): Graine des placements (module random global si None)
+        log (MoveLog): Journal recevant les règles, les flottes et chaque tir
+
+    Returns:
+        Match: La partie prête à être jouée
+    """
+    rules = rules or DEFAULT_RULES
+    boards = [Board(rules), Board(rules)]
+    for side, board in enumerate(boards):
+        rng = random if seed is None else derive_rng(seed, f"fleet{side}")
+        place_fleet_randomly(board, rules.create_fleet(), rng)
+    if log is not None:
+        log.start(rules, seed, [player_label(player) for player in players])
+        for side, board in enumerate(boards):
+            log.fleet(side, board)
+    return Match(boards, players, log)
+
+
+def play_ai_match(difficulty_a="moyen", difficulty_b="moyen", rules=None, seed=None, log=None):
+    """
+    Joue une partie complète entre deux IA.
+
+    L'IA 'expert' n'a pas de limite de temps mais AIPlayer.HEADLESS_SAMPLES
+    échantillons par coup : à graine égale, la partie est identique sur
+    toutes les machines.
+
+    Args:
+        difficulty_a (str): Difficulté de l'IA 0 (qui commence)
+        difficulty_b (str): Difficulté de l'IA 1
+        rules (GameRules): Règles de la partie
+        seed (int ou str): Graine de la partie, qui la rend reproductible
+        log (MoveLog): Journal de partie optionnel
+
+    Returns:
+        dict: Résultat de la partie (voir Match.play)
+    """
+    players = []
+    for side, difficulty in enumerate((difficulty_a, difficulty_b)):
+        rng = random if seed is None else derive_rng(seed, f"ai{side}")
+        players.append(AIPlayer(difficulty, rules, time_budget_ms=None, rng=rng,
+                                max_samples=AIPlayer.HEADLESS_SAMPLES))
+    match = new_match(players, rules, seed, log)
+    return match.play()
+
+
+def run_batch(count, difficulty_a="moyen", difficulty_b="moyen", seed=None, rules=None):
+    """
+    Enchaîne plusieurs parties IA contre IA sans interface graphique.
+
+    Args:
+        count (int): Nombre de parties à jouer
+        difficulty_a (str): Difficulté de l'IA 0
+        difficulty_b (str): Difficulté de l'IA 1
+        seed (int): Graine du lot ; la partie i reçoit la graine f"{seed}:{i}"
+        rules (GameRules): Règles de la partie
+
+    Returns:
+        list: Résultats des parties (voir Match.play)
+    """
+    return [play_ai_match(difficulty_a, difficulty_b, rules,
+                          None if seed is None else f"{seed}:{index}")
+            for index in range(count)]
@@ -0,0 +1,230 @@
+import random
+import time
+
+from .placement import segment_index
+
+
+class MonteCarloTargeter:
+    """
+    Ciblage par échantillonnage de flottes cachées compatibles.
+
+    Chaque échantillon place les navires non coulés de façon à couvrir
+    toutes les cases touchées non coulées, sans chevaucher les tirs manqués
+    ni les navires coulés, en appliquant les mêmes règles de placement que
+    Board.place_ship (limites, chevauchement, non-contact éventuel). Les
+    échantillons sont pondérés pour suivre la loi a posteriori (toutes les
+    flottes compatibles équiprobables) ; la case non ciblée de plus forte
+    probabilité d'occupation est jouée.
+
+    La recherche est « anytime » : elle s'affine tant que le budget de
+    temps n'est pas écoulé, puis rend le meilleur coup connu. Sans budget
+    de temps, elle s'arrête après un nombre fixe d'échantillons : le coup ne
+    dépend alors que du générateur aléatoire, pas de la vitesse de la machine.
+
+    Attributes:
+        rules (GameRules): Règles de la partie
+        remaining (list): Tailles des navires non coulés
+        last_search (dict): Mesures de la dernière recherche
+            - samples (int): Échantillons valides obtenus
+            - rejected (int): Tentatives d'échantillon abandonnées
+            - elapsed_ms (float): Durée de la recherche
+            - samples_per_sec (float): Débit d'échantillonnage
+            - stop_reason (str): 'budget', 'max_samples', 'max_rejected',
+              'cancelled' ou 'no_sample'
+    """
+
+    # Échantillons abandonnés tolérés par échantillon demandé (borne la recherche sans budget de temps)
+    MAX_REJECTED_PER_SAMPLE = 20
+
+    def __init__(self, rules, rng=random):
+        """
+        Initialise le ciblage pour une flotte adverse intacte.
+
+        Args:
+            rules (GameRules): Règles de la partie
+            rng (random.Random): Générateur aléatoire à utiliser
+        """
+        self.rules = rules
+        self.rng = rng
+        self.remaining = list(rules.ship_sizes)
+        self.last_search = None
+        self._shot = 0          # Cases déjà ciblées
+        self._hits = 0          # Touches n'appartenant pas à un navire coulé
+        self._blocked = 0       # Cases où aucun navire restant ne peut se trouver
+
+    def record_shot(self, x, y, is_hit):
+        """
+        Met à jour l'état connu après un tir.
+
+        Args:
+            x (int): Coordonnée x du tir
+            y (int): Coordonnée y du tir
+            is_hit (bool): True si le tir a touché un navire
+        """
+        bit = 1 << (y * self.rules.board_size + x)
+        self._shot |= bit
+        if is_hit:
+            self._hits |= bit
+        else:
+            self._blocked |= bit
+
+    def record_sunk(self, ship):
+        """
+        Retire un navire coulé des navires à chercher.
+
+        Args:
+            ship (Ship): Le navire coulé, avec sa position
+        """
+        index = segment_index(self.rules.board_size, ship.size)
+        segment = index.find(*ship.position)
+        self._hits &= ~index.masks[segment]
+        self._blocked |= self._occupied_mask(index, segment)
+        if ship.size in self.remaining:
+            self.remaining.remove(ship.size)
+
+    def _occupied_mask(self, index, segment):
+        """Cases rendues indisponibles par un navire (halo compris en non-contact)."""
+        return index.halos[segment] if self.rules.no_touch else index.masks[segment]
+
+    def _free_segments(self):
+        """
+        Segments où chaque taille restante peut se trouver hors des touches.
+
+        Returns:
+            dict: Pour chaque taille restante, la liste des segments qui
+            n'empiètent sur aucune case ciblée ni aucun navire coulé
+        """
+        size = self.rules.board_size
+        forbidden = self._shot | self._blocked
+        free = {}
+        for length in set(self.remaining):
+            masks = segment_index(size, length).masks
+            free[length] = [segment for segment, mask in enumerate(masks) if not mask & forbidden]
+        return free
+
+    def _sample(self, free):
+        """
+        Tire une flotte cachée compatible avec les observations, avec son poids.
+
+        Les navires qui couvrent les touches non coulées sont choisis un à un
+        parmi les options possibles (la touche la plus basse d'abord), puis
+        chaque autre navire est tiré uniformément dans free, indépendamment
+        des autres ; une flotte où deux navires se chevauchent (ou se
+        touchent en non-contact) est rejetée. Une flotte compatible n'est
+        produite que par un seul chemin, avec une probabilité égale à
+        l'inverse du produit des nombres d'options (segments de free compris
+        pour les navires tirés librement) : ce produit est son poids, et les
+        échantillons pondérés suivent la loi uniforme sur les flottes
+        compatibles.
+
+        Args:
+            free (dict): Segments possibles de chaque taille (voir _free_segments)
+
+        Returns:
+            tuple ou None: (cases de chaque navire placé, poids), None si
+            l'échantillon est rejeté
+        """
+        rng = self.rng
+        size = self.rules.board_size
+        uncovered = self._hits
+        forbidden = self._blocked  # Tirs manqués, navires coulés et navires déjà posés
+        sizes = list(self.remaining)
+        ships = []
+        weight = 1
+
+        # D'abord couvrir chaque touche non coulée par un navire restant
+        while uncovered:
+            cell = (uncovered & -uncovered).bit_length() - 1
+            options = []
+            for position, length in enumerate(sizes):
+                index = segment_index(size, length)
+                masks = index.masks
+                for segment in index.covering[cell]:
+                    if not masks[segment] & forbidden:
+                        options.append((position, index, segment))
+            if not options:
+                return None
+            weight *= len(options)
+            position, index, segment = rng.choice(options)
+            del sizes[position]
+            ships.append(index.cells[segment])
+            forbidden |= self._occupied_mask(index, segment)
+            uncovered &= ~index.masks[segment]
+
+        # Puis tirer les navires restants sur des cases jamais ciblées
+        for length in sizes:
+            segments = free[length]
+            if not segments:
+                return None
+            index = segment_index(size, length)
+            segment = rng.choice(segments)
+            if index.masks[segment] & forbidden:
+                return None
+            weight *= len(segments)
+            ships.append(index.cells[segment])
+            forbidden |= self._occupied_mask(index, segment)
+        return ships, weight
+
+    def best_cell(self, time_budget_ms=50, max_samples=5000, stop_event=None):
+        """
+        Échantillonne jusqu'à épuisement du budget et retourne la meilleure case.
+
+        Args:
+            time_budget_ms (float): Temps de recherche maximal, en millisecondes
+                (None : pas de limite de temps, recherche reproductible)
+            max_samples (int): Nombre d'échantillons au-delà duquel on s'arrête
+            stop_event (threading.Event): Interrompt la recherche lorsqu'il est levé
+
+        Returns:
+            tuple ou None: Coordonnées (x, y), None si aucun échantillon n'a abouti
+        """
+        size = self.rules.board_size
+        counts = [0] * (size * size)
+        shot = self._shot
+        samples = rejected = 0
+        start = time.perf_counter()
+        deadline = None if time_budget_ms is None else start + time_budget_ms / 1000
+        max_rejected = self.MAX_REJECTED_PER_SAMPLE * max_samples
+        free = self._free_segments()
+        stop_reason = 'max_samples'
+
+        while samples < max_samples:
+            # Vérifier le budget et l'annulation tous les 16 essais
+            if (samples + rejected) % 16 == 0:
+                if stop_event is not None and stop_event.is_set():
+                    stop_reason = 'cancelled'
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    stop_reason = 'budget'
+                    break
+                if rejected >= max_rejected:
+                    stop_reason = 'max_rejected'
+                    break
+            sample = self._sample(free)
+            if sample is None:
+                rejected += 1
+                continue
+            ships, weight = sample
+            samples += 1
+            for cells in ships:
+                for cell in cells:
+                    if not shot >> cell & 1:
+                        counts[cell] += weight
+
+        elapsed = time.perf_counter() - start
+        best = None
+        if samples:
+            best = max((cell for cell in range(size * size) if not shot >> cell & 1),
+                       key=counts.__getitem__, default=None)
+        else:
+            stop_reason = 'no_sample'
+        self.last_search = {
+            'samples': samples,
+            'rejected': rejected,
+            'elapsed_ms': round(elapsed * 1000, 3),
+            'samples_per_sec': round(samples / elapsed, 1) if elapsed > 0 else 0.0,
+            'stop_reason': stop_reason
+        }
+        if best is None:
+            return None
+        return best % size, best // size
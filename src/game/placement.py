@@ -0,0 +1,321 @@
+import random
+from functools import lru_cache
+
+from .rules import DEFAULT_RULES
+
+
+class SegmentIndex:
+    """
+    Index précalculé de tous les segments d'une taille donnée sur un plateau.
+
+    Un segment est identifié par son rang dans positions. Pour chacun, le
+    masque de ses cases, son halo (règle de non-contact) et la liste de ses
+    cases sont calculés une fois ; l'index inverse covering donne, pour
+    chaque case, les segments qui la couvrent, ce qui permet de n'invalider
+    que les segments touchés par un nouveau tir.
+
+    Attributes:
+        board_size (int): Taille du plateau
+        length (int): Taille des segments
+        positions (tuple): Position (x, y, horizontal) de chaque segment
+        masks (tuple): Masque des cases de chaque segment, bit y * board_size + x
+        halos (tuple): Masque de chaque segment agrandi d'une case
+        cells (tuple): Indices des cases de chaque segment
+        covering (tuple): Pour chaque case, les segments qui la couvrent
+    """
+
+    def __init__(self, board_size, length):
+        """
+        Énumère les segments, horizontaux puis verticaux à chaque case.
+
+        Args:
+            board_size (int): Taille du plateau
+            length (int): Taille des segments
+        """
+        self.board_size = board_size
+        self.length = length
+        positions = []
+        cells = []
+        covering = [[] for _ in range(board_size * board_size)]
+        for y in range(board_size):
+            for x in range(board_size):
+                start = y * board_size + x
+                if x + length <= board_size:
+                    positions.append((x, y, True))
+                    cells.append(tuple(range(start, start + length)))
+                if length > 1 and y + length <= board_size:
+                    positions.append((x, y, False))
+                    cells.append(tuple(range(start, start + length * board_size, board_size)))
+        for segment, segment_cells in enumerate(cells):
+            for cell in segment_cells:
+                covering[cell].append(segment)
+
+        self.positions = tuple(positions)
+        self.cells = tuple(cells)
+        self.covering = tuple(tuple(segments) for segments in covering)
+        self.masks = tuple(segment_mask(board_size, length, *position) for position in positions)
+        self.halos = tuple(segment_halo(board_size, length, *position) for position in positions)
+        self._ids = {position: segment for segment, position in enumerate(positions)}
+
+    def __len__(self):
+        """Nombre de segments."""
+        return len(self.positions)
+
+    def find(self, x, y, horizontal):
+        """
+        Retourne l'identifiant du segment partant d'une case.
+
+        Args:
+            x (int): Coordonnée x de la première case
+            y (int): Coordonnée y de la première case
+            horizontal (bool): Orientation du segment
+
+        Returns:
+            int ou None: Identifiant du segment, None s'il sort du plateau
+        """
+        # Une taille 1 n'a qu'une orientation, enregistrée comme horizontale
+        return self._ids.get((x, y, bool(horizontal) or self.length == 1))
+
+
+@lru_cache(maxsize=None)
+def segment_index(board_size, length):
+    """
+    Retourne l'index des segments d'une taille, construit une seule fois.
+
+    Args:
+        board_size (int): Taille du plateau
+        length (int): Taille des segments
+
+    Returns:
+        SegmentIndex: L'index partagé pour ce plateau et cette taille
+    """
+    return SegmentIndex(board_size, length)
+
+
+def candidate_positions(board_size, length):
+    """
+    Liste toutes les positions possibles d'un navire sur un plateau vide.
+
+    Args:
+        board_size (int): Taille du plateau
+        length (int): Taille du navire
+
+    Returns:
+        tuple: Positions (x, y, horizontal) dans les limites du plateau
+    """
+    return segment_index(board_size, length).positions
+
+
+@lru_cache(maxsize=None)
+def _base_masks(board_size, length):
+    """Masques (horizontal, vertical) d'un segment partant de la case (0, 0)."""
+    horizontal = (1 << length) - 1
+    vertical = 0
+    for i in range(length):
+        vertical |= 1 << (i * board_size)
+    return horizontal, vertical
+
+
+def segment_mask(board_size, length, x, y, horizontal):
+    """
+    Calcule le masque des cases d'un segment supposé dans le plateau.
+
+    Returns:
+        int: Masque des cases, bit y * board_size + x
+    """
+    horizontal_mask, vertical_mask = _base_masks(board_size, length)
+    return (horizontal_mask if horizontal else vertical_mask) << (y * board_size + x)
+
+
+def segment_halo(board_size, length, x, y, horizontal):
+    """
+    Calcule le masque d'un segment et de toutes les cases qui le touchent
+    (diagonales comprises), utilisé par la règle de non-contact.
+
+    Returns:
+        int: Masque du rectangle englobant le segment agrandi d'une case
+    """
+    width, height = (length, 1) if horizontal else (1, length)
+    x0, y0 = max(x - 1, 0), max(y - 1, 0)
+    x1, y1 = min(x + width, board_size - 1), min(y + height, board_size - 1)
+    row = ((1 << (x1 - x0 + 1)) - 1) << x0
+    mask = 0
+    for row_y in range(y0, y1 + 1):
+        mask |= row << (row_y * board_size)
+    return mask
+
+
+class FleetPlacer:
+    """
+    Générateur de placements aléatoires pour une flotte complète.
+
+    La flotte est tirée uniformément parmi les placements légaux complets :
+    chaque navire reçoit une position uniforme parmi toutes celles du
+    plateau, et la flotte entière est rejetée dès qu'un navire chevauche
+    (ou touche, en non-contact) un navire précédent ou une case interdite.
+    Chaque flotte légale a donc la même probabilité. Sur le plateau
+    réglementaire, un peu plus d'une flotte sur quatre est acceptée
+    (une sur soixante-dix en non-contact).
+
+    Si FLEET_TRIES flottes sont rejetées (plateau très encombré), la
+    génération se rabat sur une recherche avec retour arrière : chaque
+    navire, du plus grand au plus petit, est tiré parmi ses positions
+    encore légales. Elle trouve une solution s'il en existe une, en temps
+    borné, mais n'est plus exactement uniforme sur les flottes complètes
+    (uniform vaut alors False).
+
+    Attributes:
+        rules (GameRules): Règles de la partie (taille, flotte, non-contact)
+        max_steps (int): Nombre maximal de positions essayées par la
+            recherche avec retour arrière
+        status (str): Issue de la dernière génération : 'ok', 'infeasible'
+            (recherche exhaustive sans solution) ou 'budget' (budget épuisé)
+        uniform (bool): True si la dernière flotte a été tirée uniformément
+    """
+
+    # Flottes complètes tirées par rejet avant la recherche avec retour arrière
+    FLEET_TRIES = 5000
+
+    # Tirages par rejet d'un navire avant d'énumérer ses positions légales (retour arrière)
+    REJECTION_TRIES = 32
+
+    def __init__(self, rules=None, max_steps=100000):
+        """
+        Initialise le générateur.
+
+        Args:
+            rules (GameRules): Règles de la partie (10x10 réglementaire par défaut)
+            max_steps (int): Budget de positions essayées avant abandon
+        """
+        self.rules = rules or DEFAULT_RULES
+        self.max_steps = max_steps
+        self.status = None
+        self.uniform = None
+        self._steps = 0
+
+    def generate(self, rng=random, blocked=0):
+        """
+        Tire un placement complet de la flotte.
+
+        Args:
+            rng (random.Random): Générateur aléatoire à utiliser
+            blocked (int): Masque de cases interdites (tirs déjà connus, etc.)
+
+        Returns:
+            list ou None: Une position (x, y, horizontal) par navire, dans
+                l'ordre de rules.fleet, ou None si la flotte ne peut pas être
+                placée (ou si le budget de recherche est épuisé)
+        """
+        sizes = self.rules.ship_sizes
+        order = sorted(range(len(sizes)), key=lambda i: -sizes[i])
+        # Cases de navire restant à poser après chaque profondeur
+        self._needed = [sum(sizes[i] for i in order[depth:]) for depth in range(len(order) + 1)]
+        board_size = self.rules.board_size
+        if board_size * board_size - blocked.bit_count() >= self._needed[0]:
+            positions = self._sample_fleet(order, blocked, rng)
+            if positions is not None:
+                self.status = 'ok'
+                self.uniform = True
+                return positions
+
+        positions = [None] * len(sizes)
+        self._steps = 0
+        self.uniform = False
+        if self._place(order, 0, blocked, positions, rng):
+            self.status = 'ok'
+            return positions
+        self.status = 'budget' if self._steps > self.max_steps else 'infeasible'
+        return None
+
+    def _sample_fleet(self, order, blocked, rng):
+        """Tire des flottes complètes jusqu'à en obtenir une légale (None après FLEET_TRIES)."""
+        board_size = self.rules.board_size
+        no_touch = self.rules.no_touch
+        sizes = self.rules.ship_sizes
+        indexes = [segment_index(board_size, sizes[ship]) for ship in order]
+        if not all(len(index) for index in indexes):
+            return None
+        for _ in range(self.FLEET_TRIES):
+            occupied = blocked
+            chosen = []
+            for index in indexes:
+                segment = rng.randrange(len(index))
+                if index.masks[segment] & occupied:
+                    break
+                occupied |= index.halos[segment] if no_touch else index.masks[segment]
+                chosen.append(index.positions[segment])
+            else:
+                positions = [None] * len(sizes)
+                for ship, position in zip(order, chosen):
+                    positions[ship] = position
+                return positions
+        return None
+
+    def _place(self, order, depth, blocked, positions, rng):
+        """Place récursivement les navires order[depth:] ; True si réussi."""
+        if depth == len(order):
+            return True
+        board_size = self.rules.board_size
+        # Élagage : plus assez de cases libres pour les navires restants
+        if board_size * board_size - blocked.bit_count() < self._needed[depth]:
+            return False
+        length = self.rules.ship_sizes[order[depth]]
+        index = segment_index(board_size, length)
+        masks = index.masks
+        count = len(index)
+        if not count:
+            return False
+
+        # Tirage par rejet : uniforme parmi les positions légales
+        tried = set()
+        for _ in range(self.REJECTION_TRIES):
+            self._steps += 1
+            segment = rng.randrange(count)
+            if segment in tried:
+                continue
+            tried.add(segment)
+            if not masks[segment] & blocked:
+                if self._try(order, depth, blocked, positions, rng, index, segment):
+                    return True
+            if self._steps > self.max_steps:
+                return False
+
+        # Plateau encombré : énumérer les positions légales restantes
+        legal = [segment for segment in range(count)
+                 if segment not in tried and not masks[segment] & blocked]
+        rng.shuffle(legal)
+        for segment in legal:
+            self._steps += 1
+            if self._steps > self.max_steps:
+                return False
+            if self._try(order, depth, blocked, positions, rng, index, segment):
+                return True
+        return False
+
+    def _try(self, order, depth, blocked, positions, rng, index, segment):
+        """Pose un navire sur un segment puis tente de placer les suivants."""
+        occupied = index.halos[segment] if self.rules.no_touch else index.masks[segment]
+        positions[order[depth]] = index.positions[segment]
+        if self._place(order, depth + 1, blocked | occupied, positions, rng):
+            return True
+        positions[order[depth]] = None
+        return False
+
+    def place(self, board, ships, rng=random):
+        """
+        Place une flotte sur un plateau vide.
+
+        Args:
+            board (Board): Le plateau sur lequel placer les navires
+            ships (list): Les navires, dans l'ordre de rules.fleet
+            rng (random.Random): Générateur aléatoire à utiliser
+
+        Returns:
+            bool: True si la flotte a été placée, False si c'est impossible
+        """
+        positions = self.generate(rng)
+        if positions is None:
+            return False
+        for ship, (x, y, horizontal) in zip(ships, positions):
+            board.place_ship(ship, x, y, horizontal)
+        return True
@@ -0,0 +1,196 @@
+"""
+Instrumentation optionnelle des étapes de la partie.
+
+Les méthodes à mesurer sont remplacées, sur leur classe, par une version
+chronométrée : sans instrumentation, le code du jeu n'a aucun surcoût.
+Chaque appel devient un intervalle (nom, catégorie, début, durée, thread),
+conservé dans un tampon borné et exportable au format Chrome trace
+(à ouvrir dans chrome://tracing ou https://ui.perfetto.dev).
+
+Exemple :
+    profiler = Profiler()
+    instrument_game(profiler)
+    ...
+    profiler.write_chrome_trace("trace.json")
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from .ai_player import AIPlayer
+from .board import Board
+from .game_stats import GameStats
+from .stats_db import SQLiteGameStats
+
+# Méthodes mesurées par instrument_game : (classe, noms, catégorie)
+GAME_HOOKS = (
+    (AIPlayer, ("get_move",), "ia"),
+    (Board, ("receive_shot", "check_sunk_ship"), "plateau"),
+    (GameStats, ("save_game_stats", "get_stats_summary"), "stats"),
+    (SQLiteGameStats, ("save_game_stats", "get_stats_summary"), "stats"),
+)
+
+
+class Profiler:
+    """
+    Collecte les durées des étapes instrumentées.
+
+    Les intervalles peuvent être enregistrés depuis n'importe quel thread
+    (le calcul des coups de l'IA tourne hors du thread de Tk).
+
+    Attributes:
+        events (deque): Intervalles (nom, catégorie, début, durée, thread),
+            en secondes de perf_counter ; les plus anciens sont oubliés
+        max_events (int): Nombre d'intervalles conservés
+    """
+
+    def __init__(self, max_events=100_000):
+        """
+        Initialise un profileur vide.
+
+        Args:
+            max_events (int): Nombre d'intervalles conservés
+        """
+        self.max_events = max_events
+        self.events = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+        self._originals = []
+
+    def record(self, name, category, start, duration):
+        """
+        Enregistre un intervalle mesuré.
+
+        Args:
+            name (str): Nom de l'étape ('Board.receive_shot', ...)
+            category (str): Catégorie de l'étape ('ia', 'plateau', 'ui', ...)
+            start (float): Début, en secondes de time.perf_counter
+            duration (float): Durée, en secondes
+        """
+        self.events.append((name, category, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def span(self, name, category):
+        """Mesure le bloc with comme une étape."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter() - start)
+
+    def wrap(self, function, name, category):
+        """
+        Retourne une version chronométrée d'une fonction.
+
+        Args:
+            function (callable): La fonction à mesurer
+            name (str): Nom de l'étape
+            category (str): Catégorie de l'étape
+
+        Returns:
+            callable: Fonction de même signature, qui enregistre chaque appel
+        """
+        record = self.record
+        clock = time.perf_counter
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, category, start, clock() - start)
+
+        return timed
+
+    def instrument(self, owner, names, category):
+        """
+        Remplace des méthodes d'une classe par leur version chronométrée.
+
+        Args:
+            owner (type): La classe dont les méthodes sont mesurées
+            names (iterable): Noms des méthodes
+            category (str): Catégorie des étapes
+        """
+        for name in names:
+            original = owner.__dict__[name]
+            self._originals.append((owner, name, original))
+            setattr(owner, name, self.wrap(original, f"{owner.__name__}.{name}", category))
+
+    def restore(self):
+        """Rétablit toutes les méthodes instrumentées, dans l'ordre inverse."""
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def clear(self):
+        """Oublie les intervalles enregistrés."""
+        self.events.clear()
+
+    def summary(self, since=None):
+        """
+        Agrège les durées par étape.
+
+        Args:
+            since (float): Ne retenir que les intervalles commencés après cet
+                instant (secondes de perf_counter) ; tous si None
+
+        Returns:
+            dict: Pour chaque étape, count, total_ms, mean_ms, p95_ms et max_ms
+        """
+        durations = {}
+        for name, _, start, duration, _ in list(self.events):
+            if since is None or start >= since:
+                durations.setdefault(name, []).append(duration)
+        summary = {}
+        for name, values in durations.items():
+            values.sort()
+            total = sum(values)
+            summary[name] = {
+                'count': len(values),
+                'total_ms': round(total * 1000, 3),
+                'mean_ms': round(total / len(values) * 1000, 3),
+                'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 3),
+                'max_ms': round(values[-1] * 1000, 3)
+            }
+        return summary
+
+    def chrome_trace(self):
+        """
+        Convertit les intervalles au format Chrome trace.
+
+        Returns:
+            dict: Document {'traceEvents': [...]} avec un événement complet
+                ('ph': 'X') par intervalle, horodaté en microsecondes
+        """
+        pid = os.getpid()
+        events = [{
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self._origin) * 1e6, 3),
+            'dur': round(duration * 1e6, 3),
+            'pid': pid,
+            'tid': thread
+        } for name, category, start, duration, thread in list(self.events)]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path):
+        """Écrit les intervalles au format Chrome trace dans un fichier JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def instrument_game(profiler):
+    """
+    Instrumente les étapes du moteur : coups de l'IA, tirs, navires coulés
+    et statistiques (voir GAME_HOOKS).
+
+    Args:
+        profiler (Profiler): Le profileur qui reçoit les mesures
+    """
+    for owner, names, category in GAME_HOOKS:
+        profiler.instrument(owner, names, category)
@@ -0,0 +1,295 @@
+"""
+Journal de partie et rejeu sans interface graphique.
+
+Le journal est un fichier JSON Lines, une ligne par événement :
+
+    {"event":"start","version":1,"board_size":10,"fleet":[["Porte-avions",5],...],
+     "no_touch":false,"seed":"42:0","players":["humain","difficile"]}
+    {"event":"fleet","side":0,"ships":[[x,y,horizontal],...]}
+    {"event":"shot","side":1,"x":3,"y":4,"result":true,"sunk":null,"game_over":false,"ms":1.2}
+
+Les flottes sont données dans l'ordre de la flotte des règles, et chaque
+tir (même invalide, result valant null) dans l'ordre où il a été joué.
+
+Exemple :
+    python -m src.game.replay replays/partie.jsonl --rerun-ai
+"""
+import argparse
+import json
+import os
+import sys
+
+from .ai_player import AIPlayer
+from .board import Board
+from .match import Match, derive_rng
+from .rules import GameRules
+
+LOG_VERSION = 1
+
+
+class MoveLog:
+    """
+    Enregistre une partie au format JSON Lines.
+
+    Chaque ligne est écrite et vidée immédiatement : le journal d'une partie
+    interrompue (plantage, fermeture de la fenêtre) reste exploitable.
+
+    Attributes:
+        path (str): Chemin du journal
+    """
+
+    def __init__(self, path):
+        """
+        Crée le journal (le fichier existant est remplacé).
+
+        Args:
+            path (str): Chemin du journal
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def _write(self, record):
+        """Écrit un événement sur une ligne compacte."""
+        if self._file is None:
+            return
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._file.flush()
+
+    def start(self, rules, seed, players):
+        """
+        Enregistre les règles et les joueurs de la partie.
+
+        Args:
+            rules (GameRules): Règles de la partie
+            seed (int ou str): Graine de la partie (None si inconnue)
+            players (list): Nom de chaque tireur (difficulté ou 'humain')
+        """
+        self._write({
+            'event': 'start',
+            'version': LOG_VERSION,
+            'board_size': rules.board_size,
+            'fleet': [list(entry) for entry in rules.fleet],
+            'no_touch': rules.no_touch,
+            'seed': seed,
+            'players': list(players)
+        })
+
+    def fleet(self, side, board):
+        """
+        Enregistre le placement de la flotte d'un joueur.
+
+        Args:
+            side (int): Joueur propriétaire du plateau (0 ou 1)
+            board (Board): Plateau dont les navires sont placés
+        """
+        self._write({
+            'event': 'fleet',
+            'side': side,
+            'ships': [list(ship.position) for ship in board.ships]
+        })
+
+    def shot(self, side, x, y, outcome, elapsed_ms=None):
+        """
+        Enregistre un tir et son issue.
+
+        Args:
+            side (int): Joueur qui tire
+            x (int): Coordonnée x du tir
+            y (int): Coordonnée y du tir
+            outcome (dict): Issue retournée par Match.fire
+            elapsed_ms (float): Temps de réflexion du tireur, si connu
+        """
+        record = {
+            'event': 'shot',
+            'side': side,
+            'x': x,
+            'y': y,
+            'result': outcome['result'],
+            'sunk': outcome['sunk'].name if outcome['sunk'] else None,
+            'game_over': outcome['game_over']
+        }
+        if elapsed_ms is not None:
+            record['ms'] = round(elapsed_ms, 3)
+        self._write(record)
+
+    def close(self):
+        """Ferme le journal."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_log(path):
+    """
+    Lit un journal de partie.
+
+    Args:
+        path (str): Chemin du journal
+
+    Returns:
+        dict: Contenu du journal
+            - start (dict): Événement de début de partie
+            - fleets (dict): Positions des navires par joueur
+            - shots (list): Événements de tir, dans l'ordre
+
+    Raises:
+        ValueError: Si le journal n'a pas d'en-tête ou une version inconnue
+    """
+    log = {'start': None, 'fleets': {}, 'shots': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break  # Dernière ligne tronquée : la partie a été interrompue
+            event = record.get('event')
+            if event == 'start':
+                log['start'] = record
+            elif event == 'fleet':
+                log['fleets'][record['side']] = [tuple(position) for position in record['ships']]
+            elif event == 'shot':
+                log['shots'].append(record)
+    start = log['start']
+    if start is None:
+        raise ValueError(f"{path} n'est pas un journal de partie")
+    if start.get('version') != LOG_VERSION:
+        raise ValueError(f"Version de journal non prise en charge : {start.get('version')}")
+    return log
+
+
+def log_rules(log):
+    """Reconstruit les règles de la partie décrites par un journal."""
+    start = log['start']
+    fleet = [tuple(entry) for entry in start['fleet']]
+    return GameRules(start['board_size'], fleet, start.get('no_touch', False))
+
+
+def build_boards(log):
+    """
+    Recrée les deux plateaux du journal, navires placés et aucun tir reçu.
+
+    Raises:
+        ValueError: Si une flotte manque ou ne peut pas être placée
+    """
+    rules = log_rules(log)
+    boards = []
+    for side in (0, 1):
+        positions = log['fleets'].get(side)
+        if positions is None:
+            raise ValueError(f"Flotte du joueur {side} absente du journal")
+        board = Board(rules)
+        for ship, (x, y, horizontal) in zip(rules.create_fleet(), positions):
+            if not board.place_ship(ship, x, y, horizontal):
+                raise ValueError(f"Placement invalide dans le journal : {ship.name} en {(x, y)}")
+        boards.append(board)
+    return boards
+
+
+def replay(log, rerun_ai=False, time_budget_ms=None, max_samples=AIPlayer.HEADLESS_SAMPLES):
+    """
+    Rejoue une partie enregistrée, sans délai.
+
+    Les tirs sont appliqués dans l'ordre du journal et leur issue comparée
+    à celle enregistrée. Avec rerun_ai, chaque IA est recréée à partir de
+    la graine de la partie et doit retrouver seule les coups enregistrés :
+    c'est ce qui permet de reproduire un comportement anormal de l'IA. Par
+    défaut, l'IA 'expert' est recréée comme dans les parties sans interface
+    (max_samples échantillons par coup, sans limite de temps) ; une partie
+    jouée dans l'interface, où elle est limitée par le temps, ne peut être
+    retrouvée coup pour coup qu'approximativement.
+
+    Args:
+        log (dict ou str): Journal lu par read_log, ou son chemin
+        rerun_ai (bool): Recalculer les coups des IA au lieu de les relire
+        time_budget_ms (float): Budget de réflexion des IA recréées (None : sans limite)
+        max_samples (int): Échantillons par coup de l'IA 'expert' recréée
+
+    Returns:
+        Match: La partie dans son état final
+
+    Raises:
+        ValueError: Si le rejeu s'écarte du journal
+    """
+    if isinstance(log, str):
+        log = read_log(log)
+    start = log['start']
+    rules = log_rules(log)
+    players = [None, None]
+    if rerun_ai:
+        if start.get('seed') is None:
+            raise ValueError("Le journal n'a pas de graine : les IA ne peuvent pas être recréées")
+        for side, name in enumerate(start['players']):
+            if name in AIPlayer.DIFFICULTIES:
+                rng = derive_rng(start['seed'], f"ai{side}")
+                players[side] = AIPlayer(name, rules, time_budget_ms, rng, max_samples)
+
+    boards = build_boards(log)
+    match = Match(boards, players)
+    for number, shot in enumerate(log['shots']):
+        side, x, y = shot['side'], shot['x'], shot['y']
+        player = players[side]
+        if player is not None:
+            move = tuple(player.get_move(boards[1 - side]))
+            if move != (x, y):
+                raise ValueError(f"Tir {number} : l'IA {side} joue {move} au lieu de {(x, y)}")
+        outcome = match.fire(side, x, y)
+        sunk = outcome['sunk'].name if outcome['sunk'] else None
+        if (outcome['result'], sunk, outcome['game_over']) != (shot['result'], shot['sunk'], shot['game_over']):
+            raise ValueError(f"Tir {number} en {(x, y)} : issue différente du journal")
+    return match
+
+
+def prune_logs(directory, keep):
+    """
+    Supprime les journaux les plus anciens d'un dossier.
+
+    Args:
+        directory (str): Dossier des journaux (*.jsonl)
+        keep (int): Nombre de journaux récents à conserver
+    """
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith('.jsonl')]
+    except FileNotFoundError:
+        return
+    paths = sorted((os.path.join(directory, name) for name in names), key=os.path.getmtime)
+    for path in paths[:max(0, len(paths) - keep)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande : rejoue un journal et affiche le résultat."""
+    parser = argparse.ArgumentParser(description="Rejeu d'une partie de bataille navale enregistrée")
+    parser.add_argument('log', help="Journal de partie (JSON Lines)")
+    parser.add_argument('--rerun-ai', action='store_true',
+                        help="Recalculer les coups des IA à partir de la graine")
+    parser.add_argument('--time-budget-ms', type=float, default=None,
+                        help="Budget de réflexion des IA recréées (par défaut sans limite de temps)")
+    parser.add_argument('--max-samples', type=int, default=AIPlayer.HEADLESS_SAMPLES,
+                        help="Échantillons par coup de l'IA 'expert' recréée")
+    args = parser.parse_args(argv)
+
+    log = read_log(args.log)
+    match = replay(log, args.rerun_ai, args.time_budget_ms, args.max_samples)
+    slowest = max((shot for shot in log['shots'] if 'ms' in shot), key=lambda shot: shot['ms'], default=None)
+    json.dump({
+        'players': log['start']['players'],
+        'seed': log['start']['seed'],
+        'shots': match.shots,
+        'hits': match.hits,
+        'winner': match.winner,
+        'slowest_move': slowest
+    }, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from .ship import Ship
+
+
+# Flotte réglementaire : (nom, taille)
+DEFAULT_FLEET = [
+    ("Porte-avions", 5),
+    ("Croiseur", 4),
+    ("Destroyer", 3),
+    ("Destroyer", 3),
+    ("Sous-marin", 2),
+    ("Sous-marin", 2)
+]
+
+
+class GameRules:
+    """
+    Règles d'une partie : dimensions du plateau et composition de la flotte.
+
+    Un même objet est partagé par Board, AIPlayer, le moteur de partie et
+    l'interface, afin que la taille du plateau et la flotte ne soient
+    définies qu'à un seul endroit.
+
+    Attributes:
+        board_size (int): Nombre de cases par côté du plateau
+        fleet (list): Liste de tuples (nom, taille) décrivant la flotte
+        no_touch (bool): True si deux navires ne peuvent pas se toucher,
+            même en diagonale
+    """
+
+    def __init__(self, board_size=10, fleet=None, no_touch=False):
+        """
+        Initialise un jeu de règles.
+
+        Args:
+            board_size (int): Nombre de cases par côté du plateau
+            fleet (list): Liste de tuples (nom, taille), flotte réglementaire par défaut
+            no_touch (bool): Interdire le contact entre navires
+
+        Raises:
+            ValueError: Si la flotte ne peut pas tenir sur le plateau
+        """
+        self.board_size = board_size
+        self.fleet = list(DEFAULT_FLEET if fleet is None else fleet)
+        self.no_touch = no_touch
+
+        if board_size < 1:
+            raise ValueError("La taille du plateau doit être positive")
+        if not self.fleet:
+            raise ValueError("La flotte doit contenir au moins un navire")
+        for name, size in self.fleet:
+            if not 1 <= size <= board_size:
+                raise ValueError(f"Le navire {name} (taille {size}) ne tient pas sur le plateau")
+        if sum(self.ship_sizes) > board_size * board_size:
+            raise ValueError("La flotte occupe plus de cases que le plateau n'en contient")
+
+    @property
+    def ship_sizes(self):
+        """list: Tailles des navires de la flotte, dans l'ordre."""
+        return [size for _, size in self.fleet]
+
+    def create_fleet(self):
+        """
+        Crée les navires d'un joueur.
+
+        Returns:
+            list: Liste des navires (Ship) à placer
+        """
+        return [Ship(name, size) for name, size in self.fleet]
+
+
+DEFAULT_RULES = GameRules()
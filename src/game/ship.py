@@ -14,6 +14,8 @@ class Ship:
             - horizontal (bool): True si le navire est horizontal, False si vertical
     """
     
+    __slots__ = ('name', 'size', 'position')
+    
     def __init__(self, name, size):
         """
         Initialise un nouveau navire.
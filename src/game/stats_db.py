@@ -0,0 +1,562 @@
+"""
+Statistiques des parties dans une base SQLite.
+
+Alternative à GameStats (JSON Lines) pour les historiques volumineux :
+les parties sont indexées par date, difficulté et résultat, ce qui permet
+de filtrer, paginer et agréger sans charger l'historique. La base est en
+mode WAL : une lecture (menu des statistiques) ne bloque pas l'écriture
+d'une partie.
+
+Le moteur est choisi par open_game_stats ('jsonl' par défaut, ou 'sqlite' ;
+option --stats de main.py).
+
+Exemple (migration explicite d'un historique existant) :
+    python -m src.game.stats_db game_stats.jsonl --database game_stats.sqlite3
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+from .game_stats import RETENTION_DAYS, GameStats
+
+SCHEMA_VERSION = 2
+
+# Colonnes d'une partie, dans l'ordre de la table ; les autres champs sont
+# conservés en JSON dans la colonne extra
+COLUMNS = ('date', 'difficulty', 'result', 'duration', 'player_shots', 'ai_shots',
+           'player_hits', 'ai_hits', 'player_accuracy', 'ai_accuracy')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    difficulty TEXT,
+    result TEXT,
+    duration INTEGER,
+    player_shots INTEGER,
+    ai_shots INTEGER,
+    player_hits INTEGER,
+    ai_hits INTEGER,
+    player_accuracy REAL,
+    ai_accuracy REAL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (date);
+CREATE INDEX IF NOT EXISTS games_difficulty_date ON games (difficulty, date);
+CREATE INDEX IF NOT EXISTS games_result_date ON games (result, date);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+-- Totaux par difficulté tenus à jour par déclencheurs : le résumé ne
+-- parcourt pas la table games ('' pour une difficulté absente)
+CREATE TABLE IF NOT EXISTS totals (
+    difficulty TEXT PRIMARY KEY,
+    total_games INTEGER NOT NULL,
+    victories INTEGER NOT NULL,
+    duration_sum INTEGER NOT NULL,
+    best_time INTEGER
+);
+CREATE TRIGGER IF NOT EXISTS games_insert AFTER INSERT ON games BEGIN
+    INSERT OR IGNORE INTO totals VALUES (COALESCE(NEW.difficulty, ''), 0, 0, 0, NULL);
+    UPDATE totals SET
+        total_games = total_games + 1,
+        victories = victories + (NEW.result = 'victory'),
+        duration_sum = duration_sum + COALESCE(NEW.duration, 0),
+        best_time = CASE WHEN NEW.result = 'victory'
+                         AND (best_time IS NULL OR COALESCE(NEW.duration, 0) < best_time)
+                         THEN COALESCE(NEW.duration, 0) ELSE best_time END
+    WHERE difficulty = COALESCE(NEW.difficulty, '');
+END;
+CREATE TRIGGER IF NOT EXISTS games_delete AFTER DELETE ON games BEGIN
+    UPDATE totals SET
+        total_games = total_games - 1,
+        victories = victories - (OLD.result = 'victory'),
+        duration_sum = duration_sum - COALESCE(OLD.duration, 0),
+        best_time = CASE WHEN OLD.result = 'victory' AND COALESCE(OLD.duration, 0) = best_time
+                         THEN (SELECT MIN(COALESCE(duration, 0)) FROM games
+                               WHERE COALESCE(difficulty, '') = COALESCE(OLD.difficulty, '')
+                               AND result = 'victory')
+                         ELSE best_time END
+    WHERE difficulty = COALESCE(OLD.difficulty, '');
+    DELETE FROM totals WHERE difficulty = COALESCE(OLD.difficulty, '') AND total_games = 0;
+END;
+-- Cumuls quotidiens des parties compactées par GameStats avant la migration
+-- (fichier .rollups.json), sans détail par partie
+CREATE TABLE IF NOT EXISTS daily (
+    day TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    total_games INTEGER NOT NULL,
+    victories INTEGER NOT NULL,
+    duration_sum INTEGER NOT NULL,
+    best_time INTEGER,
+    PRIMARY KEY (day, difficulty)
+);
+"""
+
+
+def read_history(path):
+    """
+    Lit un historique au format JSON (liste) ou JSON Lines.
+
+    Les lignes illisibles d'un fichier JSON Lines sont ignorées, comme
+    dans GameStats.
+
+    Args:
+        path (str): Chemin de game_stats.json ou game_stats.jsonl
+
+    Yields:
+        dict: Statistiques de chaque partie, dans l'ordre du fichier
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            yield from json.load(f)
+            return
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+class SQLiteGameStats:
+    """
+    Statistiques des parties stockées dans SQLite.
+
+    Expose la même interface que GameStats (save_game_stats,
+    get_stats_summary, recent_games, iter_stats, stats_history), complétée
+    par des requêtes filtrées : query, count et aggregate.
+
+    Au premier lancement, si la base est vide, l'historique existant
+    (game_stats.jsonl, ou à défaut game_stats.json) est importé une fois,
+    avec les cumuls quotidiens des parties déjà compactées (table daily) ;
+    la migration est notée dans la table meta et n'est jamais refaite.
+
+    Attributes:
+        database (str): Chemin de la base SQLite
+        legacy_files (list): Historiques importés au premier lancement
+        fsync (str): Politique de synchronisation disque
+            - 'always': synchronous=FULL, chaque partie survit à une coupure
+            - 'never': synchronous=NORMAL, les dernières parties peuvent être
+              perdues en cas de coupure, jamais la cohérence de la base
+    """
+
+    def __init__(self, database="game_stats.sqlite3", fsync="always", legacy_files=None):
+        """
+        Ouvre (ou crée) la base et importe l'historique existant si besoin.
+
+        Args:
+            database (str): Chemin de la base SQLite
+            fsync (str): Politique de synchronisation ('always' ou 'never')
+            legacy_files (list): Historiques à importer dans une base vide
+                (par défaut game_stats.jsonl puis game_stats.json, à côté de la base)
+        """
+        self.database = database
+        self.fsync = fsync
+        if legacy_files is None:
+            base = os.path.join(os.path.dirname(database), "game_stats")
+            legacy_files = [base + ".jsonl", base + ".json"]
+        self.legacy_files = legacy_files
+        self._connection = sqlite3.connect(database)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(f"PRAGMA synchronous={'FULL' if fsync == 'always' else 'NORMAL'}")
+        self._create_schema()
+        self._migrate_legacy_files()
+
+    def _create_schema(self):
+        """Crée les tables, les index et les déclencheurs d'une base neuve."""
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"Base de statistiques trop récente (version {version})")
+        if version == SCHEMA_VERSION:
+            return  # Pas d'écriture : l'ouverture ne bloque pas une autre fenêtre
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+            self._connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self):
+        """Ferme la base."""
+        self._connection.close()
+
+    def _meta(self, key):
+        """Valeur d'une entrée de la table meta (None si absente)."""
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _migrate_legacy_files(self):
+        """Importe le premier historique existant si la base n'a jamais été remplie."""
+        if self._meta('migrated_from') is not None:
+            return
+        if self._connection.execute("SELECT 1 FROM games LIMIT 1").fetchone():
+            return
+        for path in self.legacy_files:
+            if os.path.exists(path):
+                self.migrate(path)
+                return
+
+    def migrate(self, path):
+        """
+        Importe un historique JSON ou JSON Lines en une seule transaction.
+
+        Les cumuls des parties compactées par GameStats (fichier
+        .rollups.json voisin) sont importés dans la table daily ; les
+        parties de l'historique antérieures à leur date limite, déjà
+        cumulées, ne sont pas importées une seconde fois.
+
+        Args:
+            path (str): Chemin de l'historique
+
+        Returns:
+            int: Nombre de parties importées, cumulées ou non
+        """
+        rollups_file = os.path.splitext(path)[0] + ".rollups.json"
+        try:
+            games = list(read_history(path))
+            rollups = None
+            if os.path.exists(rollups_file):
+                with open(rollups_file, 'r', encoding='utf-8') as f:
+                    rollups = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la migration des statistiques : {e}")
+            return 0
+        rolled = 0
+        if rollups is not None:
+            cutoff = rollups.get('compacted_until')
+            if cutoff is not None:
+                games = [game for game in games if game.get('date', "") >= cutoff]
+            rolled = rollups.get('total_games', 0)
+        with self._connection:
+            self._connection.executemany(self._INSERT, (self._row(game) for game in games))
+            if rollups is not None:
+                self._connection.executemany(self._INSERT_DAILY, self._daily_rows(rollups))
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_from', ?)",
+                                     (os.path.abspath(path),))
+        return len(games) + rolled
+
+    _INSERT = f"INSERT INTO games ({', '.join(COLUMNS)}, extra) VALUES ({', '.join('?' * (len(COLUMNS) + 1))})"
+
+    # Un même jour importé deux fois (deux migrations explicites) est additionné
+    _INSERT_DAILY = """
+        INSERT INTO daily VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (day, difficulty) DO UPDATE SET
+            total_games = total_games + excluded.total_games,
+            victories = victories + excluded.victories,
+            duration_sum = duration_sum + excluded.duration_sum,
+            best_time = CASE WHEN best_time IS NULL OR excluded.best_time < best_time
+                             THEN excluded.best_time ELSE best_time END
+    """
+
+    @staticmethod
+    def _daily_rows(rollups):
+        """Lignes de la table daily tirées des cumuls de GameStats, par jour et par difficulté."""
+        for day, counts in rollups.get('days', {}).items():
+            for difficulty, diff_stats in counts.get('by_difficulty', {}).items():
+                # Une difficulté absente est la clé "null" une fois les cumuls écrits en JSON
+                yield (day, '' if difficulty == 'null' else difficulty, diff_stats['total_games'],
+                       diff_stats['victories'], diff_stats['duration_sum'], diff_stats['best_time'])
+
+    @staticmethod
+    def _row(game):
+        """Valeurs des colonnes d'une partie, les champs inconnus étant mis en JSON."""
+        extra = {key: value for key, value in game.items() if key not in COLUMNS}
+        values = [game.get(column) for column in COLUMNS]
+        if values[0] is None:
+            values[0] = ""
+        return values + [json.dumps(extra) if extra else None]
+
+    @staticmethod
+    def _game(row):
+        """Reconstruit le dictionnaire d'une partie à partir d'une ligne."""
+        game = {column: row[column] for column in COLUMNS if row[column] is not None}
+        if row['extra']:
+            game.update(json.loads(row['extra']))
+        return game
+
+    # --- Interface de GameStats ---
+
+    @property
+    def stats_history(self):
+        """list: Historique complet (relu à chaque accès)."""
+        return list(self.iter_stats())
+
+    def iter_stats(self):
+        """
+        Parcourt l'historique sans le charger entièrement en mémoire.
+
+        Returns:
+            iterator: Statistiques de chaque partie, de la plus ancienne à la plus récente
+        """
+        cursor = self._connection.execute("SELECT * FROM games ORDER BY id")
+        return (self._game(row) for row in cursor)
+
+    def recent_games(self, count=10):
+        """
+        Retourne les dernières parties enregistrées.
+
+        Args:
+            count (int): Nombre de parties souhaitées
+
+        Returns:
+            list: Les parties les plus récentes, de la plus ancienne à la plus récente
+        """
+        if count <= 0:
+            return []
+        rows = self._connection.execute("SELECT * FROM games ORDER BY id DESC LIMIT ?", (count,)).fetchall()
+        return [self._game(row) for row in reversed(rows)]
+
+    def save_game_stats(self, stats):
+        """
+        Sauvegarde les statistiques d'une partie (voir GameStats.save_game_stats).
+
+        Args:
+            stats (dict): Dictionnaire contenant les statistiques de la partie
+        """
+        stats['date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with self._connection:
+                self._connection.execute(self._INSERT, self._row(stats))
+        except sqlite3.Error as e:
+            print(f"Erreur lors de la sauvegarde des statistiques : {e}")
+
+    def get_stats_summary(self):
+        """
+        Génère un résumé des statistiques de toutes les parties.
+
+        Le résumé est lu dans la table totals, tenue à jour à chaque
+        insertion, et dans les cumuls quotidiens importés (un par jour et
+        par difficulté) : son coût ne dépend pas du nombre de parties.
+
+        Returns:
+            dict: Résumé au format de GameStats.get_stats_summary, None sans partie
+        """
+        by_difficulty = {}
+        for row in self._connection.execute(
+                "SELECT difficulty, total_games, victories, duration_sum, best_time FROM totals "
+                "WHERE total_games > 0 UNION ALL "
+                "SELECT difficulty, SUM(total_games), SUM(victories), SUM(duration_sum), MIN(best_time) "
+                "FROM daily GROUP BY difficulty"):
+            self._merge_counts(by_difficulty.setdefault(row['difficulty'] or None, self._empty_counts()), row)
+        rows = list(by_difficulty.values())
+        total_games = sum(row['total_games'] for row in rows)
+        if not total_games:
+            return None
+        summary = {
+            'total_games': total_games,
+            'victories': sum(row['victories'] for row in rows),
+            'avg_duration': sum(row['duration_sum'] for row in rows) / total_games,
+            'stats_by_difficulty': {}
+        }
+        known = ['facile', 'moyen', 'difficile', 'expert']
+        for difficulty in known + sorted(set(by_difficulty) - set(known), key=str):
+            diff_stats = by_difficulty.get(difficulty)
+            if diff_stats:
+                games = diff_stats['total_games']
+                summary['stats_by_difficulty'][difficulty] = {
+                    'total_games': games,
+                    'victories': diff_stats['victories'],
+                    'win_rate': round(diff_stats['victories'] / games * 100, 2),
+                    'avg_duration': diff_stats['duration_sum'] / games
+                }
+        best_times = [row['best_time'] for row in rows if row['best_time'] is not None]
+        if best_times:
+            summary['best_time'] = min(best_times)
+        return summary
+
+    @staticmethod
+    def _empty_counts():
+        """Compteurs vides d'un groupe de parties."""
+        return {'total_games': 0, 'victories': 0, 'duration_sum': 0, 'best_time': None}
+
+    @staticmethod
+    def _merge_counts(target, row):
+        """Ajoute les compteurs d'une ligne (totals, daily ou agrégat) à un groupe."""
+        target['total_games'] += row['total_games']
+        target['victories'] += row['victories']
+        target['duration_sum'] += row['duration_sum']
+        if row['best_time'] is not None and (target['best_time'] is None or row['best_time'] < target['best_time']):
+            target['best_time'] = row['best_time']
+
+    # --- Requêtes ---
+
+    @staticmethod
+    def _where(difficulty=None, result=None, since=None, until=None):
+        """
+        Clause WHERE et paramètres des filtres communs aux requêtes.
+
+        Args:
+            difficulty (str): Difficulté des parties
+            result (str): Résultat des parties ('victory' ou 'defeat')
+            since (str): Date minimale incluse ('AAAA-MM-JJ' ou 'AAAA-MM-JJ HH:MM:SS')
+            until (str): Date maximale exclue, au même format
+        """
+        clauses, parameters = [], []
+        for clause, value in (("difficulty = ?", difficulty), ("result = ?", result),
+                              ("date >= ?", since), ("date < ?", until)):
+            if value is not None:
+                clauses.append(clause)
+                parameters.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), parameters
+
+    def query(self, difficulty=None, result=None, since=None, until=None, limit=None, offset=0,
+              newest_first=True):
+        """
+        Liste les parties correspondant aux filtres, page par page.
+
+        Args:
+            difficulty (str): Difficulté des parties
+            result (str): Résultat des parties ('victory' ou 'defeat')
+            since (str): Date minimale incluse ('AAAA-MM-JJ' ou 'AAAA-MM-JJ HH:MM:SS')
+            until (str): Date maximale exclue, au même format
+            limit (int): Nombre maximal de parties (toutes si None)
+            offset (int): Nombre de parties à sauter (pagination)
+            newest_first (bool): Ordre chronologique inverse
+
+        Returns:
+            list: Statistiques des parties de la page
+        """
+        where, parameters = self._where(difficulty, result, since, until)
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT * FROM games{where} ORDER BY date {order}, id {order} LIMIT ? OFFSET ?"
+        rows = self._connection.execute(sql, parameters + [-1 if limit is None else limit, offset])
+        return [self._game(row) for row in rows]
+
+    def count(self, difficulty=None, result=None, since=None, until=None):
+        """Nombre de parties correspondant aux filtres (voir query)."""
+        where, parameters = self._where(difficulty, result, since, until)
+        return self._connection.execute(f"SELECT COUNT(*) FROM games{where}", parameters).fetchone()[0]
+
+    def aggregate(self, difficulty=None, result=None, since=None, until=None, group_by=None):
+        """
+        Agrège les parties correspondant aux filtres.
+
+        Les cumuls quotidiens importés (parties compactées avant la
+        migration) sont comptés, à la journée près pour since et until,
+        sauf avec un filtre ou un regroupement par résultat : ils ne
+        distinguent pas la durée des victoires et des défaites.
+
+        Args:
+            difficulty (str): Difficulté des parties
+            result (str): Résultat des parties
+            since (str): Date minimale incluse
+            until (str): Date maximale exclue
+            group_by (str): None, 'difficulty', 'result' ou 'day'
+
+        Returns:
+            dict: Sans regroupement, les agrégats de toutes les parties
+                retenues ; sinon un dictionnaire des agrégats par groupe.
+                Agrégats : total_games, victories, win_rate, avg_duration,
+                best_time (victoire la plus rapide), avg_player_accuracy
+                et avg_ai_accuracy (parties détaillées seulement)
+
+        Raises:
+            ValueError: Si group_by n'est pas un regroupement connu
+        """
+        groups = {None: None, 'difficulty': "difficulty", 'result': "result", 'day': "substr(date, 1, 10)"}
+        if group_by not in groups:
+            raise ValueError(f"Regroupement inconnu : {group_by!r}")
+        where, parameters = self._where(difficulty, result, since, until)
+        key = groups[group_by]
+        sql = ("SELECT " + (f"{key} AS grp, " if key else "") +
+               "COUNT(*) AS total_games, "
+               "COALESCE(SUM(result = 'victory'), 0) AS victories, "
+               "COALESCE(SUM(COALESCE(duration, 0)), 0) AS duration_sum, "
+               "MIN(CASE WHEN result = 'victory' THEN COALESCE(duration, 0) END) AS best_time, "
+               "AVG(player_accuracy) AS avg_player_accuracy, "
+               "AVG(ai_accuracy) AS avg_ai_accuracy "
+               f"FROM games{where}" + (f" GROUP BY {key}" if key else ""))
+        groups_counts = {}
+        accuracies = {}
+        for row in self._connection.execute(sql, parameters):
+            group = row['grp'] if key else None
+            self._merge_counts(groups_counts.setdefault(group, self._empty_counts()), row)
+            accuracies[group] = (row['avg_player_accuracy'], row['avg_ai_accuracy'])
+
+        if result is None and group_by != 'result':
+            for row in self._daily(difficulty, since, until, group_by):
+                group = (row['grp'] or None) if key else None
+                self._merge_counts(groups_counts.setdefault(group, self._empty_counts()), row)
+
+        aggregates = {}
+        for group in sorted(groups_counts, key=lambda group: (group is not None, group or "")):
+            counts = groups_counts[group]
+            games = counts['total_games']
+            player_accuracy, ai_accuracy = accuracies.get(group, (None, None))
+            aggregates[group] = {
+                'total_games': games,
+                'victories': counts['victories'],
+                'win_rate': round(counts['victories'] / games * 100, 2) if games else 0,
+                'avg_duration': counts['duration_sum'] / games if games else 0,
+                'best_time': counts['best_time'],
+                'avg_player_accuracy': player_accuracy,
+                'avg_ai_accuracy': ai_accuracy
+            }
+        return aggregates if key else aggregates[None]
+
+    def _daily(self, difficulty, since, until, group_by):
+        """Cumuls quotidiens importés correspondant aux filtres, regroupés comme dans aggregate."""
+        clauses, parameters = [], []
+        for clause, value in (("difficulty = ?", difficulty), ("day >= ?", since and since[:10]),
+                              ("day < ?", until and until[:10])):
+            if value is not None:
+                clauses.append(clause)
+                parameters.append(value)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        key = {'difficulty': "difficulty", 'day': "day"}.get(group_by)
+        sql = ("SELECT " + (f"{key} AS grp, " if key else "") +
+               "SUM(total_games) AS total_games, SUM(victories) AS victories, "
+               "SUM(duration_sum) AS duration_sum, MIN(best_time) AS best_time "
+               f"FROM daily{where}" + (f" GROUP BY {key}" if key else " HAVING COUNT(*) > 0"))
+        return self._connection.execute(sql, parameters).fetchall()
+
+
+def open_game_stats(backend="jsonl", retention_days=RETENTION_DAYS):
+    """
+    Ouvre le stockage des statistiques choisi.
+
+    Le stockage est ouvert une fois par lancement et partagé par les écrans ;
+    close le ferme à la sortie du jeu.
+
+    Args:
+        backend (str): 'jsonl' ou 'sqlite'
+        retention_days (int): Durée de conservation des parties détaillées
+            du fichier JSON Lines (0 ou None : tout conserver)
+
+    Returns:
+        GameStats ou SQLiteGameStats: Le stockage des statistiques
+
+    Raises:
+        ValueError: Si le moteur demandé est inconnu
+    """
+    if backend == 'jsonl':
+        return GameStats(retention_days=retention_days or None)
+    if backend == 'sqlite':
+        return SQLiteGameStats()
+    raise ValueError(f"Moteur de statistiques inconnu : {backend!r}")
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande : importe un historique dans une base."""
+    parser = argparse.ArgumentParser(description="Migration des statistiques vers SQLite")
+    parser.add_argument('history', help="Historique à importer (game_stats.json ou game_stats.jsonl)")
+    parser.add_argument('--database', default="game_stats.sqlite3", help="Base SQLite de destination")
+    args = parser.parse_args(argv)
+
+    stats = SQLiteGameStats(args.database, legacy_files=[])
+    if stats._meta('migrated_from') is not None:
+        print(f"Base déjà migrée depuis {stats._meta('migrated_from')}", file=sys.stderr)
+        return 1
+    count = stats.migrate(args.history)
+    print(f"{count} parties importées dans {args.database}", file=sys.stderr)
+    stats.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,446 @@
+import heapq
+from array import array
+from collections import Counter
+from functools import lru_cache
+
+from .placement import segment_index
+
+
+def default_hit_weight(ship_sizes):
+    """
+    Poids d'une case touchée couverte par un placement.
+
+    Il dépasse la densité maximale qu'une case peut atteindre sans touche,
+    ce qui donne la priorité aux cases prolongeant une touche.
+
+    Args:
+        ship_sizes (iterable): Tailles des navires restants
+
+    Returns:
+        int: Le poids d'une touche
+    """
+    return 1 + sum(2 * length for length in set(ship_sizes))
+
+
+def placement_heatmap(grid, ship_sizes, hit_weight=None):
+    """
+    Calcule en une passe la carte de densité des placements.
+
+    Chaque taille de navire restante compte une fois. Les cases manquées
+    (3) bloquent les placements, les cases touchées (2) augmentent leur
+    poids. Les cases de navire intactes (1) sont traitées comme inconnues,
+    l'IA ne devant pas les voir.
+
+    Pendant une partie, l'IA ne recalcule jamais la carte entière :
+    DensityMap ne met à jour, à chaque tir, que les placements qui couvrent
+    la case visée. Ce calcul complet ne sert qu'à la carte initiale,
+    partagée par toutes les cartes d'un même plateau et d'une même flotte.
+
+    Args:
+        grid (list): Grille 2D au format de Board.grid (listes ou tuples)
+        ship_sizes (list): Tailles des navires restants
+        hit_weight (int): Poids d'une touche (par défaut default_hit_weight)
+
+    Returns:
+        list: Grille 2D des scores, heatmap[y][x]
+    """
+    if hit_weight is None:
+        hit_weight = default_hit_weight(ship_sizes)
+    remaining = Counter(ship_sizes)
+    size = len(grid)
+    heat = [[0] * size for _ in range(size)]
+    for length, count in remaining.items():
+        if count <= 0 or length > size:
+            continue
+        for y in range(size):
+            for x in range(size):
+                if x + length <= size:
+                    row = grid[y]
+                    segment = row[x:x + length]
+                    if 3 not in segment:
+                        weight = 1 + hit_weight * segment.count(2)
+                        heat_row = heat[y]
+                        for i in range(x, x + length):
+                            heat_row[i] += weight
+                if length > 1 and y + length <= size:
+                    segment = [grid[y + i][x] for i in range(length)]
+                    if 3 not in segment:
+                        weight = 1 + hit_weight * segment.count(2)
+                        for i in range(y, y + length):
+                            heat[i][x] += weight
+    return heat
+
+
+class RemainingCells:
+    """
+    Cases non encore ciblées, avec tirage uniforme en temps constant.
+
+    Les cases sont rangées dans un tableau compact ; une table inverse donne
+    la place de chaque case, ce qui permet d'en retirer une quelconque en
+    l'échangeant avec la dernière. Tirer une case ou en retirer une coûte
+    O(1), quel que soit le nombre de cases déjà ciblées.
+
+    Attributes:
+        size (int): Taille du plateau
+    """
+
+    def __init__(self, board_size):
+        """
+        Initialise l'ensemble avec toutes les cases du plateau.
+
+        Args:
+            board_size (int): Taille du plateau
+        """
+        self.size = board_size
+        cell_count = board_size * board_size
+        self._cells = array('l', range(cell_count))
+        self._slot = array('l', range(cell_count))  # Place de chaque case, -1 si retirée
+
+    def __len__(self):
+        """Nombre de cases restantes."""
+        return len(self._cells)
+
+    def __contains__(self, position):
+        """True si la case (x, y) n'a pas encore été ciblée."""
+        x, y = position
+        return self._slot[y * self.size + x] >= 0
+
+    def discard(self, x, y):
+        """Retire une case de l'ensemble (sans effet si elle n'y est plus)."""
+        cell = y * self.size + x
+        slot = self._slot[cell]
+        if slot < 0:
+            return
+        last = self._cells.pop()
+        if last != cell:
+            self._cells[slot] = last
+            self._slot[last] = slot
+        self._slot[cell] = -1
+
+    def pop_random(self, rng):
+        """
+        Tire et retire une case au hasard.
+
+        Args:
+            rng (random.Random): Générateur aléatoire à utiliser
+
+        Returns:
+            tuple: Coordonnées (x, y) de la case tirée
+
+        Raises:
+            IndexError: Si toutes les cases ont été ciblées
+        """
+        if not self._cells:
+            raise IndexError("Toutes les cases ont déjà été ciblées")
+        cell = self._cells[rng.randrange(len(self._cells))]
+        x, y = cell % self.size, cell // self.size
+        self.discard(x, y)
+        return x, y
+
+
+class TargetTracker:
+    """
+    Machine à états chasse/cible pour finir les navires touchés.
+
+    L'IA est en chasse tant qu'aucune touche n'appartient à un navire non
+    coulé. Sinon elle cible le groupe de touches (cases touchées reliées
+    par un côté) le plus ancien : après deux touches alignées, seules les
+    deux cases prolongeant la ligne sont candidates ; avec une seule touche,
+    ou si la ligne est bloquée des deux côtés (navires côte à côte), les
+    voisines non ciblées des touches du groupe le sont. Les cases d'un
+    navire coulé, connues grâce à Board.check_sunk_ship, sortent des
+    touches en cours. Les candidates ne contiennent ni doublon ni case
+    déjà ciblée.
+
+    Attributes:
+        size (int): Taille du plateau
+    """
+
+    def __init__(self, board_size):
+        """
+        Initialise le suivi en mode chasse.
+
+        Args:
+            board_size (int): Taille du plateau
+        """
+        self.size = board_size
+        self._shot = bytearray(board_size * board_size)
+        self._hits = {}  # Touches non coulées -> ordre de découverte
+
+    @property
+    def hunting(self):
+        """bool: True si aucun navire touché ne reste à finir."""
+        return not self._hits
+
+    def record_shot(self, x, y, is_hit):
+        """
+        Enregistre le résultat d'un tir.
+
+        Args:
+            x (int): Coordonnée x du tir
+            y (int): Coordonnée y du tir
+            is_hit (bool): True si le tir a touché un navire
+        """
+        cell = y * self.size + x
+        if self._shot[cell]:
+            return
+        self._shot[cell] = 1
+        if is_hit:
+            self._hits[cell] = len(self._hits)
+
+    def record_sunk(self, ship):
+        """
+        Retire des touches en cours les cases d'un navire coulé.
+
+        Args:
+            ship (Ship): Le navire coulé, avec sa position
+        """
+        x, y, horizontal = ship.position
+        step = 1 if horizontal else self.size
+        start = y * self.size + x
+        for i in range(ship.size):
+            self._hits.pop(start + i * step, None)
+
+    def _neighbours(self, cell):
+        """Cases voisines (par un côté) d'une case, dans le plateau."""
+        size = self.size
+        x, y = cell % size, cell // size
+        if x > 0:
+            yield cell - 1
+        if x < size - 1:
+            yield cell + 1
+        if y > 0:
+            yield cell - size
+        if y < size - 1:
+            yield cell + size
+
+    def _group(self, start):
+        """Groupe de touches non coulées reliées à une touche."""
+        group = {start}
+        pending = [start]
+        while pending:
+            cell = pending.pop()
+            for neighbour in self._neighbours(cell):
+                if neighbour in self._hits and neighbour not in group:
+                    group.add(neighbour)
+                    pending.append(neighbour)
+        return group
+
+    def _line_ends(self, group):
+        """Cases prolongeant une ligne de touches, [] si le groupe n'est pas aligné."""
+        size = self.size
+        rows = {cell // size for cell in group}
+        columns = {cell % size for cell in group}
+        if len(rows) == 1:
+            first, last, step = min(group), max(group), 1
+            ends = []
+            if first % size > 0:
+                ends.append(first - step)
+            if last % size < size - 1:
+                ends.append(last + step)
+        elif len(columns) == 1:
+            first, last, step = min(group), max(group), size
+            ends = []
+            if first >= size:
+                ends.append(first - step)
+            if last + size < size * size:
+                ends.append(last + step)
+        else:
+            return []
+        return [cell for cell in ends if not self._shot[cell]]
+
+    def candidates(self):
+        """
+        Cases à viser pour finir le navire touché le plus ancien.
+
+        Returns:
+            list: Coordonnées (x, y) candidates, sans doublon ; vide en mode chasse
+        """
+        if not self._hits:
+            return []
+        done = set()
+        for start in sorted(self._hits, key=self._hits.get):
+            if start in done:
+                continue
+            group = self._group(start)
+            done |= group
+            cells = self._line_ends(group) if len(group) > 1 else []
+            if not cells:
+                cells = sorted({neighbour for cell in group for neighbour in self._neighbours(cell)
+                                if not self._shot[neighbour]})
+            if cells:
+                return [(cell % self.size, cell // self.size) for cell in cells]
+        return []
+
+
+@lru_cache(maxsize=None)
+def _density_layout(board_size, ship_sizes):
+    """
+    Tables en lecture seule d'une carte de densité, calculées une fois par
+    plateau et par flotte.
+
+    Args:
+        board_size (int): Taille du plateau
+        ship_sizes (tuple): Tailles des navires, triées
+
+    Returns:
+        tuple: (cases de chaque placement, placements couvrant chaque case,
+            placements de chaque taille, carte initiale, tas initial)
+    """
+    cell_count = board_size * board_size
+
+    # Placements de toutes les tailles, numérotés à la suite à partir des
+    # index précalculés, plus l'index inverse case -> placements
+    cells = []
+    covering = [[] for _ in range(cell_count)]
+    by_length = {}
+    for length in sorted(set(ship_sizes)):
+        index = segment_index(board_size, length)
+        first = len(cells)
+        cells.extend(index.cells)
+        for cell, segments in enumerate(index.covering):
+            covering[cell].extend(first + segment for segment in segments)
+        by_length[length] = range(first, len(cells))
+
+    # Carte initiale calculée d'un bloc
+    empty_grid = [[0] * board_size for _ in range(board_size)]
+    heatmap = placement_heatmap(empty_grid, ship_sizes, default_hit_weight(ship_sizes))
+    score = tuple(value for row in heatmap for value in row)
+    heap = [(-value, cell) for cell, value in enumerate(score)]
+    heapq.heapify(heap)
+    return tuple(cells), tuple(tuple(segments) for segments in covering), by_length, score, tuple(heap)
+
+
+class DensityMap:
+    """
+    Carte de densité des placements possibles de la flotte adverse.
+
+    Chaque placement légal (taille, position, orientation) d'un navire non
+    coulé est énuméré une seule fois, quel que soit le nombre de navires de
+    cette taille. Le score d'une case est le nombre de placements encore
+    compatibles avec les tirs connus qui la couvrent, chacun pondéré par
+    le nombre de cases touchées (non coulées) qu'il couvre. Chaque tir ne
+    met à jour que les placements qui couvrent la case visée ; une taille
+    n'est retirée de la carte que lorsque son dernier navire est coulé.
+
+    Attributes:
+        size (int): Taille du plateau
+        remaining (Counter): Nombre de navires non coulés par taille
+        hit_weight (int): Poids d'une case touchée couverte par un placement,
+            supérieur à toute densité sans touche (priorité au mode chasse)
+        score (list): Score de chaque case, indexée par y * size + x
+    """
+
+    def __init__(self, board_size, ship_sizes):
+        """
+        Initialise la carte, sans tir, à partir des tables communes.
+
+        Args:
+            board_size (int): Taille du plateau
+            ship_sizes (list): Tailles des navires de la flotte adverse
+        """
+        self.size = board_size
+        self.remaining = Counter(ship_sizes)
+        self.hit_weight = default_hit_weight(ship_sizes)
+
+        # Tables communes à toutes les cartes de même plateau et même flotte
+        layout = _density_layout(board_size, tuple(sorted(ship_sizes)))
+        self._cells, self._covering, self._by_length, initial_score, initial_heap = layout
+
+        self._valid = bytearray(b'\x01') * len(self._cells)
+        self._hits_in = array('H', [0]) * len(self._cells)
+        self._open = set(range(board_size * board_size))
+        self.score = list(initial_score)
+
+        # Tas max paresseux des scores : les entrées périmées sont ignorées au
+        # moment du choix, les cases modifiées y sont réinsérées par lots
+        self._heap = list(initial_heap)
+        self._dirty = set()
+
+    def _apply(self, placement, sign):
+        """Ajoute (sign=1) ou retire (sign=-1) la contribution d'un placement."""
+        weight = sign * (1 + self.hit_weight * self._hits_in[placement])
+        if weight:
+            score = self.score
+            cells = self._cells[placement]
+            for cell in cells:
+                score[cell] += weight
+            self._dirty.update(cells)
+
+    def _invalidate(self, cell):
+        """Élimine tous les placements encore valides couvrant une case."""
+        valid = self._valid
+        for placement in self._covering[cell]:
+            if valid[placement]:
+                self._apply(placement, -1)
+                valid[placement] = 0
+
+    def record_shot(self, x, y, is_hit):
+        """
+        Met à jour la carte après un tir.
+
+        Args:
+            x (int): Coordonnée x du tir
+            y (int): Coordonnée y du tir
+            is_hit (bool): True si le tir a touché un navire
+        """
+        cell = y * self.size + x
+        if cell not in self._open:
+            return
+        self._open.discard(cell)
+
+        if not is_hit:
+            self._invalidate(cell)
+            return
+
+        valid = self._valid
+        for placement in self._covering[cell]:
+            if valid[placement]:
+                self._apply(placement, -1)
+                self._hits_in[placement] += 1
+                self._apply(placement, 1)
+
+    def record_sunk(self, ship):
+        """
+        Met à jour la carte après qu'un navire a été coulé.
+
+        Les cases du navire ne peuvent plus appartenir à un autre navire et
+        une taille de moins reste à trouver dans la flotte.
+
+        Args:
+            ship (Ship): Le navire coulé, avec sa position
+        """
+        index = segment_index(self.size, ship.size)
+        for cell in index.cells[index.find(*ship.position)]:
+            self._invalidate(cell)
+
+        if self.remaining[ship.size] <= 0:
+            return
+        self.remaining[ship.size] -= 1
+        if self.remaining[ship.size] == 0:
+            # Plus aucun navire de cette taille : retirer tous ses placements
+            valid = self._valid
+            for placement in self._by_length.get(ship.size, ()):
+                if valid[placement]:
+                    self._apply(placement, -1)
+                    valid[placement] = 0
+
+    def best_cell(self):
+        """
+        Retourne la case non ciblée ayant le meilleur score.
+
+        Returns:
+            tuple ou None: Coordonnées (x, y), None si toutes les cases ont été ciblées
+        """
+        heap, score, open_cells = self._heap, self.score, self._open
+        for cell in self._dirty:
+            if cell in open_cells:
+                heapq.heappush(heap, (-score[cell], cell))
+        self._dirty.clear()
+
+        while heap:
+            negative_score, cell = heap[0]
+            if cell in open_cells and -negative_score == score[cell]:
+                return cell % self.size, cell // self.size
+            heapq.heappop(heap)
+        return None
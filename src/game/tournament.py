@@ -0,0 +1,256 @@
+"""
+Tournoi entre stratégies d'IA, réparti sur plusieurs processus.
+
+Exemple :
+    python -m src.game.tournament --games 10000 --seed 42 --output resultats.jsonl
+
+Chaque partie reçoit une graine dérivée de la graine maîtresse, des deux
+stratégies et de son numéro : les résultats sont identiques quel que soit
+le nombre de processus utilisés. La graine d'une partie (champ seed du
+résultat) suffit à la rejouer avec match.play_ai_match, journal compris.
+
+Par défaut, la difficulté 'expert' n'est pas confrontée : même avec un
+nombre fixe d'échantillons par coup (voir AIPlayer.HEADLESS_SAMPLES), une
+de ses parties coûte plusieurs centaines de fois une partie 'difficile'.
+Elle s'ajoute explicitement :
+    python -m src.game.tournament --strategies difficile expert --games 200
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from collections import Counter
+from itertools import combinations
+
+from .ai_player import AIPlayer
+from .match import play_ai_match
+from .rules import DEFAULT_FLEET, GameRules
+
+# Stratégies confrontées par défaut ('expert' est trop lente pour des milliers de parties)
+DEFAULT_STRATEGIES = [name for name in AIPlayer.DIFFICULTIES if name != "expert"]
+
+
+def game_seed(master_seed, first, second, index):
+    """
+    Calcule la graine d'une partie.
+
+    Returns:
+        str: Graine déterministe, utilisable par match.play_ai_match
+    """
+    return f"{master_seed}:{first}:{second}:{index}"
+
+
+def play_game(task):
+    """
+    Joue une partie de tournoi (exécuté dans un processus de travail).
+
+    Les parties paires sont commencées par la première stratégie, les
+    parties impaires par la seconde.
+
+    Args:
+        task (tuple): (graine maîtresse, stratégie A, stratégie B, numéro, taille du plateau)
+
+    Returns:
+        dict: Résultat de la partie
+    """
+    master_seed, first, second, index, board_size = task
+    seed = game_seed(master_seed, first, second, index)
+    rules = GameRules(board_size, DEFAULT_FLEET)
+    names = [first, second] if index % 2 == 0 else [second, first]
+    result = play_ai_match(names[0], names[1], rules, seed)
+    winner = result['winner']
+    return {
+        'game': index,
+        'players': names,
+        'winner': None if winner is None else names[winner],
+        'shots': {names[0]: result['shots'][0], names[1]: result['shots'][1]},
+        'turns': result['turns'],
+        'seed': seed
+    }
+
+
+def play_chunk(tasks):
+    """Joue un lot de parties et retourne leurs résultats dans l'ordre."""
+    return [play_game(task) for task in tasks]
+
+
+def iter_tasks(strategies, games, master_seed, board_size, chunk_size):
+    """
+    Génère les lots de parties à jouer, confrontation par confrontation.
+
+    Yields:
+        list: Lot de tâches pour play_chunk
+    """
+    matchups = list(combinations(strategies, 2)) or [(strategies[0], strategies[0])]
+    for first, second in matchups:
+        for start in range(0, games, chunk_size):
+            yield [(master_seed, first, second, index, board_size)
+                   for index in range(start, min(start + chunk_size, games))]
+
+
+def percentile(counter, fraction):
+    """
+    Calcule un percentile à partir d'un histogramme.
+
+    Args:
+        counter (Counter): Histogramme valeur -> nombre d'occurrences
+        fraction (float): Rang recherché, entre 0 et 1
+
+    Returns:
+        int ou None: La valeur du percentile, None si l'histogramme est vide
+    """
+    total = sum(counter.values())
+    if not total:
+        return None
+    threshold = fraction * total
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= threshold:
+            return value
+    return max(counter)
+
+
+class TournamentStats:
+    """
+    Agrège les résultats d'un tournoi au fil de l'eau.
+
+    Attributes:
+        games (Counter): Parties jouées par stratégie
+        wins (Counter): Victoires par stratégie
+        shots_to_win (dict): Histogramme du nombre de tirs pour gagner, par stratégie
+        matchups (dict): Victoires par confrontation
+    """
+
+    def __init__(self):
+        """Initialise des statistiques vides."""
+        self.games = Counter()
+        self.wins = Counter()
+        self.shots_to_win = {}
+        self.matchups = {}
+
+    def add(self, result):
+        """
+        Ajoute le résultat d'une partie.
+
+        Args:
+            result (dict): Résultat retourné par play_game
+        """
+        players = result['players']
+        winner = result['winner']
+        key = " vs ".join(sorted(players))
+        matchup = self.matchups.setdefault(key, Counter())
+        matchup['games'] += 1
+        for name in set(players):
+            self.games[name] += 1
+        if winner is not None:
+            self.wins[winner] += 1
+            matchup[winner] += 1
+            histogram = self.shots_to_win.setdefault(winner, Counter())
+            histogram[result['shots'][winner]] += 1
+
+    def summary(self):
+        """
+        Produit le résumé du tournoi.
+
+        Returns:
+            dict: Taux de victoire et distribution des tirs par stratégie
+        """
+        strategies = {}
+        for name, games in sorted(self.games.items()):
+            histogram = self.shots_to_win.get(name, Counter())
+            wins = self.wins[name]
+            strategies[name] = {
+                'games': games,
+                'wins': wins,
+                'win_rate': round(wins / games * 100, 2) if games else 0,
+                'avg_shots_to_win': round(sum(k * v for k, v in histogram.items()) / wins, 2) if wins else None,
+                'p50_shots_to_win': percentile(histogram, 0.5),
+                'p90_shots_to_win': percentile(histogram, 0.9),
+                'shots_histogram': {str(k): histogram[k] for k in sorted(histogram)}
+            }
+        return {
+            'strategies': strategies,
+            'matchups': {key: dict(counts) for key, counts in sorted(self.matchups.items())}
+        }
+
+
+def run_tournament(strategies, games, master_seed=0, workers=None, board_size=10,
+                   chunk_size=200, on_result=None):
+    """
+    Joue toutes les confrontations entre les stratégies données.
+
+    Args:
+        strategies (list): Difficultés AIPlayer à confronter deux à deux
+        games (int): Nombre de parties par confrontation
+        master_seed (int): Graine maîtresse du tournoi
+        workers (int): Nombre de processus (par défaut, un par cœur)
+        board_size (int): Taille du plateau
+        chunk_size (int): Nombre de parties par lot envoyé à un processus
+        on_result (callable): Fonction appelée pour chaque résultat, dans l'ordre
+
+    Returns:
+        dict: Résumé du tournoi (voir TournamentStats.summary)
+    """
+    stats = TournamentStats()
+    tasks = iter_tasks(strategies, games, master_seed, board_size, chunk_size)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        chunks = map(play_chunk, tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        # imap conserve l'ordre des lots : la sortie est reproductible
+        chunks = pool.imap(play_chunk, tasks)
+    try:
+        for chunk in chunks:
+            for result in chunk:
+                stats.add(result)
+                if on_result is not None:
+                    on_result(result)
+    except BaseException:
+        # imap a déjà mis en file tous les lots : sans terminate, join
+        # attendrait la fin de chaque partie restante (Ctrl-C, erreur)
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        raise
+    if pool is not None:
+        pool.close()
+        pool.join()
+    return stats.summary()
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Tournoi entre stratégies d'IA de bataille navale")
+    parser.add_argument('--strategies', nargs='+', default=DEFAULT_STRATEGIES,
+                        choices=AIPlayer.DIFFICULTIES,
+                        help="Difficultés à confronter ('expert' est lente et doit être demandée)")
+    parser.add_argument('--games', type=int, default=1000, help="Parties par confrontation")
+    parser.add_argument('--seed', type=int, default=0, help="Graine maîtresse")
+    parser.add_argument('--workers', type=int, default=None, help="Nombre de processus")
+    parser.add_argument('--board-size', type=int, default=10, help="Taille du plateau")
+    parser.add_argument('--chunk-size', type=int, default=200, help="Parties par lot")
+    parser.add_argument('--output', help="Fichier JSON Lines recevant le résultat de chaque partie")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, 'w') if args.output else None
+    try:
+        on_result = None
+        if output is not None:
+            def on_result(result):
+                output.write(json.dumps(result) + "\n")
+        summary = run_tournament(args.strategies, args.games, args.seed, args.workers,
+                                 args.board_size, args.chunk_size, on_result)
+    finally:
+        if output is not None:
+            output.close()
+    json.dump(summary, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
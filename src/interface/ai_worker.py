@@ -0,0 +1,103 @@
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AIWorker:
+    """
+    Calcule les coups de l'IA dans un thread, hors de la boucle Tk.
+
+    Le résultat est récupéré par scrutation avec master.after, de sorte que
+    le callback s'exécute toujours dans le thread de Tk. Chaque demande
+    reçoit un événement d'arrêt (AIPlayer.stop_event) : il est levé quand le
+    budget de temps est dépassé, pour que les stratégies longues rendent
+    leur meilleur coup, ou quand la demande est annulée. Si la stratégie
+    échoue, l'erreur est affichée et l'IA joue un coup aléatoire : la
+    partie continue.
+
+    Attributes:
+        master (tk.Tk): Fenêtre principale, utilisée pour after
+        time_budget (float): Temps de réflexion accordé à l'IA, en secondes
+        poll_interval (int): Intervalle de scrutation du résultat, en millisecondes
+        last_elapsed_ms (float): Temps de calcul du dernier coup rendu, en millisecondes
+    """
+
+    def __init__(self, master, time_budget=1.0, poll_interval=10):
+        """
+        Initialise le calculateur et son thread.
+
+        Args:
+            master (tk.Tk): Fenêtre principale
+            time_budget (float): Temps de réflexion accordé à l'IA, en secondes
+            poll_interval (int): Intervalle de scrutation, en millisecondes
+        """
+        self.master = master
+        self.time_budget = time_budget
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai-move")
+        self._generation = 0
+        self._stop_event = None
+        self.last_elapsed_ms = None
+
+    @property
+    def busy(self):
+        """bool: True si un coup est en cours de calcul."""
+        return self._stop_event is not None
+
+    def request_move(self, ai, board, callback):
+        """
+        Demande le prochain coup de l'IA sans bloquer l'interface.
+
+        Args:
+            ai (AIPlayer): L'IA qui joue
+            board (Board): Le plateau visé, qui ne doit pas être modifié d'ici la réponse
+            callback (callable): Appelée dans le thread Tk avec (x, y)
+        """
+        self.cancel()
+        stop_event = threading.Event()
+        ai.stop_event = stop_event
+        self._stop_event = stop_event
+        future = self._executor.submit(self._timed_move, ai, board)
+        deadline = time.monotonic() + self.time_budget
+        self.master.after(self.poll_interval, self._poll, future, self._generation, deadline, callback)
+
+    @staticmethod
+    def _timed_move(ai, board):
+        """Calcule le coup de l'IA (dans le thread) en mesurant sa durée, un coup aléatoire en cas d'erreur"""
+        start = time.perf_counter()
+        try:
+            move = ai.get_move(board)
+        except Exception:
+            traceback.print_exc()
+            move = ai.get_random_move()
+        return move, (time.perf_counter() - start) * 1000
+
+    def _poll(self, future, generation, deadline, callback):
+        """Vérifie si le coup est prêt et le transmet au thread Tk"""
+        if generation != self._generation:
+            return  # Demande annulée entre-temps
+        if not future.done():
+            if time.monotonic() >= deadline:
+                self._stop_event.set()  # Budget dépassé : demander le meilleur coup connu
+            self.master.after(self.poll_interval, self._poll, future, generation, deadline, callback)
+            return
+        self._stop_event = None
+        try:
+            move, self.last_elapsed_ms = future.result()
+        except Exception:
+            traceback.print_exc()  # Aucune case à jouer : la partie est déjà finie
+            return
+        callback(*move)
+
+    def cancel(self):
+        """Abandonne le coup en cours : son résultat sera ignoré"""
+        self._generation += 1
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+
+    def shutdown(self):
+        """Annule le coup en cours et libère le thread"""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
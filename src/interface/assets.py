@@ -0,0 +1,188 @@
+import os
+import struct
+import tkinter as tk
+import weakref
+from collections import OrderedDict
+from fractions import Fraction
+
+MATERIALS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "materials")
+
+# Plus grand facteur de réduction combiné au zoom (échelles a/b avec a <= b <= MAX_SUBSAMPLE)
+MAX_SUBSAMPLE = 8
+
+
+def scale_factors(size, target_size):
+    """
+    Plus petite réduction zoom/subsample pour qu'une image couvre target_size.
+
+    Tk ne redimensionne que par facteurs entiers ; une échelle rationnelle
+    a/b (a <= b <= MAX_SUBSAMPLE) est obtenue en une seule copie avec
+    -zoom a et -subsample b. Une image n'est jamais agrandie : plus petite
+    que target_size, elle garde sa taille d'origine.
+
+    Args:
+        size (tuple): (largeur, hauteur) de l'image
+        target_size (tuple): (largeur, hauteur) à couvrir
+
+    Returns:
+        tuple: (zoom, subsample), (1, 1) pour la taille d'origine
+    """
+    scale = max(Fraction(max(1, target_size[0]), size[0]), Fraction(max(1, target_size[1]), size[1]))
+    if scale >= 1:
+        return 1, 1
+    best = None
+    for subsample in range(1, MAX_SUBSAMPLE + 1):
+        zoom = max(1, -(-scale.numerator * subsample // scale.denominator))  # Arrondi au supérieur
+        if best is None or Fraction(zoom, subsample) < Fraction(*best):
+            best = (zoom, subsample)
+    return best
+
+
+def png_size(path):
+    """Retourne (largeur, hauteur) d'un PNG en lisant son en-tête, sans le décoder (None si illisible)"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n' or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+class AssetManager:
+    """
+    Charge les images du jeu à la demande et garde les versions décodées.
+
+    Une image est demandée pour une taille cible (l'écran, en plein écran) :
+    elle est réduite à la plus petite échelle a/b qui couvre encore cette
+    taille (voir scale_factors), jamais agrandie. Les images décodées
+    sont gardées dans un cache LRU borné par leur taille en mémoire
+    (4 octets par pixel), ce qui évite de redécoder les fonds de plusieurs
+    mégaoctets à chaque retour au menu ou nouvelle partie.
+
+    Des variantes réduites, préparées à l'avance, peuvent être livrées dans
+    directory/variants sous le nom nom.LxH.png : la taille lue dans l'en-tête
+    PNG permet de choisir la variante avant tout décodage, et l'original
+    n'est alors ni décodé ni redimensionné. Rien n'est écrit sur le disque
+    pendant le jeu.
+
+    Attributes:
+        master (tk.Tk): Fenêtre principale, propriétaire des images
+        directory (str): Dossier des images originales
+        variants_dir (str): Dossier des variantes préparées
+        max_bytes (int): Taille maximale du cache, en octets de pixels décodés
+    """
+
+    def __init__(self, master, directory=MATERIALS_DIR, max_bytes=64 * 2 ** 20):
+        """Initialise un cache vide ; aucune image n'est lue avant d'être demandée"""
+        self.master = master
+        self.directory = directory
+        self.variants_dir = os.path.join(directory, "variants")
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._cache_bytes = 0
+
+    @property
+    def cache_bytes(self):
+        """int: Taille des images décodées actuellement en cache."""
+        return self._cache_bytes
+
+    def screen_size(self):
+        """Taille de l'écran de la fenêtre principale, en pixels"""
+        return self.master.winfo_screenwidth(), self.master.winfo_screenheight()
+
+    def image(self, name, target_size=None):
+        """
+        Retourne l'image name réduite pour couvrir target_size.
+
+        Les bords qui dépasseraient des proportions de target_size sont
+        retirés (recadrage centré) : l'image garde à peu près la taille
+        cible, sans pixels décodés hors de l'écran.
+
+        Args:
+            name (str): Nom du fichier dans directory ('main_menu.png')
+            target_size (tuple): (largeur, hauteur) à couvrir ; taille d'origine si None
+
+        Returns:
+            tk.PhotoImage: L'image, ou None si elle est absente ou illisible
+        """
+        path = os.path.join(self.directory, name)
+        size = png_size(path)
+        if size is None:
+            return None
+        zoom, subsample = (1, 1)
+        crop = (0, 0) + size
+        if target_size:
+            zoom, subsample = scale_factors(size, target_size)
+            # Partie de l'original qui couvre target_size une fois mise à l'échelle
+            crop_width = min(size[0], -(-target_size[0] * subsample // zoom))
+            crop_height = min(size[1], -(-target_size[1] * subsample // zoom))
+            left, top = (size[0] - crop_width) // 2, (size[1] - crop_height) // 2
+            crop = (left, top, left + crop_width, top + crop_height)
+        # Taille obtenue par la copie de Tk, qui arrondit au supérieur
+        width = -(-(crop[2] - crop[0]) * zoom // subsample)
+        height = -(-(crop[3] - crop[1]) * zoom // subsample)
+        key = (name, width, height)
+        photo = self._cache.get(key)
+        if photo is not None:
+            self._cache.move_to_end(key)
+            return photo
+
+        photo = self._load(name, path, zoom, subsample, crop, width, height)
+        if photo is None:
+            return None
+        self._cache[key] = photo
+        self._cache_bytes += photo.width() * photo.height() * 4
+        self._evict()
+        return photo
+
+    @staticmethod
+    def _variant_path(directory, name, width, height):
+        """Chemin de la variante d'une image à une taille donnée"""
+        stem, extension = os.path.splitext(name)
+        return os.path.join(directory, f"{stem}.{width}x{height}{extension}")
+
+    def _load(self, name, path, zoom, subsample, crop, width, height):
+        """Décode la variante préparée à la bonne taille si elle existe, sinon l'original réduit"""
+        scaled = (width, height) != tuple(crop[2:]) or crop[:2] != (0, 0)
+        if scaled:
+            variant = self._variant_path(self.variants_dir, name, width, height)
+            if png_size(variant) == (width, height):
+                try:
+                    return tk.PhotoImage(master=self.master, file=variant)
+                except tk.TclError:
+                    pass  # Variante corrompue : repartir de l'original
+        try:
+            photo = tk.PhotoImage(master=self.master, file=path)
+        except tk.TclError:
+            return None
+        if scaled:
+            # Une seule copie (recadrage et réduction), sans image intermédiaire
+            original, photo = photo, tk.PhotoImage(master=self.master)
+            photo.tk.call(photo, 'copy', original, '-from', *crop,
+                          '-zoom', zoom, zoom, '-subsample', subsample, subsample)
+        return photo
+
+    def _evict(self):
+        """Oublie les images les moins récemment demandées au-delà de max_bytes"""
+        while self._cache_bytes > self.max_bytes and len(self._cache) > 1:
+            _, photo = self._cache.popitem(last=False)
+            self._cache_bytes -= photo.width() * photo.height() * 4
+
+    def clear(self):
+        """Vide le cache"""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+
+_managers = weakref.WeakKeyDictionary()
+
+
+def get_assets(master):
+    """Retourne le gestionnaire d'images partagé de la fenêtre principale de master"""
+    root = master.winfo_toplevel()
+    manager = _managers.get(root)
+    if manager is None:
+        manager = _managers[root] = AssetManager(root)
+    return manager
@@ -0,0 +1,191 @@
+import tkinter as tk
+
+
+def column_label(index):
+    """Retourne le libellé d'une colonne (A-Z, puis AA, AB, ...)"""
+    label = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(65 + remainder) + label
+    return label
+
+
+class BoardView:
+    """
+    Affichage d'un plateau sur un unique Canvas.
+
+    Chaque case possède des éléments graphiques créés une seule fois (fond,
+    croix et cercle masqués) : un tir ou un aperçu ne fait que modifier leur
+    couleur ou leur visibilité. Les clics et le survol sont convertis en
+    coordonnées de case à partir de la position de la souris.
+
+    Les modifications ne sont pas appliquées immédiatement : les cases
+    changées sont marquées comme « sales » et le canvas n'est mis à jour
+    qu'une fois par tour de boucle Tk (after_idle), uniquement pour les
+    cases dont l'état final diffère de l'état affiché.
+
+    Attributes:
+        canvas (tk.Canvas): Le canvas contenant tout le plateau
+        board_size (int): Nombre de cases par côté
+        cell_size (int): Taille d'une case en pixels
+    """
+
+    LABEL_MARGIN = 20  # Place réservée aux libellés des lignes et colonnes
+    MARKER_PADDING = 5
+
+    def __init__(self, parent, board_size, cell_size, on_click=None, on_enter=None, on_leave=None):
+        """
+        Crée le canvas et les éléments de toutes les cases.
+
+        Args:
+            parent (tk.Widget): Widget parent
+            board_size (int): Nombre de cases par côté
+            cell_size (int): Taille d'une case en pixels
+            on_click (callable): Appelée avec (x, y) lors d'un clic sur une case
+            on_enter (callable): Appelée avec (x, y) quand la souris entre dans une case
+            on_leave (callable): Appelée avec (x, y) quand la souris quitte une case
+        """
+        self.board_size = board_size
+        self.cell_size = cell_size
+        self.on_click = on_click
+        self.on_enter = on_enter
+        self.on_leave = on_leave
+        self._hovered = None
+
+        # État voulu et état affiché de chaque case : (couleur, marqueur)
+        cell_count = board_size * board_size
+        self._fill = ['white'] * cell_count
+        self._marker = [None] * cell_count
+        self._shown_fill = ['white'] * cell_count
+        self._shown_marker = [None] * cell_count
+        self._dirty = set()
+        self._flush_id = None
+
+        margin = self.LABEL_MARGIN
+        side = board_size * cell_size
+        self.canvas = tk.Canvas(
+            parent,
+            width=side + margin,
+            height=side + margin,
+            bg=parent.cget('bg'),
+            highlightthickness=0
+        )
+
+        # Libellés des colonnes (en haut) et des lignes (à droite)
+        font = ('Arial', 9 if cell_size >= 20 else 6)
+        for i in range(board_size):
+            center = i * cell_size + cell_size // 2
+            self.canvas.create_text(center, margin // 2, text=column_label(i), font=font)
+            self.canvas.create_text(side + margin // 2, margin + center, text=str(i + 1), font=font)
+
+        # Éléments persistants de chaque case : fond, croix (2 lignes) et cercle
+        padding = min(self.MARKER_PADDING, cell_size // 4)
+        self._rects = []
+        self._hit_items = []
+        self._miss_items = []
+        for y in range(board_size):
+            for x in range(board_size):
+                x1 = x * cell_size
+                y1 = margin + y * cell_size
+                x2, y2 = x1 + cell_size, y1 + cell_size
+                self._rects.append(self.canvas.create_rectangle(
+                    x1, y1, x2, y2, fill='white', outline='black'))
+                self._hit_items.append((
+                    self.canvas.create_line(x1 + padding, y1 + padding, x2 - padding, y2 - padding,
+                                            fill='red', width=2, state='hidden'),
+                    self.canvas.create_line(x1 + padding, y2 - padding, x2 - padding, y1 + padding,
+                                            fill='red', width=2, state='hidden')
+                ))
+                self._miss_items.append(self.canvas.create_oval(
+                    x1 + padding, y1 + padding, x2 - padding, y2 - padding,
+                    outline='blue', width=2, state='hidden'))
+
+        self.canvas.bind('<Button-1>', self._handle_click)
+        self.canvas.bind('<Motion>', self._handle_motion)
+        self.canvas.bind('<Leave>', self._handle_leave)
+
+    def pack(self, **kwargs):
+        """Place le canvas dans son parent"""
+        self.canvas.pack(**kwargs)
+
+    def cell_at(self, px, py):
+        """Retourne la case (x, y) sous un point du canvas, ou None"""
+        py -= self.LABEL_MARGIN
+        if px < 0 or py < 0:
+            return None
+        x, y = int(px // self.cell_size), int(py // self.cell_size)
+        if x >= self.board_size or y >= self.board_size:
+            return None
+        return x, y
+
+    def set_color(self, x, y, color):
+        """Change la couleur de fond d'une case"""
+        index = y * self.board_size + x
+        self._fill[index] = color
+        self._mark_dirty(index)
+
+    def show_hit(self, x, y):
+        """Affiche la croix rouge d'un tir réussi"""
+        index = y * self.board_size + x
+        self._marker[index] = 'hit'
+        self._mark_dirty(index)
+
+    def show_miss(self, x, y):
+        """Affiche le cercle bleu d'un tir manqué"""
+        index = y * self.board_size + x
+        self._marker[index] = 'miss'
+        self._mark_dirty(index)
+
+    def clear_marker(self, x, y):
+        """Efface la croix ou le cercle d'une case"""
+        index = y * self.board_size + x
+        self._marker[index] = None
+        self._mark_dirty(index)
+
+    def _mark_dirty(self, index):
+        """Note qu'une case a changé et programme un rafraîchissement"""
+        self._dirty.add(index)
+        if self._flush_id is None:
+            self._flush_id = self.canvas.after_idle(self.flush)
+
+    def flush(self):
+        """Applique au canvas les changements des cases modifiées"""
+        self._flush_id = None
+        canvas = self.canvas
+        for index in self._dirty:
+            fill = self._fill[index]
+            if fill != self._shown_fill[index]:
+                canvas.itemconfigure(self._rects[index], fill=fill)
+                self._shown_fill[index] = fill
+            marker = self._marker[index]
+            if marker != self._shown_marker[index]:
+                hit_state = 'normal' if marker == 'hit' else 'hidden'
+                for item in self._hit_items[index]:
+                    canvas.itemconfigure(item, state=hit_state)
+                canvas.itemconfigure(self._miss_items[index],
+                                     state='normal' if marker == 'miss' else 'hidden')
+                self._shown_marker[index] = marker
+        self._dirty.clear()
+
+    def _handle_click(self, event):
+        """Transmet un clic à on_click avec les coordonnées de la case"""
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None and self.on_click is not None:
+            self.on_click(*cell)
+
+    def _handle_motion(self, event):
+        """Émule les événements d'entrée et de sortie de case"""
+        cell = self.cell_at(event.x, event.y)
+        if cell == self._hovered:
+            return
+        self._handle_leave(event)
+        self._hovered = cell
+        if cell is not None and self.on_enter is not None:
+            self.on_enter(*cell)
+
+    def _handle_leave(self, event):
+        """Signale la sortie de la case survolée"""
+        if self._hovered is not None and self.on_leave is not None:
+            self.on_leave(*self._hovered)
+        self._hovered = None
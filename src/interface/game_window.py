@@ -1,34 +1,46 @@
 import tkinter as tk
 from ..game.board import Board
-from ..game.ship import Ship
 from ..game.ai_player import AIPlayer
+from ..game.match import Match, derive_rng, place_fleet_randomly
+from ..game.placement import segment_index
+from ..game.replay import MoveLog, prune_logs
+from ..game.rules import DEFAULT_RULES
+import os
 import random
 import time
-from ..game.game_stats import GameStats
+from ..game.stats_db import open_game_stats
+from .ai_worker import AIWorker
+from .board_view import BoardView
+
 
 class GameWindow:
-    def __init__(self, master, difficulty="moyen"):
+    REPLAY_DIR = "replays"
+    REPLAY_KEEP = 20  # Journaux de partie conservés
+    
+    def __init__(self, master, difficulty="moyen", rules=None, seed=None, game_stats=None):
         self.master = master
         self.master.title("Bataille Navale")
-        self.cell_size = 40
-        self.board_size = 10
+        self.rules = rules or DEFAULT_RULES
+        self.board_size = self.rules.board_size
+        # Réduire les cases sur les grands plateaux (40 px pour un 10x10)
+        self.cell_size = min(40, max(8, 400 // self.board_size))
         self.difficulty = difficulty
-        self.game_stats = GameStats()
+        self.game_stats = game_stats if game_stats is not None else open_game_stats()
+        # Graine de la partie : flotte et coups de l'IA sont reproductibles
+        self.seed = seed if seed is not None else random.getrandbits(32)
         
         # Création des plateaux
-        self.player_board = Board()
-        self.ai_board = Board()
-        self.ai = AIPlayer(difficulty)
+        self.player_board = Board(self.rules)
+        self.ai_board = Board(self.rules)
+        self.ai = AIPlayer(difficulty, self.rules, rng=derive_rng(self.seed, "ai1"))
+        self.ai_worker = AIWorker(self.master)
+        self.match = None
+        self.move_log = None
+        self._player_synced = 0  # Tirs de board.shot_history déjà affichés
+        self._ai_synced = 0
         
         # Liste des navires
-        self.ships = [
-            Ship("Porte-avions", 5),
-            Ship("Croiseur", 4),
-            Ship("Destroyer", 3),
-            Ship("Destroyer", 3),
-            Ship("Sous-marin", 2),
-            Ship("Sous-marin", 2)
-        ]
+        self.ships = self.rules.create_fleet()
         
         # Variables de statistiques
         self.player_hits = 0
@@ -180,163 +192,66 @@ class GameWindow:
         self.player_sunk_ships_label.config(text="\n".join(self.player_sunk_ships) or "Aucun")
         
     def setup_player_board(self):
-        # Grille du joueur avec labels
-        self.player_frame = tk.Frame(self.grids_frame)
-        self.player_frame.pack(side=tk.LEFT, padx=20)
-        
-        # Labels des colonnes (A-J)
-        for j in range(self.board_size):
-            tk.Label(self.player_frame, text=chr(65 + j), width=2).grid(row=0, column=j)
-        
-        # Labels des lignes (1-10)
-        for i in range(self.board_size):
-            tk.Label(self.player_frame, text=str(i + 1), width=2).grid(row=i+1, column=self.board_size)
-        
-        # Création de la grille
-        self.player_cells = []
-        for i in range(self.board_size):
-            row = []
-            for j in range(self.board_size):
-                cell = self.create_cell(self.player_frame, j, i)
-                row.append(cell)
-            self.player_cells.append(row)
+        # Grille du joueur (un seul canvas, libellés compris)
+        self.player_view = BoardView(
+            self.grids_frame,
+            self.board_size,
+            self.cell_size,
+            on_click=self.place_ship_at,
+            on_enter=lambda x, y: self.preview_ship_placement(x, y, True),
+            on_leave=lambda x, y: self.preview_ship_placement(x, y, False)
+        )
+        self.player_view.pack(side=tk.LEFT, padx=20)
     
     def setup_ai_board(self):
-        # Grille de l'IA avec labels
-        self.ai_frame = tk.Frame(self.grids_frame)
-        self.ai_frame.pack(side=tk.LEFT, padx=20)
-        
-        # Labels des colonnes (A-J)
-        for j in range(self.board_size):
-            tk.Label(self.ai_frame, text=chr(65 + j), width=2).grid(row=0, column=j)
-        
-        # Labels des lignes (1-10)
-        for i in range(self.board_size):
-            tk.Label(self.ai_frame, text=str(i + 1), width=2).grid(row=i+1, column=self.board_size)
-        
-        # Création de la grille
-        self.ai_cells = []
-        for i in range(self.board_size):
-            row = []
-            for j in range(self.board_size):
-                cell = self.create_cell(self.ai_frame, j, i, True)
-                row.append(cell)
-            self.ai_cells.append(row)
-    
-    def create_cell(self, parent, x, y, is_ai_board=False):
-        """Crée une cellule de la grille"""
-        cell = tk.Frame(
-            parent,
-            width=self.cell_size,
-            height=self.cell_size,
-            bg='white',
-            highlightbackground='black',
-            highlightthickness=1
+        # Grille de l'IA (un seul canvas, libellés compris)
+        self.ai_view = BoardView(
+            self.grids_frame,
+            self.board_size,
+            self.cell_size,
+            on_click=self.cell_clicked
         )
-        cell.grid(row=y+1, column=x, padx=0, pady=0)
-        cell.grid_propagate(False)  # Empêche le redimensionnement
-        
-        # Canvas pour les marqueurs
-        canvas = tk.Canvas(
-            cell,
-            width=self.cell_size,
-            height=self.cell_size,
-            bg='white',
-            highlightthickness=0
-        )
-        canvas.place(relx=0, rely=0, relwidth=1, relheight=1)
-        cell.canvas = canvas  # Stocker le canvas dans la cellule
-        
-        if is_ai_board:
-            canvas.bind('<Button-1>', lambda e, x=x, y=y: self.cell_clicked(x, y))
-            cell.bind('<Button-1>', lambda e, x=x, y=y: self.cell_clicked(x, y))
-        else:
-            # Événements pour le placement des bateaux
-            canvas.bind('<Enter>', lambda e, x=x, y=y: self.preview_ship_placement(x, y, True))
-            canvas.bind('<Leave>', lambda e, x=x, y=y: self.preview_ship_placement(x, y, False))
-            canvas.bind('<Button-1>', lambda e, x=x, y=y: self.place_ship_at(x, y))
-            cell.bind('<Enter>', lambda e, x=x, y=y: self.preview_ship_placement(x, y, True))
-            cell.bind('<Leave>', lambda e, x=x, y=y: self.preview_ship_placement(x, y, False))
-            cell.bind('<Button-1>', lambda e, x=x, y=y: self.place_ship_at(x, y))
-        
-        return cell
+        self.ai_view.pack(side=tk.LEFT, padx=20)
 
-    def draw_hit_marker(self, cell):
+    def draw_hit_marker(self, view, x, y):
         """Dessine une croix rouge pour un tir réussi"""
-        canvas = cell.canvas
-        canvas.delete('all')  # Effacer les marqueurs précédents
-        
-        # Calculer les coordonnées pour la croix
-        padding = 5
-        x1, y1 = padding, padding
-        x2, y2 = self.cell_size - padding, self.cell_size - padding
-        
-        # Dessiner la croix
-        canvas.create_line(x1, y1, x2, y2, fill='red', width=2)
-        canvas.create_line(x1, y2, x2, y1, fill='red', width=2)
+        view.show_hit(x, y)
     
-    def draw_miss_marker(self, cell):
+    def draw_miss_marker(self, view, x, y):
         """Dessine un cercle bleu pour un tir manqué"""
-        canvas = cell.canvas
-        canvas.delete('all')  # Effacer les marqueurs précédents
-        
-        # Calculer les coordonnées pour le cercle
-        padding = 5
-        x1, y1 = padding, padding
-        x2, y2 = self.cell_size - padding, self.cell_size - padding
-        
-        # Dessiner le cercle
-        canvas.create_oval(x1, y1, x2, y2, outline='blue', width=2)
+        view.show_miss(x, y)
     
-    def reveal_sunk_ship(self, ship, cells):
+    def reveal_sunk_ship(self, ship, view):
         """Affiche visuellement un navire coulé sur le plateau"""
         x, y, horizontal = ship.position
         for i in range(ship.size):
-            if horizontal:
-                cell = cells[y][x + i]
-            else:
-                cell = cells[y + i][x]
-            cell.configure(bg='darkred')
-            cell.canvas.configure(bg='darkred')
+            cell_x = x + i if horizontal else x
+            cell_y = y if horizontal else y + i
+            view.set_color(cell_x, cell_y, 'darkred')
             # Redessiner la croix sur le fond rouge
-            self.draw_hit_marker(cell)
+            self.draw_hit_marker(view, cell_x, cell_y)
     
     def preview_ship_placement(self, x, y, show):
         """Affiche ou cache l'aperçu du placement d'un bateau"""
         if self.placing_ships and self.current_ship_index < len(self.ships):
             ship = self.ships[self.current_ship_index]
-            cells_to_update = []
-            
-            # Vérifier si le placement est possible
-            if self.horizontal:
-                if x + ship.size <= self.board_size:
-                    cells_to_update = [(x + i, y) for i in range(ship.size)]
-            else:
-                if y + ship.size <= self.board_size:
-                    cells_to_update = [(x, y + i) for i in range(ship.size)]
-            
-            # Vérifier les collisions avec d'autres bateaux
-            valid_placement = True
-            if cells_to_update:
-                for cell_x, cell_y in cells_to_update:
-                    if self.player_board.grid[cell_y][cell_x] != 0:
-                        valid_placement = False
-                        break
-            else:
-                valid_placement = False
             
-            # Mettre à jour les couleurs
-            if cells_to_update:
-                for cell_x, cell_y in cells_to_update:
-                    cell = self.player_cells[cell_y][cell_x]
+            # Cases du segment, lues dans l'index précalculé (aucune si hors plateau)
+            index = segment_index(self.board_size, ship.size)
+            segment = index.find(x, y, self.horizontal)
+            if segment is not None:
+                # Vérifier les collisions avec d'autres bateaux
+                valid_placement = self.player_board.can_place_ship(ship.size, x, y, self.horizontal)
+                
+                # Mettre à jour les couleurs
+                for cell in index.cells[segment]:
+                    cell_x, cell_y = cell % self.board_size, cell // self.board_size
                     if show:
-                        cell.configure(bg='lightgreen' if valid_placement else 'pink')
-                        cell.canvas.configure(bg='lightgreen' if valid_placement else 'pink')
+                        self.player_view.set_color(cell_x, cell_y, 'lightgreen' if valid_placement else 'pink')
                     else:
-                        current_state = self.player_board.grid[cell_y][cell_x]
-                        color = 'gray' if current_state == 1 else 'white'
-                        cell.configure(bg=color)
-                        cell.canvas.configure(bg=color)
+                        current_state = self.player_board.get_cell_state(cell_x, cell_y)
+                        color = 'gray' if current_state == 'ship' else 'white'
+                        self.player_view.set_color(cell_x, cell_y, color)
     
     def is_cell_in_ship(self, x, y, ship_position):
         ship_x, ship_y, ship_horizontal, ship_size = ship_position
@@ -349,49 +264,29 @@ class GameWindow:
         if self.placing_ships and self.current_ship_index < len(self.ships):
             ship = self.ships[self.current_ship_index]
             
-            # Vérifier si le placement est possible
-            if self.horizontal:
-                if x + ship.size <= self.board_size:
-                    cells_to_place = [(x + i, y) for i in range(ship.size)]
-            else:
-                if y + ship.size <= self.board_size:
-                    cells_to_place = [(x, y + i) for i in range(ship.size)]
-            
-            # Vérifier si les cellules sont libres
-            valid_placement = True
-            if cells_to_place:
-                for cell_x, cell_y in cells_to_place:
-                    if self.player_board.grid[cell_y][cell_x] != 0:
-                        valid_placement = False
-                        break
-            else:
-                valid_placement = False
+            # Retirer l'ancien placement pour permettre de déplacer le bateau
+            old_position = self.placed_ships.get(self.current_ship_index)
+            if old_position:
+                self.player_board.remove_ship(ship)
             
             # Si le placement est valide, placer le bateau
-            if valid_placement and cells_to_place:
+            if self.player_board.place_ship(ship, x, y, self.horizontal):
                 # Effacer l'ancien placement si existant
-                if self.current_ship_index in self.placed_ships:
-                    old_x, old_y, old_horizontal, old_size = self.placed_ships[self.current_ship_index]
-                    if old_horizontal:
-                        old_cells = [(old_x + i, old_y) for i in range(old_size)]
-                    else:
-                        old_cells = [(old_x, old_y + i) for i in range(old_size)]
-                    for old_x, old_y in old_cells:
-                        if 0 <= old_x < self.board_size and 0 <= old_y < self.board_size:
-                            self.player_board.grid[old_y][old_x] = 0
-                            self.player_cells[old_y][old_x].configure(bg='white')
-                            self.player_cells[old_y][old_x].canvas.configure(bg='white')
+                if old_position:
+                    old_x, old_y, old_horizontal, old_size = old_position
+                    for i in range(old_size):
+                        old_cell_x = old_x + i if old_horizontal else old_x
+                        old_cell_y = old_y if old_horizontal else old_y + i
+                        self.player_view.set_color(old_cell_x, old_cell_y, 'white')
                 
-                # Placer le nouveau bateau
-                for cell_x, cell_y in cells_to_place:
-                    self.player_board.grid[cell_y][cell_x] = 1
-                    self.player_cells[cell_y][cell_x].configure(bg='gray')
-                    self.player_cells[cell_y][cell_x].canvas.configure(bg='gray')
+                # Afficher le nouveau bateau
+                for i in range(ship.size):
+                    cell_x = x + i if self.horizontal else x
+                    cell_y = y if self.horizontal else y + i
+                    self.player_view.set_color(cell_x, cell_y, 'gray')
                 
                 # Sauvegarder la position du bateau
-                ship.position = (x, y, self.horizontal)
                 self.placed_ships[self.current_ship_index] = (x, y, self.horizontal, ship.size)
-                self.player_board.ships.append(ship)
                 
                 # Passer au bateau suivant
                 self.current_ship_index += 1
@@ -401,19 +296,23 @@ class GameWindow:
                 if self.current_ship_index >= len(self.ships):
                     self.current_ship_index = 0  # Revenir au premier bateau pour permettre les ajustements
                     self.message_label.config(text="Ajustez la position des bateaux si nécessaire\npuis cliquez sur VALIDER")
+            elif old_position:
+                # Placement invalide : remettre le bateau à son ancienne position
+                self.player_board.place_ship(ship, *old_position[:3])
 
     def validate_placement(self):
         """Valide le placement des bateaux et commence la partie"""
         # Vérifier si tous les bateaux ont une position
         if len(self.placed_ships) == len(self.ships):
             # Mettre à jour le plateau avec les positions finales
-            self.player_board = Board()  # Réinitialiser le plateau
+            self.player_board = Board(self.rules)  # Réinitialiser le plateau
             for i, ship in enumerate(self.ships):
                 x, y, horizontal, _ = self.placed_ships[i]
                 self.player_board.place_ship(ship, x, y, horizontal)
             
             # Placer les bateaux de l'IA
             self.place_ai_ships()
+            self.match = Match([self.player_board, self.ai_board], [None, self.ai], self.open_move_log())
             
             # Passer à la phase de jeu
             self.placing_ships = False
@@ -432,24 +331,29 @@ class GameWindow:
 
     def place_ai_ships(self):
         """Place les bateaux de l'IA de manière aléatoire"""
-        self.ai_board = Board()  # Réinitialiser le plateau de l'IA
-        ai_ships = [
-            Ship("Porte-avions", 5),
-            Ship("Croiseur", 4),
-            Ship("Destroyer", 3),
-            Ship("Destroyer", 3),
-            Ship("Sous-marin", 2),
-            Ship("Sous-marin", 2)
-        ]
-        
-        for ship in ai_ships:
-            placed = False
-            while not placed:
-                x = random.randint(0, self.board_size - 1)
-                y = random.randint(0, self.board_size - 1)
-                horizontal = random.choice([True, False])
-                if self.ai_board.place_ship(ship, x, y, horizontal):
-                    placed = True
+        self.ai_board = Board(self.rules)  # Réinitialiser le plateau de l'IA
+        place_fleet_randomly(self.ai_board, self.rules.create_fleet(), derive_rng(self.seed, "fleet1"))
+    
+    def open_move_log(self):
+        """Ouvre le journal de la partie (rejouable depuis le menu principal)"""
+        self.close_move_log()
+        prune_logs(self.REPLAY_DIR, self.REPLAY_KEEP - 1)
+        path = os.path.join(self.REPLAY_DIR, f"partie-{time.strftime('%Y%m%d-%H%M%S')}-{self.seed}.jsonl")
+        try:
+            self.move_log = MoveLog(path)
+        except OSError:
+            self.move_log = None  # Dossier non accessible : jouer sans journal
+            return None
+        self.move_log.start(self.rules, self.seed, ["humain", self.difficulty])
+        self.move_log.fleet(0, self.player_board)
+        self.move_log.fleet(1, self.ai_board)
+        return self.move_log
+    
+    def close_move_log(self):
+        """Ferme le journal de la partie en cours"""
+        if self.move_log is not None:
+            self.move_log.close()
+            self.move_log = None
 
     def toggle_rotation(self):
         if self.placing_ships:
@@ -461,36 +365,33 @@ class GameWindow:
 
     def cell_clicked(self, x, y):
         """Gestion des clics sur la grille de l'IA"""
-        if not self.placing_ships and not self.game_over:
+        if not self.placing_ships and not self.game_over and not self.ai_worker.busy:
             # Vérifier si la cellule n'a pas déjà été ciblée
-            result = self.ai_board.receive_shot(x, y)
+            outcome = self.match.fire(0, x, y)
+            result = outcome['result']
             if result is not None:  # Si le tir est valide
-                cell = self.ai_cells[y][x]
-                cell.configure(bg='white')
-                cell.canvas.configure(bg='white')
+                self.update_ai_board()
                 
                 if result:  # Touché
-                    self.draw_hit_marker(cell)
                     self.message_label.config(text="Touché !")
                     self.player_hits += 1
                     
                     # Vérifier si un navire a été coulé
-                    sunk_ship = self.ai_board.check_sunk_ship(x, y)
+                    sunk_ship = outcome['sunk']
                     if sunk_ship:
                         self.ai_sunk_ships.append(sunk_ship.name)
                         self.message_label.config(text=f"Coulé ! {sunk_ship.name} détruit !")
                         # Révéler et marquer le navire coulé
-                        self.reveal_sunk_ship(sunk_ship, self.ai_cells)
+                        self.reveal_sunk_ship(sunk_ship, self.ai_view)
                     
                     self.update_stats()
                     # Vérifier si tous les navires sont coulés
-                    if self.ai_board.all_ships_sunk():
+                    if outcome['game_over']:
                         self.message_label.config(text="Victoire ! Vous avez gagné !")
                         self.game_over = True
                         self.show_replay_button()
                         return
                 else:  # Manqué
-                    self.draw_miss_marker(cell)
                     self.message_label.config(text="Manqué !")
                     self.player_misses += 1
                     self.update_stats()
@@ -500,42 +401,38 @@ class GameWindow:
                     self.play_ai_turn()
 
     def play_ai_turn(self):
-        """Fait jouer l'IA"""
+        """Fait jouer l'IA : son coup est calculé en arrière-plan"""
         if not self.game_over:
-            # Obtenir le coup de l'IA
-            x, y = self.ai.get_move(self.player_board)
-            
-            # Effectuer le tir
-            result = self.player_board.receive_shot(x, y)
+            self.ai_worker.request_move(self.ai, self.player_board, self.apply_ai_move)
+
+    def apply_ai_move(self, x, y):
+        """Applique le coup calculé par l'IA"""
+        if not self.game_over:
+            # Effectuer le tir (l'IA est notifiée du résultat par le match)
+            outcome = self.match.fire(1, x, y, self.ai_worker.last_elapsed_ms)
+            result = outcome['result']
             if result is not None:  # Si le tir est valide
-                cell = self.player_cells[y][x]
-                cell.configure(bg='white')
-                cell.canvas.configure(bg='white')
-                
-                # Notifier l'IA du résultat
-                self.ai.notify_hit(x, y, result)
+                self.update_player_board()
                 
                 if result:  # Touché
-                    self.draw_hit_marker(cell)
                     self.message_label.config(text="L'IA vous a touché !")
                     self.ai_hits += 1
                     
                     # Vérifier si un navire a été coulé
-                    sunk_ship = self.player_board.check_sunk_ship(x, y)
+                    sunk_ship = outcome['sunk']
                     if sunk_ship:
                         self.player_sunk_ships.append(sunk_ship.name)
                         self.message_label.config(text=f"L'IA a coulé votre {sunk_ship.name} !")
                         # Marquer le navire coulé
-                        self.reveal_sunk_ship(sunk_ship, self.player_cells)
+                        self.reveal_sunk_ship(sunk_ship, self.player_view)
                     
                     self.update_stats()
                     # Vérifier si tous les navires sont coulés
-                    if self.player_board.all_ships_sunk():
+                    if outcome['game_over']:
                         self.message_label.config(text="Game Over ! L'IA a gagné !")
                         self.game_over = True
                         self.show_replay_button()
                 else:  # Manqué
-                    self.draw_miss_marker(cell)
                     self.message_label.config(text="L'IA vous a manqué ! À vous de jouer !")
                     self.ai_misses += 1
                     self.update_stats()
@@ -550,24 +447,29 @@ class GameWindow:
             self.current_ship_label.config(text="")
 
     def update_player_board(self):
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                if self.player_board.grid[i][j] == 1:
-                    self.player_cells[i][j].configure(bg='gray')
-                elif self.player_board.grid[i][j] == 2:
-                    self.player_cells[i][j].configure(bg='blue')
-                elif self.player_board.grid[i][j] == 3:
-                    self.player_cells[i][j].configure(bg='red')
+        """Affiche les tirs de l'IA reçus depuis la dernière mise à jour"""
+        self._player_synced = self._sync_shots(self.player_board, self.player_view, self._player_synced)
                     
     def update_ai_board(self):
-        for i in range(self.board_size):
-            for j in range(self.board_size):
-                if self.ai_board.grid[i][j] == 2:
-                    self.ai_cells[i][j].configure(bg='blue')
-                elif self.ai_board.grid[i][j] == 3:
-                    self.ai_cells[i][j].configure(bg='red')
+        """Affiche les tirs du joueur reçus depuis la dernière mise à jour"""
+        self._ai_synced = self._sync_shots(self.ai_board, self.ai_view, self._ai_synced)
+    
+    def _sync_shots(self, board, view, synced):
+        """Reporte sur la vue les tirs de board.shot_history[synced:]"""
+        new_shots = board.shot_history[synced:]
+        for x, y in new_shots:
+            view.set_color(x, y, 'white')
+            if board.get_cell_state(x, y) == 'hit':
+                self.draw_hit_marker(view, x, y)
+            else:
+                self.draw_miss_marker(view, x, y)
+        return synced + len(new_shots)
                     
     def return_to_main_menu(self):
+        # Abandonner le calcul de l'IA en cours
+        self.ai_worker.shutdown()
+        self.close_move_log()
+        
         # Détruire la fenêtre de jeu actuelle
         self.container.destroy()
         
@@ -576,7 +478,7 @@ class GameWindow:
         
         # Recréer le menu principal
         from .mainmenu import MainMenu
-        MainMenu(self.master)
+        MainMenu(self.master, self.game_stats)
 
     def show_replay_button(self):
         """Affiche le bouton rejouer et sauvegarde les statistiques"""
@@ -603,16 +505,25 @@ class GameWindow:
             'ai_accuracy': round(self.ai_hits / (self.ai_hits + self.ai_misses) * 100, 2) if (self.ai_hits + self.ai_misses) > 0 else 0
         }
         self.game_stats.save_game_stats(stats)
+        self.close_move_log()
     
     def restart_game(self):
         """Redémarre une nouvelle partie"""
+        # Abandonner le calcul de l'IA en cours
+        self.ai_worker.cancel()
+        self.close_move_log()
+        
         # Détruire le conteneur principal
         self.container.destroy()
         
         # Réinitialiser les variables
-        self.player_board = Board()
-        self.ai_board = Board()
-        self.ai = AIPlayer(self.difficulty)
+        self.player_board = Board(self.rules)
+        self.ai_board = Board(self.rules)
+        self.seed = random.getrandbits(32)
+        self.ai = AIPlayer(self.difficulty, self.rules, rng=derive_rng(self.seed, "ai1"))
+        self.match = None
+        self._player_synced = 0
+        self._ai_synced = 0
         self.current_ship_index = 0
         self.placing_ships = True
         self.horizontal = True
@@ -1,7 +1,9 @@
+import os
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, messagebox, ttk
 from .game_window import GameWindow
-from ..game.game_stats import GameStats
+from .replay_window import ReplayWindow
+from ..game.stats_db import open_game_stats
 
 class MainMenu:
     """
@@ -11,12 +13,12 @@ class MainMenu:
     de démarrer une nouvelle partie, voir les statistiques, et quitter le jeu.
     """
     
-    def __init__(self, master):
-        """Initialise le menu principal"""
+    def __init__(self, master, game_stats=None):
+        """Initialise le menu principal (game_stats : stockage des statistiques partagé par les écrans)"""
         self.master = master
         self.master.title("Bataille Navale - Menu Principal")
         self.difficulty = "moyen"
-        self.game_stats = GameStats()
+        self.game_stats = game_stats if game_stats is not None else open_game_stats()
         
         # Configuration de la fenêtre principale
         self.master.geometry("800x600")
@@ -50,7 +52,8 @@ class MainMenu:
             font=("Arial", 12)
         ).pack()
         
-        # Liste déroulante pour la difficulté
+        # Liste déroulante pour la difficulté ('expert' n'y figure pas tant que
+        # python -m benchmarks.strength ne la montre pas plus forte que 'difficile')
         self.difficulty_var = tk.StringVar(value="moyen")
         difficulty_combo = ttk.Combobox(
             difficulty_frame,
@@ -72,6 +75,16 @@ class MainMenu:
         )
         start_button.pack(pady=20)
         
+        # Bouton rejeu d'une partie enregistrée
+        replay_button = tk.Button(
+            left_frame,
+            text="Revoir une partie",
+            command=self.open_replay,
+            font=("Arial", 12),
+            width=15
+        )
+        replay_button.pack(pady=10)
+        
         # Bouton quitter
         quit_button = tk.Button(
             left_frame,
@@ -137,11 +150,11 @@ class MainMenu:
         for item in self.stats_tree.get_children():
             self.stats_tree.delete(item)
         
-        # Charger les statistiques
-        stats = self.game_stats.stats_history
+        # Charger les 10 dernières parties (seule la fin du fichier est lue)
+        stats = self.game_stats.recent_games(10)
         
         # Ajouter les 10 dernières parties
-        for game in reversed(stats[-10:]):
+        for game in reversed(stats):
             duration = f"{game['duration'] // 60}:{game['duration'] % 60:02d}"
             self.stats_tree.insert("", "end", values=(
                 game['difficulty'],
@@ -219,4 +232,22 @@ class MainMenu:
     def start_game(self):
         """Démarre une nouvelle partie"""
         self.main_frame.destroy()
-        GameWindow(self.master, self.difficulty)
+        GameWindow(self.master, self.difficulty, game_stats=self.game_stats)
+    
+    def open_replay(self):
+        """Choisit un journal de partie et le rejoue pas à pas"""
+        path = filedialog.askopenfilename(
+            title="Revoir une partie",
+            initialdir=GameWindow.REPLAY_DIR if os.path.isdir(GameWindow.REPLAY_DIR) else None,
+            filetypes=[("Journal de partie", "*.jsonl"), ("Tous les fichiers", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.main_frame.pack_forget()
+            ReplayWindow(self.master, path, self.game_stats)
+        except (OSError, ValueError, KeyError) as error:
+            self.main_frame.pack(expand=True, fill="both", padx=20, pady=20)
+            messagebox.showerror("Rejeu impossible", str(error))
+            return
+        self.main_frame.destroy()
@@ -0,0 +1,93 @@
+import time
+import tkinter as tk
+from ..game.profiling import instrument_game
+from .board_view import BoardView
+from .game_window import GameWindow
+
+# Méthodes de l'interface mesurées par instrument_interface : (classe, noms, catégorie)
+UI_HOOKS = (
+    (GameWindow, ("cell_clicked", "apply_ai_move", "draw_hit_marker", "draw_miss_marker",
+                  "reveal_sunk_ship", "update_stats"), "ui"),
+    (BoardView, ("flush",), "ui"),
+)
+
+
+def instrument_interface(profiler):
+    """Instrumente le moteur et les étapes de l'interface (voir UI_HOOKS)"""
+    instrument_game(profiler)
+    for owner, names, category in UI_HOOKS:
+        profiler.instrument(owner, names, category)
+
+
+class ProfilerOverlay:
+    """
+    Affiche en surimpression les durées des étapes instrumentées.
+
+    Le tableau porte sur les WINDOW dernières secondes et est rafraîchi
+    toutes les REFRESH_MS millisecondes. Le retard de la boucle Tk (écart
+    entre l'échéance d'un after et son exécution) est mesuré à chaque
+    rafraîchissement et enregistré comme l'étape 'tk.loop_lag' : un retard
+    élevé sans étape lente désigne le rendu de Tk lui-même.
+
+    F12 masque ou affiche le tableau ; F11 écrit la trace au format Chrome
+    dans trace_file.
+    """
+
+    REFRESH_MS = 500
+    WINDOW = 10  # Durée couverte par le tableau (s)
+    ROWS = 12
+
+    def __init__(self, master, profiler, trace_file="trace.json"):
+        """Crée le tableau dans un coin de la fenêtre et lance les rafraîchissements"""
+        self.master = master
+        self.profiler = profiler
+        self.trace_file = trace_file
+        self.visible = True
+        self.label = tk.Label(
+            master,
+            text="",
+            font=('Courier', 9),
+            justify=tk.LEFT,
+            anchor='nw',
+            bg='black',
+            fg='lime'
+        )
+        self.label.place(relx=1.0, rely=0.0, anchor='ne')
+        self.master.bind_all('<F12>', lambda e: self.toggle())
+        self.master.bind_all('<F11>', lambda e: self.dump())
+        self._expected = time.perf_counter() + self.REFRESH_MS / 1000
+        self.master.after(self.REFRESH_MS, self.refresh)
+
+    def refresh(self):
+        """Mesure le retard de la boucle Tk et met à jour le tableau"""
+        now = time.perf_counter()
+        self.profiler.record("tk.loop_lag", "ui", self._expected, max(0.0, now - self._expected))
+        if self.visible:
+            self.label.config(text=self.format_summary(self.profiler.summary(now - self.WINDOW)))
+            self.label.lift()  # Rester au-dessus des écrans créés ensuite
+        self._expected = time.perf_counter() + self.REFRESH_MS / 1000
+        self.master.after(self.REFRESH_MS, self.refresh)
+
+    def format_summary(self, summary):
+        """Met en forme les étapes les plus coûteuses, une par ligne"""
+        lines = [f"{'étape':28} {'n':>5} {'moy':>7} {'p95':>7} {'max':>7} ms"]
+        ranked = sorted(summary.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+        for name, entry in ranked[:self.ROWS]:
+            lines.append(f"{name[-28:]:28} {entry['count']:>5} {entry['mean_ms']:>7.2f} "
+                         f"{entry['p95_ms']:>7.2f} {entry['max_ms']:>7.2f}")
+        return "\n".join(lines)
+
+    def toggle(self):
+        """Masque ou affiche le tableau"""
+        self.visible = not self.visible
+        if self.visible:
+            self.label.place(relx=1.0, rely=0.0, anchor='ne')
+            self.label.lift()
+        else:
+            self.label.place_forget()
+
+    def dump(self):
+        """Écrit la trace des étapes enregistrées"""
+        self.profiler.write_chrome_trace(self.trace_file)
+        if self.visible:
+            self.label.config(text=f"Trace écrite dans {self.trace_file}")
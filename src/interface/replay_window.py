@@ -0,0 +1,162 @@
+import tkinter as tk
+from ..game.match import Match
+from ..game.replay import build_boards, read_log
+from .board_view import BoardView
+
+
+class ReplayWindow:
+    """
+    Rejoue pas à pas une partie enregistrée.
+
+    Les deux flottes sont visibles ; chaque pas applique le tir suivant du
+    journal au moteur de partie, puis l'affiche. La lecture automatique
+    enchaîne les pas avec master.after.
+    """
+
+    PLAY_DELAY = 300  # Délai entre deux tirs en lecture automatique (ms)
+
+    def __init__(self, master, path, game_stats=None):
+        """Charge le journal et affiche la partie avant le premier tir"""
+        self.master = master
+        self.game_stats = game_stats  # Rendu au menu principal
+        self.master.title("Bataille Navale - Rejeu")
+        self.log = read_log(path)
+        build_boards(self.log)  # Valider le journal avant de créer l'interface
+        self.board_size = self.log['start']['board_size']
+        self.cell_size = min(40, max(8, 400 // self.board_size))
+        self.playing = False
+        self._play_id = None
+        self.setup_ui()
+        self.reset()
+
+    def setup_ui(self):
+        """Crée les plateaux et les boutons de contrôle"""
+        self.container = tk.Frame(self.master)
+        self.container.pack(expand=True, fill='both')
+
+        top_frame = tk.Frame(self.container)
+        top_frame.pack(pady=10)
+        tk.Button(
+            top_frame,
+            text="Menu Principal",
+            command=self.return_to_main_menu,
+            font=('Arial', 10),
+            bg='navy',
+            fg='white'
+        ).pack(side=tk.LEFT, padx=10)
+
+        start = self.log['start']
+        players = " contre ".join(start['players'])
+        tk.Label(
+            top_frame,
+            text=f"{players} (graine {start['seed']})",
+            font=('Arial', 12)
+        ).pack(side=tk.LEFT, padx=20)
+
+        self.message_label = tk.Label(self.container, text="", font=('Arial', 12))
+        self.message_label.pack(pady=5)
+
+        grids_frame = tk.Frame(self.container)
+        grids_frame.pack(pady=10)
+        self.views = []
+        for side in (0, 1):
+            frame = tk.Frame(grids_frame)
+            frame.pack(side=tk.LEFT, padx=20)
+            tk.Label(frame, text=f"Flotte de {start['players'][side]}", font=('Arial', 12, 'bold')).pack()
+            view = BoardView(frame, self.board_size, self.cell_size)
+            view.pack()
+            self.views.append(view)
+
+        buttons_frame = tk.Frame(self.container)
+        buttons_frame.pack(pady=10)
+        tk.Button(buttons_frame, text="Début", command=self.reset, font=('Arial', 12)).pack(side=tk.LEFT, padx=5)
+        tk.Button(buttons_frame, text="Tir suivant", command=self.step, font=('Arial', 12)).pack(side=tk.LEFT, padx=5)
+        self.play_button = tk.Button(buttons_frame, text="Lecture", command=self.toggle_play, font=('Arial', 12))
+        self.play_button.pack(side=tk.LEFT, padx=5)
+
+    def reset(self):
+        """Revient à l'état de la partie avant le premier tir"""
+        self.pause()
+        self.boards = build_boards(self.log)
+        self.match = Match(self.boards, [None, None])
+        self.position = 0
+        for board, view in zip(self.boards, self.views):
+            for y in range(self.board_size):
+                for x in range(self.board_size):
+                    color = 'gray' if board.get_cell_state(x, y) == 'ship' else 'white'
+                    view.set_color(x, y, color)
+                    view.clear_marker(x, y)
+        self.update_message()
+
+    def step(self):
+        """Applique et affiche le tir suivant du journal"""
+        shots = self.log['shots']
+        if self.position >= len(shots):
+            self.pause()
+            return False
+        shot = shots[self.position]
+        self.position += 1
+        side, x, y = shot['side'], shot['x'], shot['y']
+        outcome = self.match.fire(side, x, y)
+        view = self.views[1 - side]
+        if outcome['result'] is not None:
+            if outcome['result']:
+                view.show_hit(x, y)
+            else:
+                view.show_miss(x, y)
+        if outcome['sunk']:
+            sx, sy, horizontal = outcome['sunk'].position
+            for i in range(outcome['sunk'].size):
+                view.set_color(sx + i if horizontal else sx, sy if horizontal else sy + i, 'darkred')
+        self.update_message(shot, outcome)
+        return True
+
+    def update_message(self, shot=None, outcome=None):
+        """Décrit le dernier tir rejoué"""
+        total = len(self.log['shots'])
+        if shot is None:
+            self.message_label.config(text=f"Tir 0 / {total}")
+            return
+        player = self.log['start']['players'][shot['side']]
+        if outcome['result'] is None:
+            result = "case déjà ciblée"
+        elif outcome['sunk']:
+            result = f"coulé ({outcome['sunk'].name})"
+        else:
+            result = "touché" if outcome['result'] else "manqué"
+        timing = f" - {shot['ms']:.0f} ms" if 'ms' in shot else ""
+        text = f"Tir {self.position} / {total} : {player} en ({shot['x']}, {shot['y']}), {result}{timing}"
+        if outcome['game_over']:
+            text += f"\nVictoire de {player}"
+        self.message_label.config(text=text)
+
+    def toggle_play(self):
+        """Démarre ou interrompt la lecture automatique"""
+        if self.playing:
+            self.pause()
+        else:
+            self.playing = True
+            self.play_button.config(text="Pause")
+            self._play_next()
+
+    def _play_next(self):
+        """Joue un tir puis programme le suivant"""
+        self._play_id = None
+        if self.playing and self.step():
+            self._play_id = self.master.after(self.PLAY_DELAY, self._play_next)
+
+    def pause(self):
+        """Interrompt la lecture automatique"""
+        self.playing = False
+        if self._play_id is not None:
+            self.master.after_cancel(self._play_id)
+            self._play_id = None
+        self.play_button.config(text="Lecture")
+
+    def return_to_main_menu(self):
+        """Ferme le rejeu et revient au menu principal"""
+        self.pause()
+        self.container.destroy()
+        self.master.title("Bataille Navale - Menu Principal")
+        from .mainmenu import MainMenu
+        MainMenu(self.master, self.game_stats)
@@ -0,0 +1,195 @@
+"""
+Client de test de charge du serveur de parties.
+
+Chaque connexion ouvre plusieurs sessions et les fait jouer à tour de
+rôle, un tir aléatoire à la fois, jusqu'à la fin de chaque partie : le
+nombre de sessions simultanées vaut connections x sessions. Les latences
+sont mesurées requête par requête, côté client.
+
+Exemples :
+    python -m src.server.match_server &
+    python -m src.server.load_client --connections 100 --sessions 20
+
+    # Serveur lancé dans le même processus, pour un essai rapide
+    python -m src.server.load_client --spawn --connections 10 --sessions 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from .match_server import MatchServer
+
+
+class LoadClient:
+    """
+    Connexion de test : envoie une requête et attend sa réponse.
+
+    Attributes:
+        latencies (list): Durée de chaque requête, en secondes
+        errors (dict): Nombre d'erreurs par code
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.latencies = []
+        self.errors = {}
+
+    async def request(self, **request):
+        """Envoie une requête et retourne sa réponse décodée"""
+        start = time.perf_counter()
+        self.writer.write((json.dumps(request, separators=(',', ':')) + "\n").encode('utf-8'))
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Connexion fermée par le serveur")
+        self.latencies.append(time.perf_counter() - start)
+        response = json.loads(line)
+        if not response['ok']:
+            self.errors[response['error']] = self.errors.get(response['error'], 0) + 1
+        return response
+
+
+async def run_connection(connect, sessions, difficulty, rng, progress):
+    """
+    Joue sessions parties simultanées sur une connexion.
+
+    Args:
+        connect (callable): Coroutine qui ouvre une connexion (reader, writer)
+        sessions (int): Nombre de parties menées en parallèle
+        difficulty (str): Difficulté de l'IA adverse
+        rng (random.Random): Générateur des tirs
+        progress (dict): Compteurs partagés ('active', 'peak', 'games')
+
+    Returns:
+        LoadClient: Le client, avec ses mesures
+    """
+    reader, writer = await connect()
+    client = LoadClient(reader, writer)
+    games = []
+    try:
+        for _ in range(sessions):
+            response = await client.request(op='new', difficulty=difficulty, seed=rng.getrandbits(32))
+            if not response['ok']:
+                continue
+            size = response['board_size']
+            cells = [(x, y) for y in range(size) for x in range(size)]
+            rng.shuffle(cells)
+            games.append((response['session'], cells))
+            progress['active'] += 1
+            progress['peak'] = max(progress['peak'], progress['active'])
+        while games:
+            remaining = []
+            for session, cells in games:
+                x, y = cells.pop()
+                response = await client.request(op='fire', session=session, x=x, y=y)
+                finished = not response['ok'] or response['game_over'] or \
+                    response.get('ai_move', {}).get('game_over') or not cells
+                if finished:
+                    await client.request(op='close', session=session)
+                    progress['active'] -= 1
+                    progress['games'] += 1
+                else:
+                    remaining.append((session, cells))
+            games = remaining
+    finally:
+        writer.close()
+    return client
+
+
+def percentile_ms(values, fraction):
+    """Percentile par rang le plus proche, en millisecondes."""
+    if not values:
+        return None
+    return round(values[min(len(values) - 1, int(len(values) * fraction))] * 1000, 3)
+
+
+async def run_load(connect, connections, sessions, difficulty, seed):
+    """
+    Lance toutes les connexions de test et agrège leurs mesures.
+
+    Returns:
+        dict: Débit, latences, erreurs et nombre maximal de sessions simultanées
+    """
+    master = random.Random(seed)
+    progress = {'active': 0, 'peak': 0, 'games': 0}
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        run_connection(connect, sessions, difficulty, random.Random(master.getrandbits(64)), progress)
+        for _ in range(connections)
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for client in results if isinstance(client, LoadClient)
+                       for latency in client.latencies)
+    errors = {}
+    for client in results:
+        if isinstance(client, LoadClient):
+            for code, count in client.errors.items():
+                errors[code] = errors.get(code, 0) + count
+        else:
+            errors[type(client).__name__] = errors.get(type(client).__name__, 0) + 1
+    return {
+        'connections': connections,
+        'peak_sessions': progress['peak'],
+        'games': progress['games'],
+        'requests': len(latencies),
+        'elapsed_s': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1) if elapsed > 0 else None,
+        'p50_ms': percentile_ms(latencies, 0.5),
+        'p99_ms': percentile_ms(latencies, 0.99),
+        'max_ms': percentile_ms(latencies, 1.0),
+        'errors': errors
+    }
+
+
+async def main_async(args):
+    """Lance éventuellement un serveur local, puis le test de charge."""
+    server = None
+    host, port = args.host, args.port
+    if args.spawn:
+        server = MatchServer(max_sessions=args.connections * args.sessions)
+        listener = await server.start(host, 0)
+        port = listener.sockets[0].getsockname()[1]
+
+    if args.unix:
+        async def connect():
+            return await asyncio.open_unix_connection(args.unix)
+    else:
+        async def connect():
+            return await asyncio.open_connection(host, port)
+
+    try:
+        report = await run_load(connect, args.connections, args.sessions, args.difficulty, args.seed)
+        if server is not None:
+            report['server'] = server.handle_request({'op': 'stats'})
+    finally:
+        if server is not None:
+            await server.stop()
+    return report
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Test de charge du serveur de parties")
+    parser.add_argument('--host', default="127.0.0.1", help="Adresse du serveur")
+    parser.add_argument('--port', type=int, default=8765, help="Port du serveur")
+    parser.add_argument('--unix', help="Socket Unix du serveur (à la place de TCP)")
+    parser.add_argument('--connections', type=int, default=50, help="Nombre de connexions")
+    parser.add_argument('--sessions', type=int, default=20, help="Parties simultanées par connexion")
+    parser.add_argument('--difficulty', default="moyen", help="Difficulté de l'IA adverse")
+    parser.add_argument('--seed', type=int, default=0, help="Graine des tirs du client")
+    parser.add_argument('--spawn', action='store_true', help="Lancer le serveur dans ce processus")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,419 @@
+"""
+Serveur asyncio hébergeant des parties joueur contre IA.
+
+Protocole : JSON Lines sur un socket local (TCP ou Unix), une requête par
+ligne et une réponse par ligne, dans l'ordre des requêtes. Un champ 'id'
+présent dans la requête est recopié dans la réponse.
+
+    {"op":"new","difficulty":"difficile","seed":42}
+    -> {"ok":true,"session":"9f2c...","board_size":10,"fleet":[["Porte-avions",5],...],
+        "ships":[[x,y,horizontal],...]}
+    {"op":"fire","session":"9f2c...","x":3,"y":4}
+    -> {"ok":true,"result":true,"sunk":null,"game_over":false,
+        "ai_move":{"x":0,"y":7,"result":false,"sunk":null,"game_over":false}}
+    {"op":"state","session":"9f2c..."}
+    {"op":"close","session":"9f2c..."}
+    {"op":"stats"}
+
+Le client joue le joueur 0 et commence ; sa flotte est placée par le
+serveur (ou fournie dans 'ships', dans l'ordre de 'fleet'). Chaque tir
+valide reçoit immédiatement la riposte de l'IA. Une erreur est signalée
+par {"ok":false,"error":code,"message":texte} ; une erreur imprévue du
+serveur renvoie le code 'erreur_interne' sans fermer la connexion.
+
+Les sessions sont indépendantes des connexions : une partie peut être
+reprise après une reconnexion, jusqu'à ce qu'elle reste inactive plus de
+idle_timeout secondes.
+
+Exemple :
+    python -m src.server.match_server --port 8765
+"""
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+import time
+import traceback
+from collections import OrderedDict
+
+from ..game.ai_player import AIPlayer
+from ..game.board import Board
+from ..game.match import derive_rng, new_match
+from ..game.rules import DEFAULT_RULES
+
+
+class RequestError(Exception):
+    """Requête refusée : code stable pour les clients et message lisible."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class Session:
+    """
+    Partie hébergée par le serveur.
+
+    Attributes:
+        id (str): Identifiant de la session, imprévisible
+        difficulty (str): Difficulté de l'IA
+        seed (int ou str): Graine de la partie
+        match (Match): La partie (joueur 0 : client, joueur 1 : IA)
+        last_active (float): Dernière requête reçue (time.monotonic)
+    """
+
+    __slots__ = ('id', 'difficulty', 'seed', 'match', 'last_active')
+
+    def __init__(self, session_id, difficulty, seed, match):
+        self.id = session_id
+        self.difficulty = difficulty
+        self.seed = seed
+        self.match = match
+        self.last_active = time.monotonic()
+
+
+class MatchServer:
+    """
+    Héberge de nombreuses parties simultanées dans une seule boucle asyncio.
+
+    Les coups des IA sont calculés dans la boucle : ils ne prennent que
+    quelques microsecondes, sauf pour 'expert', dont le budget de réflexion
+    est donc réduit à expert_budget_ms.
+
+    Contrôle de flux : chaque connexion traite ses requêtes une par une et
+    attend que ses réponses soient parties (drain) avant de lire la
+    suivante. Un client qui ne lit pas ses réponses cesse donc d'être lu,
+    et TCP ralentit son envoi ; la mémoire par connexion reste bornée par
+    max_line et les limites du tampon d'écriture. Le nombre de sessions est
+    plafonné par max_sessions (erreur 'serveur_plein' au-delà).
+
+    Les sessions sont rangées de la moins récemment utilisée à la plus
+    récente : l'éviction des sessions inactives ne parcourt que celles qui
+    ont expiré.
+
+    Attributes:
+        rules (GameRules): Règles des parties
+        idle_timeout (float): Inactivité au-delà de laquelle une session est supprimée (s)
+        max_sessions (int): Nombre maximal de sessions simultanées
+        expert_budget_ms (float): Budget de réflexion de l'IA 'expert'
+        max_line (int): Longueur maximale d'une requête, en octets
+        sessions (OrderedDict): Sessions par identifiant, de la moins récemment utilisée
+        counters (dict): Compteurs d'activité (requêtes, erreurs, sessions créées, évincées...)
+    """
+
+    WRITE_HIGH_WATER = 64 * 1024  # Tampon d'écriture au-delà duquel on attend le client
+
+    def __init__(self, rules=None, idle_timeout=300, max_sessions=10_000, expert_budget_ms=5,
+                 max_line=4096, reap_interval=5):
+        """
+        Initialise un serveur sans session.
+
+        Args:
+            rules (GameRules): Règles des parties (10x10 réglementaire par défaut)
+            idle_timeout (float): Inactivité maximale d'une session (s)
+            max_sessions (int): Nombre maximal de sessions simultanées
+            expert_budget_ms (float): Budget de réflexion de l'IA 'expert'
+            max_line (int): Longueur maximale d'une requête, en octets
+            reap_interval (float): Intervalle entre deux évictions (s)
+        """
+        self.rules = rules or DEFAULT_RULES
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.expert_budget_ms = expert_budget_ms
+        self.max_line = max_line
+        self.reap_interval = reap_interval
+        self.sessions = OrderedDict()
+        self.counters = {'connections': 0, 'requests': 0, 'errors': 0, 'created': 0, 'closed': 0, 'evicted': 0}
+        self._connections = {}  # Flux d'écriture -> tâche de la connexion
+        self._server = None
+        self._reaper = None
+        self._handlers = {
+            'new': self._new,
+            'fire': self._fire,
+            'state': self._state,
+            'close': self._close,
+            'stats': self._stats,
+            'ping': lambda request: {}
+        }
+
+    # --- Requêtes (indépendantes du transport) ---
+
+    def handle_request(self, request):
+        """
+        Traite une requête décodée.
+
+        Args:
+            request (dict): La requête ('op' et ses paramètres)
+
+        Returns:
+            dict: La réponse, avec 'ok' et l'éventuel 'id' de la requête
+        """
+        self.counters['requests'] += 1
+        try:
+            if not isinstance(request, dict):
+                raise RequestError('requete_invalide', "La requête doit être un objet JSON")
+            op = request.get('op')
+            handler = self._handlers.get(op) if isinstance(op, str) else None
+            if handler is None:
+                raise RequestError('requete_invalide', f"Opération inconnue : {op!r}")
+            response = handler(request)
+            response['ok'] = True
+        except RequestError as error:
+            self.counters['errors'] += 1
+            response = {'ok': False, 'error': error.code, 'message': str(error)}
+        except Exception:
+            # Une requête imprévue ne doit pas couper la connexion ni les autres sessions
+            self.counters['errors'] += 1
+            traceback.print_exc()
+            response = {'ok': False, 'error': 'erreur_interne', 'message': "Erreur interne du serveur"}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def _session(self, request):
+        """Retrouve la session d'une requête et la marque comme la plus récente"""
+        session_id = request.get('session')
+        session = self.sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            raise RequestError('session_inconnue', "Session inconnue ou expirée")
+        session.last_active = time.monotonic()
+        self.sessions.move_to_end(session.id)
+        return session
+
+    def _new(self, request):
+        """Crée une partie contre l'IA"""
+        if len(self.sessions) >= self.max_sessions:
+            raise RequestError('serveur_plein', f"Nombre maximal de sessions atteint ({self.max_sessions})")
+        difficulty = request.get('difficulty', 'moyen')
+        if difficulty not in AIPlayer.DIFFICULTIES:
+            raise RequestError('requete_invalide', f"Difficulté inconnue : {difficulty!r}")
+        seed = request.get('seed')
+        if seed is None:
+            seed = secrets.randbits(32)
+        elif not isinstance(seed, (int, str)):
+            raise RequestError('requete_invalide', "La graine doit être un entier ou une chaîne")
+
+        ai = AIPlayer(difficulty, self.rules, self.expert_budget_ms, derive_rng(seed, "ai1"))
+        match = new_match([None, ai], self.rules, seed)
+        if request.get('ships') is not None:
+            match.boards[0] = self._board_from(request['ships'])
+
+        session = Session(secrets.token_hex(8), difficulty, seed, match)
+        self.sessions[session.id] = session
+        self.counters['created'] += 1
+        return {
+            'session': session.id,
+            'seed': seed,
+            'board_size': self.rules.board_size,
+            'fleet': [list(entry) for entry in self.rules.fleet],
+            'ships': [list(ship.position) for ship in match.boards[0].ships]
+        }
+
+    def _board_from(self, positions):
+        """Place la flotte fournie par le client ([x, y, horizontal] par navire)"""
+        board = Board(self.rules)
+        ships = self.rules.create_fleet()
+        if not isinstance(positions, list) or len(positions) != len(ships):
+            raise RequestError('flotte_invalide', "Placement de flotte invalide")
+        for ship, position in zip(ships, positions):
+            if (not isinstance(position, list) or len(position) != 3
+                    or type(position[0]) is not int or type(position[1]) is not int
+                    or type(position[2]) is not bool
+                    or not board.place_ship(ship, *position)):
+                raise RequestError('flotte_invalide', f"Placement invalide pour {ship.name} : {position!r}")
+        return board
+
+    def _coordinates(self, request):
+        """Valide les coordonnées d'un tir"""
+        x, y = request.get('x'), request.get('y')
+        size = self.rules.board_size
+        if type(x) is not int or type(y) is not int or not (0 <= x < size and 0 <= y < size):
+            raise RequestError('tir_invalide', f"Coordonnées hors du plateau : {(x, y)}")
+        return x, y
+
+    def _fire(self, request):
+        """Applique le tir du client puis la riposte de l'IA"""
+        session = self._session(request)
+        match = session.match
+        x, y = self._coordinates(request)
+        if match.winner is not None:
+            raise RequestError('partie_terminee', "La partie est terminée")
+        outcome = match.fire(0, x, y)
+        if outcome['result'] is None:
+            raise RequestError('tir_invalide', f"Case déjà ciblée : {(x, y)}")
+        response = self._outcome(outcome)
+        if match.winner is None:
+            (ai_x, ai_y), ai_outcome = match.play_turn()
+            response['ai_move'] = dict(self._outcome(ai_outcome), x=ai_x, y=ai_y)
+        return response
+
+    @staticmethod
+    def _outcome(outcome):
+        """Issue d'un tir au format du protocole"""
+        return {
+            'result': outcome['result'],
+            'sunk': outcome['sunk'].name if outcome['sunk'] else None,
+            'game_over': outcome['game_over']
+        }
+
+    def _state(self, request):
+        """Résume l'état d'une partie"""
+        session = self._session(request)
+        match = session.match
+        return {
+            'session': session.id,
+            'difficulty': session.difficulty,
+            'seed': session.seed,
+            'shots': list(match.shots),
+            'hits': list(match.hits),
+            'sunk': [[ship.name for ship in sunk] for sunk in match.sunk_ships],
+            'winner': match.winner
+        }
+
+    def _close(self, request):
+        """Termine une session"""
+        session = self._session(request)
+        del self.sessions[session.id]
+        self.counters['closed'] += 1
+        return {}
+
+    def _stats(self, request):
+        """Compteurs du serveur"""
+        return dict(self.counters, sessions=len(self.sessions), open_connections=len(self._connections))
+
+    def evict_idle(self, now=None):
+        """
+        Supprime les sessions inactives depuis plus de idle_timeout.
+
+        Args:
+            now (float): Instant de référence (time.monotonic par défaut)
+
+        Returns:
+            int: Nombre de sessions supprimées
+        """
+        deadline = (time.monotonic() if now is None else now) - self.idle_timeout
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if session.last_active > deadline:
+                break
+            del self.sessions[session.id]
+            evicted += 1
+        self.counters['evicted'] += evicted
+        return evicted
+
+    # --- Transport ---
+
+    async def handle_connection(self, reader, writer):
+        """Traite les requêtes d'une connexion, une ligne à la fois"""
+        self.counters['connections'] += 1
+        self._connections[writer] = asyncio.current_task()
+        writer.transport.set_write_buffer_limits(high=self.WRITE_HIGH_WATER)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Ligne plus longue que max_line : le flux ne peut pas être resynchronisé
+                    self.counters['errors'] += 1
+                    writer.write(self._encode({'ok': False, 'error': 'requete_invalide',
+                                               'message': f"Requête de plus de {self.max_line} octets"}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self.counters['requests'] += 1
+                    self.counters['errors'] += 1
+                    response = {'ok': False, 'error': 'requete_invalide', 'message': "JSON invalide"}
+                else:
+                    response = self.handle_request(request)
+                writer.write(self._encode(response))
+                await writer.drain()  # Ne bloque qu'au-delà de WRITE_HIGH_WATER
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    def _encode(response):
+        """Sérialise une réponse sur une ligne"""
+        return (json.dumps(response, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+
+    async def _reap(self):
+        """Évince périodiquement les sessions inactives"""
+        while True:
+            await asyncio.sleep(self.reap_interval)
+            self.evict_idle()
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Ouvre le socket d'écoute et lance l'éviction périodique.
+
+        Args:
+            host (str): Adresse d'écoute TCP
+            port (int): Port TCP (0 pour un port libre)
+            path (str): Chemin d'un socket Unix, utilisé à la place de TCP
+
+        Returns:
+            asyncio.Server: Le serveur ouvert
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_connection, path, limit=self.max_line)
+        else:
+            self._server = await asyncio.start_server(self.handle_connection, host, port, limit=self.max_line)
+        self._reaper = asyncio.get_running_loop().create_task(self._reap())
+        return self._server
+
+    async def stop(self):
+        """Ferme le socket d'écoute et les connexions ouvertes"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        if self._server is not None:
+            self._server.close()
+            tasks = list(self._connections.values())
+            for writer in list(self._connections):
+                writer.close()  # Les connexions lisent alors une fin de flux et se terminent
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+
+async def serve(server, host, port, path):
+    """Lance le serveur jusqu'à son interruption."""
+    listener = await server.start(host, port, path)
+    where = path or ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    print(f"Serveur de parties à l'écoute sur {where}", file=sys.stderr)
+    try:
+        await listener.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv=None):
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description="Serveur de parties de bataille navale (JSON Lines)")
+    parser.add_argument('--host', default="127.0.0.1", help="Adresse d'écoute")
+    parser.add_argument('--port', type=int, default=8765, help="Port TCP")
+    parser.add_argument('--unix', help="Écouter sur ce socket Unix plutôt qu'en TCP")
+    parser.add_argument('--idle-timeout', type=float, default=300, help="Inactivité maximale d'une session (s)")
+    parser.add_argument('--max-sessions', type=int, default=10_000, help="Nombre maximal de sessions")
+    parser.add_argument('--expert-budget-ms', type=float, default=5, help="Budget de réflexion de l'IA 'expert'")
+    args = parser.parse_args(argv)
+
+    server = MatchServer(idle_timeout=args.idle_timeout, max_sessions=args.max_sessions,
+                         expert_budget_ms=args.expert_budget_ms)
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()